@@ -1,20 +1,25 @@
 import heapq
+import sys
 from itertools import takewhile
 
 
-def read_data():
-    with open('input.txt') as f:
+def read_data(input_file):
+    with open(input_file) as f:
         while items := list(map(int, takewhile(lambda line: line != '\n', f))):
             yield items
 
 
-def max_sum():
-    return max(map(sum, read_data()))
+def read_input(input_file):
+    return list(read_data(input_file))
 
 
-def sum_top3_sum():
+def max_sum(elves):
+    return max(map(sum, elves))
+
+
+def sum_top3_sum(elves):
     heap = []
-    for s in map(sum, read_data()):
+    for s in map(sum, elves):
         if len(heap) < 3:
             heapq.heappush(heap, s)
         else:
@@ -22,10 +27,17 @@ def sum_top3_sum():
     return sum(heap)
 
 
+def part_1(elves):
+    return max_sum(elves)
+
+
+def part_2(elves):
+    return sum_top3_sum(elves)
+
+
 def main():
-    part1 = max_sum()
-    part2 = sum_top3_sum()
-    print(f'part1: {part1}\npart2: {part2}')
+    elves = read_input(sys.argv[1])
+    print(f'part1: {part_1(elves)}\npart2: {part_2(elves)}')
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import sys
 from itertools import starmap
 
 # Translating letters to numbers, so that we can use array indexing
@@ -10,8 +11,8 @@ VAL = 1, 2, 3
 DECIDE = (2, 0, 1), (0, 1, 2), (1, 2, 0)
 
 
-def read_data():
-    with open('input.txt') as f:
+def read_data(input_file):
+    with open(input_file) as f:
         for line in f:
             opponent, player = line.rstrip('\n').split(' ')
             yield MAP[player], MAP[opponent]
@@ -26,14 +27,25 @@ def match_score2(player, opponent):
     return match_score1(player, opponent)
 
 
-def total_score(score_fn):
-    return sum(starmap(score_fn, read_data()))
+def read_input(input_file):
+    return list(read_data(input_file))
+
+
+def total_score(rounds, score_fn):
+    return sum(starmap(score_fn, rounds))
+
+
+def part_1(rounds):
+    return total_score(rounds, match_score1)
+
+
+def part_2(rounds):
+    return total_score(rounds, match_score2)
 
 
 def main():
-    part1 = total_score(match_score1)
-    part2 = total_score(match_score2)
-    print(f'part1: {part1}\npart2: {part2}')
+    rounds = read_input(sys.argv[1])
+    print(f'part1: {part_1(rounds)}\npart2: {part_2(rounds)}')
 
 
 if __name__ == '__main__':
@@ -1,14 +1,19 @@
+import sys
 from itertools import islice
 
 PRIORITY = {c: i for i, c in enumerate('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', 1)}
 
 
-def read_data():
-    with open('input.txt') as f:
+def read_data(input_file):
+    with open(input_file) as f:
         for line in f:
             yield line.rstrip('\n')
 
 
+def read_input(input_file):
+    return list(read_data(input_file))
+
+
 def batch_data(it):
     while batch := tuple(islice(it, 3)):
         yield batch
@@ -32,10 +37,17 @@ def priority_sum(items):
     return sum(map(PRIORITY.__getitem__, items))
 
 
+def part_1(rucksacks):
+    return priority_sum(map(common_item_1, rucksacks))
+
+
+def part_2(rucksacks):
+    return priority_sum(map(common_item_2, batch_data(iter(rucksacks))))
+
+
 def main():
-    part1 = priority_sum(map(common_item_1, read_data()))
-    part2 = priority_sum(map(common_item_2, batch_data(read_data())))
-    print(f'part1: {part1}\npart2: {part2}')
+    rucksacks = read_input(sys.argv[1])
+    print(f'part1: {part_1(rucksacks)}\npart2: {part_2(rucksacks)}')
 
 
 if __name__ == '__main__':
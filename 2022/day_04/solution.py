@@ -1,14 +1,19 @@
 import re
+import sys
 
 
-def read_data():
+def read_data(input_file):
     pattern = re.compile(r'(\d+)-(\d+),(\d+)-(\d+)\n')
-    with open('input.txt') as f:
+    with open(input_file) as f:
         for line in f:
             match = pattern.match(line)
             yield tuple(map(int, match.groups()))
 
 
+def read_input(input_file):
+    return list(read_data(input_file))
+
+
 def is_nested(t):
     return (t[0] <= t[2] and t[3] <= t[1]) or (t[2] <= t[0] and t[1] <= t[3])
 
@@ -17,10 +22,17 @@ def is_overlapped(t):
     return max(t[0], t[2]) <= min(t[1], t[3])
 
 
+def part_1(assignments):
+    return sum(map(is_nested, assignments))
+
+
+def part_2(assignments):
+    return sum(map(is_overlapped, assignments))
+
+
 def main():
-    part1 = sum(map(is_nested, read_data()))
-    part2 = sum(map(is_overlapped, read_data()))
-    print(f'part1: {part1}\npart2: {part2}')
+    assignments = read_input(sys.argv[1])
+    print(f'part1: {part_1(assignments)}\npart2: {part_2(assignments)}')
 
 
 if __name__ == '__main__':
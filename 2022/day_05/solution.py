@@ -1,4 +1,5 @@
 import re
+import sys
 from itertools import takewhile
 from typing import Generator
 
@@ -48,20 +49,31 @@ class MultiStack:
         return [stack[-1] for stack in self.stacks]
 
 
-def move_all(input_file, move_fn_name):
-    multistack = MultiStack(read_stacks(input_file))
+def read_input(input_file: str) -> tuple[list[list[str]], list[tuple[int, int, int]]]:
+    return read_stacks(input_file), list(read_moves(input_file))
+
+
+def move_all(stacks: list[list[str]], moves: list[tuple[int, int, int]], move_fn_name: str) -> str:
+    multistack = MultiStack([stack.copy() for stack in stacks])
     move = getattr(multistack, move_fn_name)
 
-    for num, source, target in read_moves(input_file):
+    for num, source, target in moves:
         move(num, source - 1, target - 1)
 
     return ''.join(multistack.peek())
 
 
+def part_1(stacks_and_moves: tuple[list[list[str]], list[tuple[int, int, int]]]) -> str:
+    return move_all(*stacks_and_moves, 'move_1')
+
+
+def part_2(stacks_and_moves: tuple[list[list[str]], list[tuple[int, int, int]]]) -> str:
+    return move_all(*stacks_and_moves, 'move_2')
+
+
 def main():
-    part1 = move_all('input.txt', 'move_1')
-    part2 = move_all('input.txt', 'move_2')
-    print(f"part1: {part1}\npart2: {part2}")
+    stacks_and_moves = read_input(sys.argv[1])
+    print(f"part1: {part_1(stacks_and_moves)}\npart2: {part_2(stacks_and_moves)}")
 
 
 if __name__ == '__main__':
@@ -1,10 +1,14 @@
+import sys
 from collections import deque
 
+from aoc.reader import iter_lines, mapped
 
-def read_data(input_file):
-    with open(input_file) as f:
-        while (c := f.read(1)) != '\n':
-            yield c
+
+def read_input(input_file):
+    # The signal is scanned in place through a memory map, one byte at a time,
+    # so it never has to be copied into memory. Each part maps the file for as
+    # long as it scans it.
+    return input_file
 
 
 def first_n_unique(iterable, n):
@@ -28,10 +32,23 @@ def first_n_unique(iterable, n):
             counter.pop(left)
 
 
+def first_n_unique_in_file(input_file, n):
+    with mapped(input_file) as data:
+        for signal in iter_lines(data):
+            return first_n_unique(signal, n)
+
+
+def part_1(input_file):
+    return first_n_unique_in_file(input_file, 4)
+
+
+def part_2(input_file):
+    return first_n_unique_in_file(input_file, 14)
+
+
 def main():
-    part1 = first_n_unique(read_data('input.txt'), 4)
-    part2 = first_n_unique(read_data('input.txt'), 14)
-    print(f"part1: {part1}\npart2: {part2}")
+    input_file = read_input(sys.argv[1])
+    print(f"part1: {part_1(input_file)}\npart2: {part_2(input_file)}")
 
 
 if __name__ == '__main__':
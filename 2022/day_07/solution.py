@@ -1,3 +1,4 @@
+import sys
 from functools import reduce
 from typing import Iterable, Optional
 
@@ -32,6 +33,10 @@ def read_data(input_file):
             yield line.rstrip('\n')
 
 
+def read_input(input_file: str) -> TreeNode:
+    return parse_tree(read_data(input_file))
+
+
 def parse_tree(lines: Iterable[str]) -> TreeNode:
 
     lines = iter(lines)
@@ -77,12 +82,20 @@ def min_deletion(node: TreeNode, space_to_free: int) -> tuple[int, int]:
     return s, s if space_to_free < s < t else t
 
 
-def main() -> None:
-    root = parse_tree(read_data('input.txt'))
-    total, part1 = bottom_up_sum(root)
-    _, part2 = min_deletion(root, total - (70_000_000 - 30_000_000))
+def part_1(root: TreeNode) -> int:
+    _, small_dirs_sum = bottom_up_sum(root)
+    return small_dirs_sum
+
 
-    print(f'part1: {part1}\npart2: {part2}')
+def part_2(root: TreeNode) -> int:
+    total, _ = bottom_up_sum(root)
+    _, deleted = min_deletion(root, total - (70_000_000 - 30_000_000))
+    return deleted
+
+
+def main() -> None:
+    root = read_input(sys.argv[1])
+    print(f'part1: {part_1(root)}\npart2: {part_2(root)}')
 
 
 if __name__ == '__main__':
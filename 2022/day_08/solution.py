@@ -1,101 +1,101 @@
-def read_data(input_file):
-    with open(input_file) as f:
-        return [list(map(int, line)) for line in f.read().splitlines()]
-
-
-def iter_rows(m, n):
-    for i in range(m):
-        yield ((i, j) for j in range(n))
-
-
-def iter_cols(m, n):
-    for j in range(n):
-        yield ((i, j) for i in range(m))
-
-
-def iter_rows_reversed(m, n):
-    for i in range(m):
-        yield ((i, j) for j in reversed(range(n)))
-
-
-def iter_cols_reversed(m, n):
-    for j in range(n):
-        yield ((i, j) for i in reversed(range(m)))
-
-
-def part1(array):
-    m, n = len(array), len(array[0])
-    visible = [[False for _ in range(n)] for _ in range(m)]
-
-    for gen in iter_rows(m, n), iter_cols(m, n), iter_rows_reversed(m, n), iter_cols_reversed(m, n):
-        for indices in gen:
-            max_so_far = float('-Infinity')
-            for i, j in indices:
-                if array[i][j] > max_so_far:
-                    max_so_far = array[i][j]
-                    visible[i][j] = True
-
-    return sum(map(sum, visible))
-
-
-def part2(array):
-    m, n = len(array), len(array[0])
-    dists = [[1 for _ in range(n)] for _ in range(m)]
-
-    for row in iter_rows(m, n):
-
-        stack = []
-
-        for i, j in row:
-
-            while stack and stack[-1][0] < array[i][j]:
-                stack.pop()
-
-            dists[i][j] *= (j - stack[-1][1]) if stack else j
-            stack.append((array[i][j], j))
-
-    for col in iter_cols(m, n):
-
-        stack = []
-
-        for i, j in col:
-
-            while stack and stack[-1][0] < array[i][j]:
-                stack.pop()
-
-            dists[i][j] *= (i - stack[-1][1]) if stack else i
-            stack.append((array[i][j], i))
-
-    for reversed_row in iter_rows_reversed(m, n):
-
-        stack = []
-
-        for i, j in reversed_row:
-
-            while stack and stack[-1][0] < array[i][j]:
-                stack.pop()
-
-            dists[i][j] *= (stack[-1][1] - j) if stack else n - 1 - j
-            stack.append((array[i][j], j))
-
-    for reversed_col in iter_cols_reversed(m, n):
-
-        stack = []
-
-        for i, j in reversed_col:
-
-            while stack and stack[-1][0] < array[i][j]:
-                stack.pop()
-
-            dists[i][j] *= (stack[-1][1] - i) if stack else m - 1 - i
-            stack.append((array[i][j], i))
-
-    return max(map(max, dists))
+import sys
+
+import numpy as np
+
+from aoc.grid import Grid
+
+# Views of a grid in which each of the four directions becomes looking left,
+# towards the start of the rows. The same view of an output grid writes the
+# results back in place.
+DIRECTIONS = (
+    lambda a: a,
+    lambda a: a[:, ::-1],
+    lambda a: a.T,
+    lambda a: a[::-1].T,
+)
+# Rows are scanned in blocks of this many trees, so that positions within a block
+# fit in a byte, which NumPy scans several times faster than wider ints.
+BLOCK = 255
+
+
+def read_input(input_file):
+    return Grid.read(input_file).array() - ord('0')
+
+
+def mark_visible(heights, visible):
+    """Marks the trees that are taller than every tree before them in their row."""
+    tallest = np.maximum.accumulate(heights, axis=1)
+    visible[:, 0] = True
+    visible[:, 1:] |= heights[:, 1:] > tallest[:, :-1]
+
+
+def viewing_distances(heights):
+    """How far each tree sees towards the start of its row: up to the first tree
+    that is at least as tall, or to the edge.
+
+    There are only ten heights. For each, a running maximum over the positions of
+    the trees at least that tall finds the last one before every tree, and a tree
+    keeps the one of its own height, which is the smallest of those of the
+    heights up to its own. Trees that see past the start of their block look up
+    the last tall enough tree of the blocks before instead.
+    """
+    m, n = heights.shape
+    nblocks = -(-n // BLOCK)
+    grid = np.zeros((m, nblocks * BLOCK), np.uint8)
+    grid[:, :n] = heights
+    grid = grid.reshape(m, nblocks, BLOCK)
+    local = np.arange(1, BLOCK + 1, dtype=np.uint8)
+    starts = np.arange(nblocks) * BLOCK
+
+    # The position in its block, from 1, of the last tree before each tree that
+    # is at least as tall, or 0 if there is none in the block. Every tree is at
+    # least as tall as those of height 0.
+    nearest = np.empty(grid.shape, np.uint8)
+    nearest[...] = local - 1
+    # For each height, the last tree at least that tall before each block, or -1.
+    before = np.empty((10, m, nblocks), np.int64)
+    before[0] = starts - 1
+    tall = np.empty(grid.shape, bool)
+    last = np.empty(grid.shape, np.uint8)
+    candidates = np.empty(grid.shape, np.uint8)
+    for h in range(1, 10):
+        np.greater_equal(grid, h, out=tall)
+        np.multiply(tall, local, out=last)
+        np.maximum.accumulate(last, axis=2, out=last)
+        ends = np.where(last[:, :, -1] > 0, starts + last[:, :, -1] - 1, -1)
+        before[h, :, 0] = -1
+        before[h, :, 1:] = np.maximum.accumulate(ends, axis=1)[:, :-1]
+        # 0 - 1 wraps around to 255, which leaves trees shorter than h alone.
+        np.subtract(tall.view(np.uint8), 1, out=candidates)
+        np.bitwise_or(candidates[:, :, 1:], last[:, :, :-1], out=candidates[:, :, 1:])
+        np.minimum(nearest, candidates, out=nearest)
+
+    distances = local.astype(np.min_scalar_type(n)) - nearest
+    i, b, j = np.unravel_index(np.flatnonzero(nearest == 0), grid.shape)
+    blockers = before[grid[i, b, j], i, b]
+    positions = starts[b] + j
+    distances[i, b, j] = np.where(blockers >= 0, positions - blockers, positions)
+    return distances.reshape(m, -1)[:, :n]
+
+
+def part_1(heights):
+    visible = np.zeros(heights.shape, bool)
+    for view in DIRECTIONS:
+        mark_visible(view(heights), view(visible))
+    return int(visible.sum())
+
+
+def part_2(heights):
+    scores = np.ones(heights.shape, np.int64)
+    for view in DIRECTIONS:
+        view_scores = view(scores)
+        view_scores *= viewing_distances(view(heights))
+    return int(scores.max())
 
 
 def main():
-    a = read_data('input.txt')
-    print(f'part1: {part1(a)}\npart2: {part2(a)}')
+    a = read_input(sys.argv[1])
+    print(f'part1: {part_1(a)}\npart2: {part_2(a)}')
 
 
 if __name__ == '__main__':
@@ -1,3 +1,6 @@
+import sys
+
+
 def read_data(input_file):
     dirmap = {'L': (0, -1), 'R': (0, 1), 'U': (1, 0), 'D': (-1, 0)}
     with open(input_file) as f:
@@ -6,6 +9,10 @@ def read_data(input_file):
             yield dirmap[direction], int(n_steps)
 
 
+def read_input(input_file):
+    return list(read_data(input_file))
+
+
 def add(u, v):
     return u[0] + v[0], u[1] + v[1]
 
@@ -50,10 +57,17 @@ def simulate(data, n_knots):
     return len(visited)
 
 
+def part_1(motions):
+    return simulate(motions, 2)
+
+
+def part_2(motions):
+    return simulate(motions, 10)
+
+
 def main():
-    part1 = simulate(read_data('input.txt'), 2)
-    part2 = simulate(read_data('input.txt'), 10)
-    print(f'part1: {part1}\npart2: {part2}')
+    motions = read_input(sys.argv[1])
+    print(f'part1: {part_1(motions)}\npart2: {part_2(motions)}')
 
 
 if __name__ == '__main__':
@@ -1,4 +1,7 @@
 # %%
+import sys
+
+
 def read_data(input_file):
     with open(input_file) as f:
         for line in f:
@@ -8,7 +11,11 @@ def read_data(input_file):
                 yield int(line.split()[1])
 
 
-def part1(vals):
+def read_input(input_file):
+    return list(read_data(input_file))
+
+
+def part_1(vals):
     cycle_start, cycle_end = None, 1
     x = 1
     res = 0
@@ -29,7 +36,7 @@ def part1(vals):
     return res
 
 
-def part2(vals):
+def part_2(vals):
     monitor = ['.'] * 240
     sprite = 0
     cycle_start, cycle_end = None, 0
@@ -52,7 +59,8 @@ def part2(vals):
 
 
 def main():
-    print(f'part1: {part1(read_data("mini.txt"))}\npart2:\n{part2(read_data("input.txt"))}')
+    vals = read_input(sys.argv[1])
+    print(f'part1: {part_1(vals)}\npart2:\n{part_2(vals)}')
 
 
 if __name__ == '__main__':
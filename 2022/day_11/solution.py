@@ -1,25 +1,56 @@
+import operator
+import re
+import sys
 from collections import deque
+from functools import partial
 from heapq import nlargest
 from math import prod
 
+MONKEY = re.compile(
+    r'Monkey (\d+):\s+'
+    r'Starting items: ([\d, ]*)\s+'
+    r'Operation: new = old ([*+]) (old|\d+)\s+'
+    r'Test: divisible by (\d+)\s+'
+    r'If true: throw to monkey (\d+)\s+'
+    r'If false: throw to monkey (\d+)'
+)
+OPERATORS = {'*': operator.mul, '+': operator.add}
 
-class Monkey:
 
-    def __init__(self, spec: str, calm: bool):
+def square(old):
+    return old * old
 
-        self.calm = calm
 
-        spec_lst = spec.splitlines()
+def double(old):
+    return old + old
 
-        self.name = spec_lst[0].rstrip(':')
 
-        self.items = deque(map(int, spec_lst[1].lstrip('Starting items:').split(',')))
+class Spec:
+    __slots__ = ['name', 'items', 'operation', 'divisor', 'monkey_true', 'monkey_false']
 
-        self.operation = eval(f'lambda old: {spec_lst[2].rsplit("=")[1]}')
+    def __init__(self, name, items, op, operand, divisor, monkey_true, monkey_false):
+        self.name = f'Monkey {name}'
+        self.items = tuple(map(int, items.split(',')))
+        if operand == 'old':
+            self.operation = square if op == '*' else double
+        else:
+            self.operation = partial(OPERATORS[op], int(operand))
+        self.divisor = int(divisor)
+        self.monkey_true = int(monkey_true)
+        self.monkey_false = int(monkey_false)
 
-        self.divisor = int(spec_lst[3].lstrip('Test: divisible by '))
-        self._monkey_true = int(spec_lst[4].lstrip('If true: throw to monkey '))
-        self._monkey_false = int(spec_lst[5].lstrip('If false: throw to monkey '))
+
+class Monkey:
+
+    def __init__(self, spec: Spec, calm: bool):
+
+        self.calm = calm
+        self.name = spec.name
+        self.items = deque(spec.items)
+        self.operation = spec.operation
+        self.divisor = spec.divisor
+        self._monkey_true = spec.monkey_true
+        self._monkey_false = spec.monkey_false
 
         self.n_inspects = 0
 
@@ -42,13 +73,18 @@ class Monkey:
         return repr(self.items)
 
 
-def read_data(input_file) -> list[str]:
+def read_input(input_file) -> list[Spec]:
+    specs = []
     with open(input_file) as f:
-        specs = f.read().split('\n\n')
+        for block in f.read().split('\n\n'):
+            m = MONKEY.fullmatch(block.strip())
+            if m is None:
+                raise ValueError(f'invalid monkey: {block!r}')
+            specs.append(Spec(*m.groups()))
     return specs
 
 
-def part1(specs: list[str]) -> int:
+def part_1(specs: list[Spec]) -> int:
     monkeys = [Monkey(spec, True) for spec in specs]
 
     for _ in range(20):
@@ -60,7 +96,7 @@ def part1(specs: list[str]) -> int:
     return prod(nlargest(2, (monkey.n_inspects for monkey in monkeys)))
 
 
-def part2(specs: list[str]) -> int:
+def part_2(specs: list[Spec]) -> int:
     monkeys = [Monkey(spec, False) for spec in specs]
 
     mod = prod(monkey.divisor for monkey in monkeys)
@@ -75,8 +111,8 @@ def part2(specs: list[str]) -> int:
 
 
 def main():
-    specs = read_data('input.txt')
-    print(f'part1: {part1(specs)}\npart2: {part2(specs)}')
+    specs = read_input(sys.argv[1])
+    print(f'part1: {part_1(specs)}\npart2: {part_2(specs)}')
 
 
 if __name__ == '__main__':
@@ -1,71 +1,71 @@
-from collections import deque
-
-
-def read_data(input_file) -> tuple[list[list[str]], tuple[int, int], tuple[int, int]]:
-    with open(input_file) as f:
-        grid_rows = f.read().splitlines()
-
-    flattened = ''.join(grid_rows)
-    n_cols = len(grid_rows[0])
-
-    source = divmod(flattened.index('S'), n_cols)
-    target = divmod(flattened.index('E'), n_cols)
-
-    grid = list(map(list, grid_rows))
-
-    grid[source[0]][source[1]] = 'a'
-    grid[target[0]][target[1]] = 'z'
-
-    return grid, source, target
-
-
-def bfs(grid: list[list[str]], source: tuple[int, int], target: str | tuple[int, int], reverse: bool) -> int:
-
-    directions = (-1, 0), (0, -1), (1, 0), (0, 1)
-    m, n = len(grid), len(grid[0])
-
-    queue = deque([source])
-    visited = set()
-    level = -1
-
-    while queue:
+import sys
+from functools import partial
+
+from aoc.grid import Grid
+from aoc.search import bfs_levels
+
+# Row ends and the rows above and below the map, none of which can be climbed.
+BORDER = ord('\n')
+
+
+def read_input(input_file) -> tuple[Grid, int, int]:
+    grid = Grid.read(input_file)
+    source = grid.cells.index(b'S')
+    target = grid.cells.index(b'E')
+    heights = grid.cells.replace(b'S', b'a').replace(b'E', b'z')
+    return Grid(heights, grid.width), source, target
+
+
+def climbable(
+    heights: bytes, steps: tuple[int, ...], sign: int, seen: bytearray, frontier: list[int]
+) -> list[int]:
+    """The positions not yet seen that can be climbed to from any in `frontier`,
+    which are marked seen."""
+    res = []
+    for cur in frontier:
+        height = heights[cur]
+        for step in steps:
+            neighbor = cur + step
+            if seen[neighbor]:
+                continue
+            h = heights[neighbor]
+            if h != BORDER and (h - height) * sign <= 1:
+                seen[neighbor] = 1
+                res.append(neighbor)
+    return res
 
-        level += 1
 
-        for _ in range(len(queue)):
+def bfs(heightmap: Grid, source: int, target: int | str, reverse: bool) -> int:
+    """Steps from `source` to the `target` position, or to the closest `target` height."""
 
-            cur = queue.popleft()
+    heights = heightmap.cells
+    goal = ord(target) if isinstance(target, str) else -1
+    # Going down the map, the climbs count the other way.
+    sign = -1 if reverse else 1
 
-            if isinstance(target, tuple):
-                if cur == target:
-                    return level
-            else:
-                if grid[cur[0]][cur[1]] == target:
-                    return level
+    seen = bytearray(len(heights))
+    expand = partial(climbable, heights, heightmap.steps, sign, seen)
+    for level, frontier in enumerate(bfs_levels([source], expand, seen)):
+        for cur in frontier:
+            if cur == target or heights[cur] == goal:
+                return level
 
-            if cur in visited:
-                continue
-            visited.add(cur)
+    return -1
 
-            for direction in directions:
-                neighbor = cur[0] + direction[0], cur[1] + direction[1]
-                if 0 <= neighbor[0] < m and 0 <= neighbor[1] < n:
 
-                    diff = ord(grid[neighbor[0]][neighbor[1]]) - ord(grid[cur[0]][cur[1]])
-                    if reverse:
-                        diff *= -1
+def part_1(heightmap: tuple[Grid, int, int]) -> int:
+    grid, source, target = heightmap
+    return bfs(grid, source, target, False)
 
-                    if diff <= 1:
-                        queue.append(neighbor)
 
-    return -1
+def part_2(heightmap: tuple[Grid, int, int]) -> int:
+    grid, _, target = heightmap
+    return bfs(grid, target, 'a', True)
 
 
 def main():
-    grid, source, target = read_data('input.txt')
-    part1 = bfs(grid, source, target, False)
-    part2 = bfs(grid, target, 'a', True)
-    print(f'part1: {part1}\npart2: {part2}')
+    heightmap = read_input(sys.argv[1])
+    print(f'part1: {part_1(heightmap)}\npart2: {part_2(heightmap)}')
 
 
 if __name__ == '__main__':
@@ -1,13 +1,16 @@
-from itertools import chain, takewhile
+import json
+import sys
+from itertools import chain
 from functools import cmp_to_key
 from math import prod
 from bisect import bisect_right
 
 
-def read_data(input_file):
+def read_input(input_file):
+    # The packets are JSON, so one array of all of them is decoded in a single call.
     with open(input_file) as f:
-        while pair := tuple(map(eval, takewhile(lambda line: line != '\n', f))):
-            yield pair
+        packets = json.loads(f'[{",".join(f.read().split())}]')
+    return list(zip(packets[::2], packets[1::2], strict=True))
 
 
 def compare(a, b):
@@ -27,11 +30,11 @@ def compare(a, b):
     return compare(len(a), len(b))
 
 
-def part1(data):
+def part_1(data):
     return sum(i for i, (a, b) in enumerate(data, 1) if compare(a, b) <= 0)
 
 
-def part2(data):
+def part_2(data):
     extras = ([[2]], [[6]])
     data_cat = chain(extras, chain.from_iterable(data))
     key_fn = cmp_to_key(compare)
@@ -40,8 +43,8 @@ def part2(data):
 
 
 def main():
-    input_file = 'input.txt'
-    print(f'part1: {part1(read_data(input_file))}\npart2: {part2(read_data(input_file))}')
+    data = read_input(sys.argv[1])
+    print(f'part1: {part_1(data)}\npart2: {part_2(data)}')
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import sys
 from copy import deepcopy
 from itertools import pairwise
 from typing import Literal
@@ -77,18 +78,21 @@ def num_fallen_till_block(grid: Grid, source: tuple[int, int] = (0, 500)) -> int
     return num_sands
 
 
-def main():
-    import sys
+def part_1(paths: list[list[tuple[int, int]]]) -> int:
+    return num_fallen_till_abyss(make_grid(paths))
+
+
+def part_2(paths: list[list[tuple[int, int]]]) -> int:
+    return num_fallen_till_block(make_grid(paths))
 
+
+def main():
     file_path = sys.argv[1]
     paths = read_input(file_path)
-    grid = make_grid(paths)
     with open("grid.txt", "w") as f:
-        _ = f.write(grid_str(grid))
-    part_1 = num_fallen_till_abyss(grid)
-    print(part_1)
-    part_2 = num_fallen_till_block(grid)
-    print(part_2)
+        _ = f.write(grid_str(make_grid(paths)))
+    print(part_1(paths))
+    print(part_2(paths))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 # See also this amazing solution
 # https://github.com/Fitli/AoC2022/blob/62bef2e643343c4948a8e67d0ca9396ee756d321/15.py
 import re
+import sys
+
+from aoc.intervals import IntervalSet
 
 type Pair = tuple[int, int]
 type Rectangle = tuple[Pair, Pair]
@@ -23,39 +26,25 @@ def l1(u: Pair, v: Pair) -> int:
 
 
 def find_interval(sensor: Pair, beacon: Pair, row: int) -> Pair | None:
+    """The half-open interval of the row that the sensor covers."""
     distance_to_beacon = l1(sensor, beacon)
     distance_to_row = abs(sensor[0] - row)
     center = sensor[1]
     radius = distance_to_beacon - distance_to_row
     if radius >= 0:
-        return (center - radius, center + radius)
+        return (center - radius, center + radius + 1)
     return None
 
 
-def unite_intervals(intervals: list[Pair]) -> list[Pair]:
-    union: list[Pair] = []
-    for a, b in sorted(intervals):
-        if union and union[-1][1] + 1 >= a:
-            union[-1] = (union[-1][0], max(union[-1][1], b))
-        else:
-            union.append((a, b))
-    return union
-
-
 def non_beacon_positions(data: list[tuple[Pair, Pair]], row: int) -> int:
-    intervals = [
+    covered = IntervalSet.from_intervals(
         interval
         for sensor, beacon in data
         if (interval := find_interval(sensor, beacon, row)) is not None
-    ]
-    union = unite_intervals(intervals)
-    coverage = sum(b - a + 1 for a, b in union)
-    beacons = {beacon for _, beacon in data}
-    num_beacon_positions = sum(
-        any(beacon[0] == row and a <= beacon[1] <= b for a, b in intervals)
-        for beacon in beacons
     )
-    return coverage - num_beacon_positions
+    beacons = {beacon for _, beacon in data}
+    num_beacon_positions = sum(beacon[0] == row and beacon[1] in covered for beacon in beacons)
+    return covered.size() - num_beacon_positions
 
 
 def rectangle_is_valid(rectangle: Rectangle) -> bool:
@@ -122,21 +111,24 @@ def find_undetected_beacon(
     return None
 
 
-def main():
-    import sys
+ROW = 2_000_000
+RECTANGLE = ((0, 0), (4_000_000, 4_000_000))
 
-    file_path = sys.argv[1]
-    ROW = 2_000_000
-    RECTANGLE = ((0, 0), (4_000_000, 4_000_000))
-    data = read_input(file_path)
 
-    part_1 = non_beacon_positions(data, ROW)
+def part_1(data: list[tuple[Pair, Pair]]) -> int:
+    return non_beacon_positions(data, ROW)
 
+
+def part_2(data: list[tuple[Pair, Pair]]) -> int:
     undetected_beacon = find_undetected_beacon(data, RECTANGLE)
     assert undetected_beacon is not None
-    part_2 = 4_000_000 * undetected_beacon[1] + undetected_beacon[0]
+    return 4_000_000 * undetected_beacon[1] + undetected_beacon[0]
+
 
-    print(f"{part_1 = } {part_2 = }")
+def main():
+    file_path = sys.argv[1]
+    data = read_input(file_path)
+    print(f"part_1 = {part_1(data)} part_2 = {part_2(data)}")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,28 @@
-import itertools
+import heapq
 import re
+import sys
+from collections import deque
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 type Graph = dict[str, dict[str, int]]
 type Rates = dict[str, int]
-type Dists = dict[tuple[str, str], int | float]
+# dists[i][j] is the minutes from the i-th source to the j-th valve.
+type Dists = list[list[int]]
+# flows[mask] is the most pressure that one agent releases by opening the
+# valves with flow whose bits are set in `mask`, in the order of `Rates`.
+type Flows = npt.NDArray[np.int64]
+type Masks = npt.NDArray[np.int64]
 
-INFINITY = float("infinity")
+# The distance to a valve that cannot be reached, which no time limit allows,
+# and which two of still add up without overflowing.
+UNREACHABLE = 2**31 - 1
+# Subsets of a set of valves are listed this many valves at a time.
+CHUNK = 8
 
 
 def read_input(file_path: str) -> tuple[Graph, Rates]:
@@ -22,79 +39,224 @@ def read_input(file_path: str) -> tuple[Graph, Rates]:
     return graph, rates
 
 
-def floyd_warshall(graph: Graph) -> Dists:
-    vertices = list(graph)
-
-    dists: Dists = {(u, v): INFINITY for u, v in itertools.product(vertices, repeat=2)}
-    for v in vertices:
-        dists[v, v] = 0
-    for u in graph:
-        for v in graph[u]:
-            dists[u, v] = graph[u][v]
+def bfs_distances(graph: Graph, index: dict[str, int], sources: list[str]) -> Dists:
+    neighbours = [[index[v] for v in tunnels] for tunnels in graph.values()]
+    dists: Dists = []
+    for source in sources:
+        dist = [UNREACHABLE] * len(graph)
+        dist[index[source]] = 0
+        queue = deque([index[source]])
+        while queue:
+            u = queue.popleft()
+            for v in neighbours[u]:
+                if dist[v] == UNREACHABLE:
+                    dist[v] = dist[u] + 1
+                    queue.append(v)
+        dists.append(dist)
+    return dists
 
-    for v, u, w in itertools.product(vertices, repeat=3):
-        dists[u, w] = min(dists[u, w], dists[u, v] + dists[v, w])
 
+def dijkstra_distances(graph: Graph, index: dict[str, int], sources: list[str]) -> Dists:
+    tunnels = [[(index[v], length) for v, length in ts.items()] for ts in graph.values()]
+    dists: Dists = []
+    for source in sources:
+        dist = [UNREACHABLE] * len(graph)
+        dist[index[source]] = 0
+        heap = [(0, index[source])]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for v, length in tunnels[u]:
+                if d + length < dist[v]:
+                    dist[v] = d + length
+                    heapq.heappush(heap, (d + length, v))
+        dists.append(dist)
     return dists
 
 
-def find_max_flow(
-    graph: Graph, rates: Rates, source: str, remaining_time: int
-) -> int | float:
-    dists = floyd_warshall(graph)
-    nonzeros = [v for v, r in rates.items() if r > 0]
-    opened: set[str] = set()
-
-    def dfs(u: str, remaining_time: int | float) -> int | float:
-        max_flow = 0
-        for v in nonzeros:
-            t = remaining_time - dists[u, v] - 1
-            if v not in opened and t >= 0:
-                opened.add(v)
-                max_flow = max(max_flow, t * rates[v] + dfs(v, t))
-                opened.remove(v)
-        return max_flow
-
-    return dfs(source, remaining_time)
-
-
-def find_max_flow_with_elephant(
-    graph: Graph, rates: Rates, source: str, remaining_time: int
-) -> int | float:
-    dists = floyd_warshall(graph)
-    nonzeros = [v for v, r in rates.items() if r > 0]
-    opened: set[str] = set()
-    max_flows: dict[frozenset[str], int | float] = {}  # opened_valves: max_flow
-
-    def dfs(u: str, remaining_time: int | float, flow: int | float) -> None:
-        fropened = frozenset(opened)
-        max_flows[fropened] = max(max_flows.get(fropened, 0), flow)
-        for v in nonzeros:
-            t = remaining_time - dists[u, v] - 1
-            if v not in opened and t >= 0:
-                opened.add(v)
-                dfs(v, t, t * rates[v] + flow)
-                opened.remove(v)
-
-    dfs(source, remaining_time, 0)
-    max_flow = max(
-        flow1 + flow2
-        for (fropened1, flow1), (fropened2, flow2) in itertools.product(
-            max_flows.items(), repeat=2
-        )
-        if not fropened1 & fropened2
-    )
-    return max_flow
+def all_pairs_distances(graph: Graph, sources: list[str]) -> Dists:  # trace
+    """The minutes from each of `sources` to every valve, in the order of `graph`.
 
+    Tunnels that all take a minute need one breadth-first search per source,
+    which is all the puzzle ever has, and tunnels of other lengths one run of
+    Dijkstra's algorithm. Only the few valves with flow are ever sources, so
+    either is much cheaper than all pairs of a graph of thousands of valves.
+    """
+    index = {v: i for i, v in enumerate(graph)}
+    if all(length == 1 for tunnels in graph.values() for length in tunnels.values()):
+        return bfs_distances(graph, index, sources)
+    return dijkstra_distances(graph, index, sources)
+
+
+def valve_distances(graph: Graph, rates: Rates, source: str) -> Dists:
+    """The minutes between every two valves with flow, which come first in the
+    order of `rates`, and `source`, which comes last."""
+    valves = [v for v, r in rates.items() if r > 0] + [source]
+    index = {v: i for i, v in enumerate(graph)}
+    columns = [index[v] for v in valves]
+    return [[row[j] for j in columns] for row in all_pairs_distances(graph, valves)]
+
+
+def best_flows(graph: Graph, rates: Rates, source: str, remaining_time: int) -> Flows:
+    """The most pressure one agent releases for every set of opened valves.
+
+    States are (valve, remaining time, opened valves), with the most pressure
+    released on the way there. Every move takes time, so states are expanded
+    from the latest to the earliest, each once, after every way into it is seen.
+    """
+    import numpy as np
+
+    flow_rates = [r for r in rates.values() if r > 0]
+    dists = valve_distances(graph, rates, source)
+    n = len(flow_rates)
+    # The valves that can be opened from each valve, with the minutes that takes,
+    # nearest first.
+    moves = [
+        sorted((d + 1, v, 1 << v, flow_rates[v]) for v, d in enumerate(row[:n]) if d < UNREACHABLE)
+        for row in dists
+    ]
+    flows = [0] * (1 << n)
+    # layers[t][valve, opened] is the pressure released with t minutes left.
+    layers: list[dict[tuple[int, int], int]] = [{} for _ in range(remaining_time + 1)]
+    layers[remaining_time][n, 0] = 0
+    # The most pressure released on reaching each (valve, opened valves) so far,
+    # with at least as much time left as now. Any state that does no better is
+    # worth no more than that one, and is dropped.
+    dominant: dict[tuple[int, int], int] = {}
+    for t in range(remaining_time, 0, -1):
+        for key, flow in layers[t].items():
+            if flow <= dominant.get(key, -1):
+                continue  # trace: prunes
+            dominant[key] = flow
+            u, opened = key
+            if flow > flows[opened]:  # trace: nodes
+                flows[opened] = flow
+            for cost, v, bit, rate in moves[u]:
+                left = t - cost
+                if left <= 0:
+                    break
+                if opened & bit:
+                    continue
+                layer = layers[left]
+                after = v, opened | bit
+                released = flow + left * rate
+                if released > layer.get(after, -1):
+                    layer[after] = released
+    return np.array(flows, dtype=np.int64)
+
+
+def subset_maxima(flows: Flows) -> Flows:
+    """The largest flow of all subsets of each set, by the sum over subsets
+    transform with max instead of sum: one pass per valve, each of which lets the
+    sets with the valve take over the values of the sets without it."""
+    import numpy as np
+
+    maxima = flows.copy()
+    for i in range(len(flows).bit_length() - 1):
+        halves = maxima.reshape(-1, 2, 1 << i)
+        np.maximum(halves[:, 1], halves[:, 0], out=halves[:, 1])
+    return maxima
+
+
+@cache
+def chunk_subsets(bits: int, shift: int) -> Masks:
+    import numpy as np
+
+    subsets = np.zeros(1, np.int64)
+    for i in range(CHUNK):
+        if bits >> i & 1:
+            subsets = np.concatenate([subsets, subsets | 1 << (i + shift)])
+    return subsets
 
-def main() -> None:
-    import sys
 
+def subsets_of(mask: int) -> Masks:
+    import numpy as np
+
+    subsets = np.zeros(1, np.int64)
+    for shift in range(0, mask.bit_length(), CHUNK):
+        chunk = chunk_subsets(mask >> shift & (1 << CHUNK) - 1, shift)
+        subsets = np.bitwise_or.outer(subsets, chunk).ravel()
+    return subsets
+
+
+def max_team_flow(flows: Flows, agents: int) -> int:
+    """The most pressure that `agents` agents release together, when no valve is
+    opened by more than one of them.
+
+    One agent does best with the best subset of the valves, and two with the
+    best split of the valves between them, which is tried for all splits at
+    once. Larger teams let the agent that releases the most choose its valves
+    first, and leave the rest to a team of one agent less.
+    """
+    import numpy as np
+
+    maxima = subset_maxima(flows)
+
+    def pair(available: int) -> int:
+        opened = subsets_of(available)
+        return int((flows[opened] + maxima[available ^ opened]).max())
+
+    full = len(flows) - 1
+    if agents == 1:
+        return int(maxima[full])
+    if agents == 2:
+        return pair(full)
+
+    # The sets that one agent can open, from the most pressure down.
+    nonzero = np.flatnonzero(flows)
+    order = nonzero[np.argsort(flows[nonzero], kind="stable")[::-1]]
+    routes = list(zip(flows[order].tolist(), order.tolist()))
+    subset_best: list[int] = maxima.tolist()
+    # No valve releases more than when it is the only one opened, so the valves of
+    # a set release at most the sum of that over the set, whoever opens them.
+    valve_sums = np.zeros(1, np.int64)
+    for i in range(full.bit_length()):
+        valve_sums = np.concatenate([valve_sums, valve_sums + flows[1 << i]])
+    valve_bound: list[int] = valve_sums.tolist()
+
+    def team(available: int, agents: int, start: int, floor: int) -> int:
+        """The most pressure that `agents` agents release with the valves of
+        `available`, or `floor` if they cannot release more than that."""
+        # One agent alone is a team too, with the others idle.
+        best = max(floor, subset_best[available])
+        if valve_bound[available] <= best:
+            return best
+        if agents == 2:
+            return max(best, pair(available))
+        # The agents choose in the order of `routes`, so each one releases no more
+        # than the one before, and no team does better than `agents` times the
+        # share of its first agent.
+        for i in range(start, len(routes)):
+            flow, opened = routes[i]
+            if flow * agents <= best:
+                break
+            if opened & ~available:
+                continue
+            rest = available ^ opened
+            if flow + min((agents - 1) * min(flow, subset_best[rest]), valve_bound[rest]) <= best:
+                continue
+            # The others only matter if they beat the best team so far.
+            best = max(best, flow + team(rest, agents - 1, i + 1, best - flow))  # trace: teams
+        return best
+
+    return team(full, agents, 0, 0)
+
+
+def part_1(graph_and_rates: tuple[Graph, Rates]) -> int:
+    graph, rates = graph_and_rates
+    return max_team_flow(best_flows(graph, rates, "AA", 30), agents=1)
+
+
+def part_2(graph_and_rates: tuple[Graph, Rates]) -> int:
+    graph, rates = graph_and_rates
+    return max_team_flow(best_flows(graph, rates, "AA", 26), agents=2)
+
+
+def main() -> None:
     file_path = sys.argv[1]
-    graph, rates = read_input(file_path)
-    part_1 = find_max_flow(graph, rates, "AA", 30)
-    part_2 = find_max_flow_with_elephant(graph, rates, "AA", 26)
-    print(f"{part_1 = } {part_2 = }")
+    graph_and_rates = read_input(file_path)
+    print(f"part_1 = {part_1(graph_and_rates)} part_2 = {part_2(graph_and_rates)}")
 
 
 if __name__ == "__main__":
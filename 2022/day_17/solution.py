@@ -1,7 +1,12 @@
-from dataclasses import dataclass
-from typing import Self
+import sys
+from dataclasses import dataclass, field
 
-type Pair = tuple[int, int]
+from aoc.bitboard import Bitboard, flood_row
+from aoc.cycles import find_cycle
+
+# A rock, as one int per row of a Bitboard, from the bottom up. Columns count
+# from the left wall.
+type Rows = tuple[int, ...]
 
 SHAPE_ARRAYS = [
     [
@@ -29,6 +34,25 @@ SHAPE_ARRAYS = [
     ],
 ]
 WIDTH = 7
+FULL = (1 << WIDTH) - 1
+# Rocks are at most this many rows tall, so that a rock and the rows of the
+# chamber that it could hit pack into ints of one byte per row, from the bottom
+# up, which collide when they AND to anything but 0.
+ROCK_ROWS = 4
+WINDOW = (1 << 8 * ROCK_ROWS) - 1
+
+
+@dataclass(slots=True)
+class Tower:
+    """The chamber, with row 0 as its floor, and the tower of rocks in it, which is
+    `height` rows tall above the floor. `i_rock` rocks have fallen, and `i_jet`
+    is the jet that pushes next. The chamber is a Bitboard from the bottom up,
+    with a byte per row."""
+
+    chamber: Bitboard = field(default_factory=lambda: Bitboard(bytearray([FULL])))
+    height: int = 0
+    i_rock: int = 0
+    i_jet: int = 0
 
 
 def read_input(file_path: str) -> str:
@@ -36,149 +60,140 @@ def read_input(file_path: str) -> str:
         return f.read().strip()
 
 
-@dataclass
-class Shape:
-    points: set[Pair]
-
-    def move(self, di: int, dj: int) -> Self:
-        return type(self)({(i + di, j + dj) for i, j in self.points})
-
-    def move_up(self, n: int = 1) -> Self:
-        return self.move(n, 0)
-
-    def move_down(self, n: int = 1) -> Self:
-        return self.move(-n, 0)
-
-    def move_left(self, n: int = 1) -> Self:
-        return self.move(0, -n)
-
-    def move_right(self, n: int = 1) -> Self:
-        return self.move(0, n)
-
-    def in_bounds(self, width: int = WIDTH) -> bool:
-        return all(0 <= j < width for _, j in self.points)
-
-    def disjoint(self, other: Self) -> bool:
-        return not self.points & other.points
-
-    def update(self, other: Self) -> None:
-        return self.points.update(other.points)
-
-    def get_height(self) -> int:
-        return max(i for i, _ in self.points)
-
-    def get_boundary(self, height: int | None = None, width: int = WIDTH) -> Self:
-        if height is None:
-            height = self.get_height()
-        stack: list[Pair] = [(height, 0)]
-        seen: set[Pair] = set()
-        boundary: set[Pair] = set()
-        while stack:
-            x, y = stack.pop()
-            if (x, y) in seen:
-                continue
-            seen.add((x, y))
-            if not (0 <= x <= height and 0 <= y < width):
-                continue
-            if (x, y) in self.points:
-                boundary.add((x, y))
-                continue
-            for dx, dy in (1, 0), (0, 1), (-1, 0), (0, -1):
-                stack.append((x + dx, y + dy))
-        return type(self)(boundary)
-
-    @classmethod
-    def from_array(cls, a: list[str]) -> Self:
-        m = len(a)
-        return cls(
-            {
-                (m - 1 - i, j)
-                for i in range(len(a))
-                for j in range(len(a[0]))
-                if a[i][j] == "#"
-            }
-        )
-
-
-def show_grid(grid: Shape, shape: Shape | None, width: int = WIDTH) -> None:
-    if shape is None:
-        shape = Shape(set())
-    m = max(i for i, _ in grid.points | shape.points) + 1
-
+def rock_from_array(a: list[str], left: int = 2) -> Rows:
+    """The rows of a rock, as it appears `left` columns from the left wall."""
+    return tuple(Bitboard.from_lines(reversed(a), left=left).rows)
+
+
+def rock_positions(a: list[str]) -> list[tuple[Rows, int]]:
+    """The rows of a rock, and the rows packed into an int, at every column from
+    the left wall where it fits."""
+    positions = []
+    for left in range(WIDTH - len(a[0]) + 1):
+        rock = rock_from_array(a, left)
+        positions.append((rock, int.from_bytes(bytes(rock), "little")))
+    return positions
+
+
+def reachable_air(chamber: bytearray, top: int) -> dict[int, int]:
+    """The air that a falling rock could get to, as the row masks of the cells that
+    connect to the empty row `top`, by row. Rows are flooded sideways with shifts,
+    and a row is flooded again whenever the row above or below it grows."""
+    reach = {top: FULL}
+    stack = [top - 1]
+    while stack:
+        i = stack.pop()
+        seed = reach.get(i + 1, 0) | reach.get(i, 0) | reach.get(i - 1, 0)
+        r = flood_row(seed, ~chamber[i] & FULL)
+        if r != reach.get(i, 0):
+            reach[i] = r
+            stack.append(i - 1)
+            if i + 1 < top:
+                stack.append(i + 1)
+    return reach
+
+
+def show_chamber(chamber: bytearray, rock: Rows = (), y: int = 0) -> None:
     def symbol(i: int, j: int) -> str:
-        if (i, j) in shape.points:
+        if 0 <= i - y < len(rock) and rock[i - y] >> j & 1:
             return "@"
-        elif (i, j) in grid.points:
-            return "#"
-        else:
-            return "."
+        return "#" if chamber[i] >> j & 1 else "."
+
+    top = max(y + len(rock), next(i for i in reversed(range(len(chamber))) if chamber[i]) + 1)
+    print(
+        "\n".join("".join(symbol(i, j) for j in range(WIDTH)) for i in reversed(range(1, top)))
+    )
+
+
+def drop_rock(tower: Tower, rocks: list[list[tuple[Rows, int]]], lefts: list[bool]) -> Tower:
+    """Drops the next rock onto the tower, in place."""
+    chamber = tower.chamber.rows
+    height = tower.height
+    i_jet = tower.i_jet
+    njets = len(lefts)
 
-    s = "\n".join(
-        "".join(symbol(i, j) for j in range(width)) for i in reversed(range(m))
+    positions = rocks[tower.i_rock % len(rocks)]
+    if len(chamber) < height + 1 + ROCK_ROWS:
+        chamber.extend(bytes(len(chamber) + ROCK_ROWS))
+
+    # The rock appears three rows above the tower, so the first four jets
+    # push it through empty rows, where only the walls are in its way.
+    x = 2
+    for _ in range(4):
+        if lefts[i_jet]:
+            x = max(x - 1, 0)
+        else:
+            x = min(x + 1, len(positions) - 1)
+        i_jet = i_jet + 1 if i_jet + 1 < njets else 0
+
+    # The rows from y up that the rock could hit, which are empty at first.
+    y = height + 1
+    window = 0
+    while True:
+        below = (window << 8 | chamber[y - 1]) & WINDOW
+        if positions[x][1] & below:
+            break
+        y -= 1
+        window = below
+        if lefts[i_jet]:
+            if x > 0 and not positions[x - 1][1] & window:
+                x -= 1
+        elif x + 1 < len(positions) and not positions[x + 1][1] & window:
+            x += 1
+        i_jet = i_jet + 1 if i_jet + 1 < njets else 0
+
+    rock = positions[x][0]
+    for k, r in enumerate(rock):
+        chamber[y + k] |= r
+    height = max(height, y + len(rock) - 1)
+
+    tower.height = height
+    tower.i_rock += 1
+    tower.i_jet = i_jet
+    return tower
+
+
+def surface(tower: Tower, nrocks: int, njets: int) -> bytes:
+    """All that decides how the tower grows from here: the rock and the jet that
+    come next, and the air that falling rocks can get to, by row from the top
+    down. Air that no rock can get to might as well be rock."""
+    reach = reachable_air(tower.chamber.rows, tower.height + 1)
+    return (
+        (tower.i_rock % nrocks * njets + tower.i_jet).to_bytes(4)
+        + bytes(reach[i] for i in range(tower.height, min(reach) - 1, -1))
     )
-    print(s)
 
 
 def find_height(
     nshapes: int,
     jets: str,
     shape_arrays: list[list[str]] = SHAPE_ARRAYS,
-    width: int = WIDTH,
 ) -> int:
-    shapes = [Shape.from_array(a) for a in shape_arrays]
+    rocks = [rock_positions(a) for a in shape_arrays]
+    lefts = [c == "<" for c in jets]
+    cycle = find_cycle(
+        Tower(),
+        lambda tower: drop_rock(tower, rocks, lefts),
+        lambda tower: surface(tower, len(rocks), len(lefts)),
+        lambda tower: tower.height,
+        nshapes,
+    )
+    # The tower grows by the same rows every period of the cycle.
+    return cycle.extrapolate(cycle.values, nshapes)
 
-    grid = Shape({(-1, i) for i in range(width)})
-    height: int = 0
-    i_jet = -1
-    # (boundary, i_shape_mod, i_jet_mod) -> i_shape
-    states: dict[tuple[frozenset[Pair], int, int], int] = {}
-    heights: list[int] = []
-
-    for i_shape in range(nshapes):
-        shape = shapes[i_shape % len(shapes)].move(height + 3, 2)
-
-        while True:
-            i_jet += 1
-            jet = jets[i_jet % len(jets)]
-            blown = shape.move_left() if jet == "<" else shape.move_right()
-            if blown.in_bounds() and blown.disjoint(grid):
-                shape = blown
-
-            descended = shape.move_down()
-            if descended.disjoint(grid):
-                shape = descended
-            else:
-                height = max(height, 1 + shape.get_height())
-                heights.append(height)
-                grid.update(shape)
-                boundary = frozenset(grid.get_boundary(height).move_down(height).points)
-
-                # Cycle detection
-                s = (boundary, i_shape % len(shapes), i_jet % len(jets))
-                if s in states:
-                    prev_i_shape = states[s]
-                    ncycles, r = divmod(nshapes - prev_i_shape, i_shape - prev_i_shape)
-                    return (
-                        heights[prev_i_shape]
-                        + (heights[i_shape] - heights[prev_i_shape]) * ncycles
-                        + (heights[prev_i_shape + r] - heights[prev_i_shape])
-                        - 1
-                    )
-                states[s] = i_shape
-
-                break
-
-    return height
 
+def part_1(jets: str) -> int:
+    return find_height(2022, jets)
 
-def main() -> None:
-    import sys
 
+def part_2(jets: str) -> int:
+    return find_height(1_000_000_000_000, jets)
+
+
+def main() -> None:
     file_path = sys.argv[1]
     jets = read_input(file_path)
-    part_1 = find_height(2022, jets)
-    part_2 = find_height(1_000_000_000_000, jets)
-    print(f"{part_1 = } {part_2}")
+    print(f"part_1 = {part_1(jets)} {part_2(jets)}")
 
 
 if __name__ == "__main__":
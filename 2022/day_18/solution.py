@@ -1,67 +1,86 @@
-type Point = tuple[int, int, int]
+import re
+import sys
+from typing import TYPE_CHECKING
 
-DIRECTIONS = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
+import numpy as np
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
-def read_input(file_path: str) -> set[Point]:
-    points: set[Point] = set()
+# The droplet over its bounding box, padded with a layer of air on every side:
+# `cubes[x - x0, y - y0, z - z0]` is True if there is a cube at `(x, y, z)`.
+type Volume = npt.NDArray[np.bool_]
+
+NUMBER = re.compile(r"-?\d+")
+
+
+def read_input(file_path: str) -> Volume:
     with open(file_path) as f:
-        for line in f:
-            x, y, z = map(int, line.split(","))
-            points.add((x, y, z))
-    return points
-
-
-def approximate_surface_area(points: set[Point]) -> int:
-    num_interior = 0
-    for x, y, z in points:
-        for dx, dy, dz in DIRECTIONS:
-            if (x + dx, y + dy, z + dz) in points:
-                num_interior += 1
-    return len(points) * 6 - num_interior
-
-
-def find_boundary(points: set[Point]) -> tuple[Point, Point]:
-    min_point = (
-        min(x for x, _, _ in points) - 1,
-        min(y for _, y, _ in points) - 1,
-        min(z for _, _, z in points) - 1,
-    )
-    max_point = (
-        max(x for x, _, _ in points) + 1,
-        max(y for _, y, _ in points) + 1,
-        max(z for _, _, z in points) + 1,
-    )
-    return min_point, max_point
-
-
-def calculate_surface_area(points: set[Point]) -> int:
-    (x_min, y_min, z_min), (x_max, y_max, z_max) = find_boundary(points)
-    stack: list[Point] = [(x_min, y_min, z_min)]
-    filled: set[Point] = set()
-    area = 0
-    while stack:
-        x, y, z = stack.pop()
-        if not (x_min <= x <= x_max and y_min <= y <= y_max and z_min <= z <= z_max):
-            continue
-        if (x, y, z) in points:
-            area += 1
-            continue
-        if (x, y, z) in filled:
-            continue
-        filled.add((x, y, z))
-        stack.extend((x + dx, y + dy, z + dz) for dx, dy, dz in DIRECTIONS)
-    return area
+        s = f.read()
+    points = np.fromiter(map(int, NUMBER.findall(s)), dtype=np.int64).reshape(-1, 3)
+    points -= points.min(axis=0) - 1
+    cubes = np.zeros(points.max(axis=0) + 2, dtype=bool)
+    cubes[points[:, 0], points[:, 1], points[:, 2]] = True
+    return cubes
 
 
-def main() -> None:
-    import sys
+def count_faces(solid: Volume) -> int:
+    """The faces between solid and empty cells, which differ from their neighbour
+    along one of the axes. The padding keeps every face inside the volume."""
+    return int(sum(np.count_nonzero(np.diff(solid, axis=axis)) for axis in range(solid.ndim)))
+
+
+def spread(reached: Volume, solid: Volume) -> None:
+    """Spreads `reached` in place along the first axis, both ways, to the whole of
+    every run of empty cells that it touches, one layer at a time."""
+    step = np.empty(reached.shape[1:], dtype=bool)
+    for r, s in ((reached, solid), (reached[::-1], solid[::-1])):
+        for i in range(1, len(r)):
+            # On bools, `a > b` is `a and not b`.
+            np.greater(r[i - 1], s[i], out=step)
+            r[i] |= step
+
+
+def find_outside(cubes: Volume) -> Volume:
+    """The air that connects to the outside of the droplet.
 
+    Air spreads through whole runs of cells along each axis in turn, until a
+    round adds nothing, which takes about as many rounds as the paths of the
+    air have turns, rather than as many as they have cells. Layers across the
+    last axis are not contiguous, which makes stepping through them slow, so
+    air spreads along it in a copy of the volume in which it comes first.
+    """
+    rows_first = (2, 0, 1)
+    cubes_t = np.ascontiguousarray(cubes.transpose(rows_first))
+    outside = np.zeros_like(cubes)
+    outside[0] = True
+    outside_t = np.empty_like(cubes_t)
+    count = 0
+    while True:
+        spread(outside, cubes)
+        spread(np.moveaxis(outside, 1, 0), np.moveaxis(cubes, 1, 0))
+        np.copyto(outside_t, outside.transpose(rows_first))
+        spread(outside_t, cubes_t)
+        np.copyto(outside, outside_t.transpose(1, 2, 0))
+        new_count = np.count_nonzero(outside)
+        if new_count == count:
+            return outside
+        count = new_count
+
+
+def part_1(cubes: Volume) -> int:
+    return count_faces(cubes)
+
+
+def part_2(cubes: Volume) -> int:
+    # Air pockets count as part of the droplet.
+    return count_faces(~find_outside(cubes))
+
+
+def main() -> None:
     file_path = sys.argv[1]
-    points = read_input(file_path)
-    part_1 = approximate_surface_area(points)
-    part_2 = calculate_surface_area(points)
-    print(f"{part_1 = } {part_2 = }")
+    cubes = read_input(file_path)
+    print(f"part_1 = {part_1(cubes)} part_2 = {part_2(cubes)}")
 
 
 if __name__ == "__main__":
@@ -1,118 +1,91 @@
 # https://youtu.be/5rb0vvJ7NCY
 import math
 import re
-from collections.abc import Generator
-from dataclasses import dataclass
-from functools import cached_property
-from typing import Self
+import sys
+from functools import partial
+
+from aoc.parallel import parallel_map
 
 # Robot and Material Types
 ORE, CLAY, OBSIDIAN, GEODE = range(4)
 # blueprint[i][j] is the requirement of material_j in making robot_i
 type Blueprint = list[list[int]]
-
-
-@dataclass
-class State:
-    blueprint: Blueprint
-    remaining_time: int
-    robots: list[int]
-    materials: list[int]
-    idled: list[bool]
-
-    @classmethod
-    def new(cls, blueprint: Blueprint, remaining_time: int) -> Self:
-        n_robots = len(blueprint)
-        n_materials = len(blueprint[0])
-        robots = [0] * n_robots
-        robots[ORE] = 1
-        materials = [0] * n_materials
-        idled = [False] * n_robots
-        return cls(blueprint, remaining_time, robots, materials, idled)
-
-    def children(self, max_geodes: int) -> Generator[Self]:
-        if not self.best_case_can_beat(max_geodes):
-            return
-        if self.can_build(GEODE):
-            yield self.build(GEODE)
-            return
-        for robot in ORE, CLAY, OBSIDIAN:
-            if (
-                self.can_build(robot)
-                and not self.idled[robot]
-                and not self.enough(robot)
-            ):
-                yield self.build(robot)
-        if not all(self.idled):
-            yield self.idle()
-
-    def build(self, robot: int) -> Self:
-        remaining_time = self.remaining_time - 1
-        robots = self.robots[:]
-        robots[robot] += 1
-        materials = [
-            cur - req + r
-            for cur, req, r in zip(self.materials, self.blueprint[robot], self.robots)
-        ]
-        idled = [False] * len(self.idled)
-        return type(self)(
-            self.blueprint,
-            remaining_time,
-            robots,
-            materials,
-            idled,
-        )
-
-    def idle(self) -> Self:
-        remaining_time = self.remaining_time - 1
-        materials = [cur + r for cur, r in zip(self.materials, self.robots)]
-        idled = [
-            self.idled[robot] or self.can_build(robot)
-            for robot in range(len(self.idled))
-        ]
-        return type(self)(
-            self.blueprint,
-            remaining_time,
-            self.robots,
-            materials,
-            idled,
-        )
-
-    def can_build(self, robot: int) -> bool:
-        return all(
-            cur >= req for cur, req in zip(self.materials, self.blueprint[robot])
-        )
-
-    @cached_property
-    def max_materials(self) -> list[int]:
-        return [
-            max(self.blueprint[i][j] for i in range(len(self.blueprint)))
-            for j in range(len(self.blueprint[0]))
-        ]
-
-    def enough(self, robot: int) -> bool:
-        return self.robots[robot] >= self.max_materials[robot]
-
-    def best_case_can_beat(self, max_geodes: int) -> bool:
-        t = self.remaining_time
-        best_case = (
-            self.materials[GEODE]
-            + self.robots[GEODE] * t
-            + (t - 1) * t // 2  # Creating a new geode every minute
-        )
-        return best_case >= max_geodes
+# The minutes left, the ore, clay and obsidian in stock, and the ore, clay and
+# obsidian robots. Geodes are not part of it: every geode that a geode robot
+# will ever crack is counted when the robot is built.
+type State = tuple[int, int, int, int, int, int, int]
+
+
+def upper_bound(blueprint: Blueprint, state: State) -> int:
+    """The geodes that robots still to be built could crack, if ore were free and
+    a robot of every kind could be built each minute."""
+    remaining_time, _, clay, obsidian, _, clay_robots, obsidian_robots = state
+    obsidian_clay = blueprint[OBSIDIAN][CLAY]
+    geode_obsidian = blueprint[GEODE][OBSIDIAN]
+    geodes = 0
+    for t in range(remaining_time - 1, 0, -1):
+        build_geode = obsidian >= geode_obsidian
+        build_obsidian = clay >= obsidian_clay
+        clay += clay_robots
+        obsidian += obsidian_robots
+        if build_geode:
+            obsidian -= geode_obsidian
+            geodes += t
+        if build_obsidian:
+            clay -= obsidian_clay
+            obsidian_robots += 1
+        clay_robots += 1
+    return geodes
 
 
 def maximize_geodes(blueprint: Blueprint, remaining_time: int) -> int:
-    initial_state = State.new(blueprint, remaining_time)
-    stack = [initial_state]
+    """A depth-first search over the next robot to build, which skips the minutes
+    spent waiting for it. No more robots of a kind are built than its material
+    can be spent in a minute, and stocks are capped at what the remaining
+    minutes could spend, so that states that only differ by a surplus meet in
+    the table of the most geodes seen at each state."""
+    costs = [tuple(blueprint[robot][:GEODE]) for robot in range(GEODE + 1)]
+    max_spend = [max(cost[material] for cost in costs) for material in (ORE, CLAY, OBSIDIAN)]
     max_geodes = 0
+    seen: dict[State, int] = {}
+    stack: list[tuple[State, int]] = [((remaining_time, 0, 0, 0, 1, 0, 0), 0)]
     while stack:
-        state = stack.pop()
-        if state.remaining_time == 0:
-            max_geodes = max(max_geodes, state.materials[GEODE])
+        state, geodes = stack.pop()  # trace: nodes, max len(stack)
+        if seen.get(state, -1) >= geodes:
             continue
-        stack.extend(state.children(max_geodes))
+        seen[state] = geodes
+        max_geodes = max(max_geodes, geodes)
+        if geodes + upper_bound(blueprint, state) <= max_geodes:
+            continue  # trace: prunes
+        t = state[0]
+        stock, robots = state[1:4], state[4:]
+        # Build the geode robot last, so that it comes off the stack first.
+        for robot in ORE, CLAY, OBSIDIAN, GEODE:
+            if robot != GEODE and robots[robot] >= max_spend[robot]:
+                continue
+            wait = 0
+            for material, cost in enumerate(costs[robot]):
+                if cost > stock[material]:
+                    if not robots[material]:
+                        break
+                    wait = max(wait, -(-(cost - stock[material]) // robots[material]))
+            else:
+                left = t - wait - 1
+                if left <= 0:
+                    continue
+                new_stock = tuple(
+                    min(
+                        stock[m] + robots[m] * (wait + 1) - costs[robot][m],
+                        max_spend[m] * left,
+                    )
+                    for m in (ORE, CLAY, OBSIDIAN)
+                )
+                if robot == GEODE:
+                    stack.append(((left, *new_stock, *robots), geodes + left))
+                else:
+                    new_robots = list(robots)
+                    new_robots[robot] += 1
+                    stack.append(((left, *new_stock, *new_robots), geodes))
     return max_geodes
 
 
@@ -144,17 +117,20 @@ def read_input(file_path: str) -> dict[int, Blueprint]:
     return blueprints
 
 
-def main() -> None:
-    import sys
+def part_1(blueprints: dict[int, Blueprint]) -> int:
+    geodes = parallel_map(partial(maximize_geodes, remaining_time=24), blueprints.values())
+    return sum(blueprint_id * g for blueprint_id, g in zip(blueprints, geodes))
+
 
+def part_2(blueprints: dict[int, Blueprint]) -> int:
+    firsts = [blueprints[i] for i in range(1, 4)]
+    return math.prod(parallel_map(partial(maximize_geodes, remaining_time=32), firsts))
+
+
+def main() -> None:
     file_path = sys.argv[1]
     blueprints = read_input(file_path)
-    part_1 = sum(
-        blueprint_id * maximize_geodes(blueprint, 24)
-        for blueprint_id, blueprint in blueprints.items()
-    )
-    part_2 = math.prod(maximize_geodes(blueprints[i], 32) for i in range(1, 4))
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(blueprints)} part_2 = {part_2(blueprints)}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import sys
 from collections import deque
 
 
@@ -32,15 +33,18 @@ def grove_coordinates(numbers: list[int]) -> tuple[int, int, int]:
     return x, y, z
 
 
-def main() -> None:
-    import sys
+def part_1(numbers: list[int]) -> int:
+    return sum(grove_coordinates(mix(numbers)))
+
+
+def part_2(numbers: list[int]) -> int:
+    return sum(grove_coordinates(mix(numbers, decryption_key=811589153, niter=10)))
 
+
+def main() -> None:
     file_path = sys.argv[1]
     numbers = read_input(file_path)
-    part_1 = sum(grove_coordinates(mix(numbers)))
-    part_2 = sum(grove_coordinates(mix(numbers, decryption_key=811589153, niter=10)))
-
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(numbers)} part_2 = {part_2(numbers)}")
 
 
 if __name__ == "__main__":
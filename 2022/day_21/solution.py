@@ -1,4 +1,5 @@
 import re
+import sys
 from typing import Literal
 
 type Tree = dict[str, tuple[str, str]]
@@ -98,14 +99,20 @@ def find_human_val(
     return vals[human]
 
 
-def main() -> None:
-    import sys
+def part_1(monkeys: tuple[Tree, dict[str, int], dict[str, Op]]) -> int:
+    tree, vals, ops = monkeys
+    return evaluate(tree, ops, vals, "root")["root"]
+
+
+def part_2(monkeys: tuple[Tree, dict[str, int], dict[str, Op]]) -> int:
+    tree, vals, ops = monkeys
+    return find_human_val(tree, ops, vals, "root", "humn")
 
+
+def main() -> None:
     file_path = sys.argv[1]
-    tree, vals, ops = read_input(file_path)
-    part_1 = evaluate(tree, ops, vals, "root")["root"]
-    part_2 = find_human_val(tree, ops, vals, "root", "humn")
-    print(f"{part_1 = } {part_2 = }")
+    monkeys = read_input(file_path)
+    print(f"part_1 = {part_1(monkeys)} part_2 = {part_2(monkeys)}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 # TODO: Solve part_2. It's not hard, but it is really cumbersome.
 
 import re
+import sys
 
 type Point = tuple[int, int]
 
@@ -64,18 +65,20 @@ def compute_password(position: Point, direction: Point) -> int:
     return 1000 * x + 4 * y + i
 
 
-def main() -> None:
-    import sys
-
-    file_path = sys.argv[1]
-    grid, instructions = read_input(file_path)
+def part_1(notes: tuple[list[str], list[str]]) -> int:
+    grid, instructions = notes
     initial_position = next((0, j) for j in range(len(grid[0])) if grid[0][j] == ".")
     initial_direction = (0, 1)
     final_position, final_direction = walk(
         grid, instructions, initial_position, initial_direction
     )
-    part_1 = compute_password(final_position, final_direction)
-    print(part_1)
+    return compute_password(final_position, final_direction)
+
+
+def main() -> None:
+    file_path = sys.argv[1]
+    notes = read_input(file_path)
+    print(part_1(notes))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,14 @@
-# TODO: Clean up this mess.
+import sys
 
-from collections import defaultdict
+from aoc.bitboard import Bitboard
 
-type Point = tuple[int, int]
+# The elves are a Bitboard, whose columns count from the left edge of the
+# ground seen so far. The first and last rows, and column 0, are kept empty, so
+# that elves can always move north, south and west without falling off.
+
+N, S, W, E = range(4)
+# Columns are added on the left this many at a time.
+MARGIN = 64
 
 
 def read_input(file_path: str) -> list[str]:
@@ -10,92 +16,111 @@ def read_input(file_path: str) -> list[str]:
         return f.read().splitlines()
 
 
-DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # NSWE
+def find_elves(grid: list[str]) -> Bitboard:
+    return Bitboard.from_lines(["", *grid, ""], left=MARGIN)
 
 
-def step(elves: set[Point], round: int) -> bool:
-    # new_elf_pos -> {old_elf_pos}
-    proposals: defaultdict[Point, list[Point]] = defaultdict(list)
-    for x, y in elves:
-        if all(
-            (x + dx, y + dy) not in elves
-            for dx, dy in DIRECTIONS + [(1, 1), (-1, 1), (1, -1), (-1, -1)]
-        ):
+def step(elves: Bitboard, round: int) -> Bitboard:
+    """Plays a round on all elves of a row at once with shifts and masks, and
+    returns where they end up."""
+    rows = elves.rows
+    n = len(rows)
+    order = [(round + k) % 4 for k in range(4)]
+    proposals = [[0] * n for _ in range(4)]
+    for i in range(1, n - 1):
+        here = rows[i]
+        if not here:
             continue
-        for idx in range(4):
-            dx, dy = DIRECTIONS[(round + idx) % 4]
-            nbr = {
-                (x + dx, y + dy),
-                (x + dx - dy, y + dy + dx),
-                (x + dx + dy, y + dy - dx),
-            }
-            if nbr.isdisjoint(elves):
-                proposals[x + dx, y + dy].append((x, y))
-                break
-
-    changed = False
-    for proposal, old in proposals.items():
-        if len(old) == 1:
-            elves.remove(old[0])
-            elves.add(proposal)
-            changed = True
-    return changed
-
-
-def find_bounding_rectangles(elves: set[Point]) -> tuple[Point, Point]:
-    min_x = min(elves, key=lambda p: p[0])[0]
-    max_x = max(elves, key=lambda p: p[0])[0]
-    min_y = min(elves, key=lambda p: p[1])[1]
-    max_y = max(elves, key=lambda p: p[1])[1]
-    return (min_x, min_y), (max_x, max_y)
-
-
-def print_grid(elves: set[Point]) -> None:
-    (min_x, min_y), (max_x, max_y) = find_bounding_rectangles(elves)
-    if min_x < 0:
-        min_x = 0
-        max_x -= min_x
-    if min_y < 0:
-        min_y = 0
-        max_y -= min_y
-    grid = [["."] * (max_y + 1) for _ in range(max_x + 1)]
-    for elf in elves:
-        x, y = elf
-        grid[x - min_x][y - min_y] = "#"
-    s = "\n".join("".join(row) for row in grid)
-    print(s)
-
-
-def simulate(grid: list[str], rounds: int) -> int:
-    elves = {
-        (i, j)
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] == "#"
-    }
-    # print("Initial state:")
-    # print_grid(elves)
-    # print()
+        up, down = rows[i - 1], rows[i + 1]
+        blocked = (
+            up | up << 1 | up >> 1,
+            down | down << 1 | down >> 1,
+            # Elves one column west show up one bit east, and vice versa.
+            (up | here | down) << 1,
+            (up | here | down) >> 1,
+        )
+        movers = here & (blocked[N] | blocked[S] | blocked[W] | blocked[E])
+        for d in order:
+            p = movers & ~blocked[d]
+            proposals[d][i] = p
+            movers ^= p
+
+    # Two elves only ever propose the same spot from opposite sides.
+    north, south, west, east = proposals
+    arrivals_ns = [0] * n
+    clashes_ns = [0] * n
+    arrivals_we = [0] * n
+    clashes_we = [0] * n
+    for i in range(1, n - 1):
+        from_south, from_north = north[i + 1], south[i - 1]
+        arrivals_ns[i] = from_south ^ from_north
+        clashes_ns[i] = from_south & from_north
+        from_east, from_west = west[i] >> 1, east[i] << 1
+        arrivals_we[i] = from_east ^ from_west
+        clashes_we[i] = from_east & from_west
+    arrivals_ns[0], arrivals_ns[-1] = north[1], south[-2]
+
+    new_rows = [0] * n
+    for i in range(n):
+        moving = north[i] | south[i] | west[i] | east[i]
+        stuck = (
+            north[i] & clashes_ns[i - 1] if i > 0 else 0
+        ) | (
+            south[i] & clashes_ns[i + 1] if i < n - 1 else 0
+        ) | (
+            west[i] & clashes_we[i] << 1
+        ) | (
+            east[i] & clashes_we[i] >> 1
+        )
+        new_rows[i] = rows[i] & ~moving | stuck | arrivals_ns[i] | arrivals_we[i]
+
+    # Restore the empty border.
+    if new_rows[0]:
+        new_rows.insert(0, 0)
+    if new_rows[-1]:
+        new_rows.append(0)
+    moved = Bitboard(new_rows)
+    if moved.columns() & 1:
+        moved = moved.shifted(MARGIN)
+    return moved
+
+
+def print_grid(elves: Bitboard) -> None:
+    print(elves.render())
+
+
+def empty_ground(grid: list[str], rounds: int) -> int:
+    elves = find_elves(grid)
     for round in range(rounds):
-        changed = step(elves, round)
-        if not changed:
-            print(f"Stable after {round + 1} rounds")
+        moved = step(elves, round)
+        if moved == elves:
             break
-        # print(f"Round {round + 1}:")
-        # print_grid(elves)
-        # print()
-    (min_x, min_y), (max_x, max_y) = find_bounding_rectangles(elves)
-    area = (max_x - min_x + 1) * (max_y - min_y + 1)
-    return area - len(elves)
+        elves = moved
+    top, bottom, left, right = elves.bounds()
+    return (bottom - top) * (right - left) - elves.count()
 
 
-def main() -> None:
-    import sys
+def first_idle_round(grid: list[str]) -> int:
+    elves = find_elves(grid)
+    round = 0
+    while (moved := step(elves, round)) != elves:
+        elves = moved
+        round += 1
+    return round + 1
+
+
+def part_1(grid: list[str]) -> int:
+    return empty_ground(grid, 10)
 
+
+def part_2(grid: list[str]) -> int:
+    return first_idle_round(grid)
+
+
+def main() -> None:
     file_path = sys.argv[1]
     grid = read_input(file_path)
-    part_1 = simulate(grid, 100_000)
-    print(part_1)
+    print(f"part_1 = {part_1(grid)} part_2 = {part_2(grid)}")
 
 
 if __name__ == "__main__":
@@ -1,92 +1,117 @@
-from collections import deque
+import sys
+from functools import partial
 from math import lcm
 
-type Point = tuple[int, int]
-
-
-def read_input(file_path: str) -> list[str]:
-    with open(file_path) as f:
-        return f.read().splitlines()
-
-
-def advance_grid(grid: list[list[str]]) -> list[list[str]]:
-    m, n = len(grid), len(grid[0])
-    new_grid: list[list[str]] = [["" for _ in range(n)] for _ in range(m)]
-    for i in range(1, m - 1):
-        for j in range(1, n - 1):
-            for d in grid[i][j]:
-                match d:
-                    case "^":
-                        new_i = i - 1 if i > 1 else m - 2
-                        new_grid[new_i][j] += "^"
-                    case "v":
-                        new_i = i + 1 if i < m - 2 else 1
-                        new_grid[new_i][j] += "v"
-                    case "<":
-                        new_j = j - 1 if j > 1 else n - 2
-                        new_grid[i][new_j] += "<"
-                    case ">":
-                        new_j = j + 1 if j < n - 2 else 1
-                        new_grid[i][new_j] += ">"
-                    case _:
-                        raise ValueError(f"Invalid direction: {d}")
-    return new_grid
-
-
-def find_blizzards_till_repeat(grid: list[str]) -> list[list[list[bool]]]:
-    m, n = len(grid), len(grid[0])
-    has_blizzard: list[list[list[bool]]] = []
-    g = [["" if grid[i][j] == "." else grid[i][j] for j in range(n)] for i in range(m)]
-    has_blizzard.append([[len(g[i][j]) > 0 for j in range(n)] for i in range(m)])
-    for _ in range(lcm(m - 2, n - 2) - 1):
-        g = advance_grid(g)
-        has_blizzard.append([[len(g[i][j]) > 0 for j in range(n)] for i in range(m)])
-    return has_blizzard
-
-
-def quickest_path(
-    grid: list[str],
-    has_blizzard: list[list[list[bool]]],
-    source: Point,
-    target: Point,
-    starting_time: int,
-) -> int:
-    m, n = len(grid), len(grid[0])
-    mod = len(has_blizzard)
-    visited: set[tuple[Point, int]] = set()
-    q = deque([(starting_time, source)])
-    while q:
-        time, (i, j) = q.popleft()
-        if (i, j) == target:
-            return time
-        if ((i, j), time % mod) in visited:
-            continue
-        visited.add(((i, j), time % mod))
-        if (
-            not (0 <= i < m)
-            or not (0 <= j < n)
-            or has_blizzard[time % mod][i][j]
-            or grid[i][j] == "#"
-        ):
-            continue
-        for new_i, new_j in [(i, j), (i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)]:
-            q.append((time + 1, (new_i, new_j)))
+from aoc.grid import Grid
+from aoc.search import bfs_levels
+
+WALL = ord("#")
+
+# Blizzard symbols, with the (row, column) they move by every minute.
+WINDS = {"^": (-1, 0), "v": (1, 0), "<": (0, -1), ">": (0, 1)}
+
+
+def read_input(file_path: str) -> Grid:
+    return Grid.read(file_path, fill=b"#")
+
+
+class Valley:
+    """The valley, with a row of wall above and below so that nobody walks out
+    through the entrance or the exit.
+
+    Which cells are blocked repeats every `period` minutes, and is worked out as
+    the search gets to each minute.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        m, n = grid.shape
+        self.grid = grid
+        self.period = lcm(m - 2, n - 2)
+        self.walls = bytes(c == WALL for c in grid.cells)
+
+        # Every blizzard as its interior row and column, and the way it blows.
+        self.blizzards: list[tuple[int, int, int, int]] = []
+        for p, c in enumerate(grid.cells):
+            if (wind := WINDS.get(chr(c))) is not None:
+                i, j = grid.coords(p)
+                self.blizzards.append((i - 1, j - 1, *wind))
+        self._blocked: list[bytes | None] = [None] * self.period
+
+    def blocked(self, time: int) -> bytes:
+        t = time % self.period
+        cells = self._blocked[t]
+        if cells is None:
+            m, n = self.grid.shape
+            rows, cols = m - 2, n - 2
+            # The interior starts a row and a column into the grid.
+            w = self.grid.width
+            origin = self.grid.index(1, 1)
+            blocked = bytearray(self.walls)
+            for i, j, di, dj in self.blizzards:
+                blocked[origin + (i + di * t) % rows * w + (j + dj * t) % cols] = 1
+            cells = self._blocked[t] = bytes(blocked)
+        return cells
+
+    def source_and_target(self) -> tuple[int, int]:
+        cells = self.grid.cells
+        return cells.index(b"."), cells.rindex(b".")
+
+
+def moves_from(valley: Valley, seen: bytearray, frontier: list[int]) -> list[int]:
+    """The states not yet seen a minute on from those in `frontier`, which are
+    all at the same minute, and which are marked seen."""
+    size = len(valley.walls)
+    t = frontier[0] // size
+    blocked = valley.blocked(t + 1)
+    moves = 0, *valley.grid.steps
+    start = t * size
+    offset = (t + 1) % valley.period * size
+    res = []
+    for state in frontier:
+        p = state - start
+        for move in moves:
+            q = p + move
+            if not blocked[q]:
+                s = offset + q
+                if not seen[s]:
+                    seen[s] = 1
+                    res.append(s)
+    return res
+
+
+def quickest_path(valley: Valley, source: int, target: int, starting_time: int) -> int:
+    """Breadth-first search, one minute at a time, over the positions at each
+    minute of the blizzard period, as `minute * size + position`. A position is
+    only worth reaching once per minute of the period, since everything after
+    that repeats."""
+    size, period = len(valley.walls), valley.period
+    seen = bytearray(period * size)
+    expand = partial(moves_from, valley, seen)
+    start = starting_time % period * size + source
+    for level, frontier in enumerate(bfs_levels([start], expand, seen)):
+        if (starting_time + level) % period * size + target in frontier:
+            return starting_time + level
     return -1
 
 
-def main() -> None:
-    import sys
+def part_1(grid: Grid) -> int:
+    valley = Valley(grid)
+    source, target = valley.source_and_target()
+    return quickest_path(valley, source, target, 0)
+
+
+def part_2(grid: Grid) -> int:
+    valley = Valley(grid)
+    source, target = valley.source_and_target()
+    t = quickest_path(valley, source, target, 0)
+    t = quickest_path(valley, target, source, t)
+    return quickest_path(valley, source, target, t)
 
+
+def main() -> None:
     file_path = sys.argv[1]
     grid = read_input(file_path)
-    has_blizzards = find_blizzards_till_repeat(grid)
-    m, n = len(grid), len(grid[0])
-    source = next((0, j) for j in range(n) if grid[0][j] == ".")
-    target = next((m - 1, j) for j in range(n) if grid[m - 1][j] == ".")
-    part_1 = quickest_path(grid, has_blizzards, source, target, 0)
-    t = quickest_path(grid, has_blizzards, target, source, part_1)
-    part_2 = quickest_path(grid, has_blizzards, source, target, t)
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(grid)} part_2 = {part_2(grid)}")
 
 
 if __name__ == "__main__":
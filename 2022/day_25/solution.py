@@ -1,3 +1,6 @@
+import sys
+
+
 def read_input(file_path: str) -> list[str]:
     with open(file_path) as f:
         return f.read().splitlines()
@@ -32,14 +35,14 @@ def decimal_to_snafu(num: int) -> str:
     return "".join(reversed(res))
 
 
-def main() -> None:
-    import sys
+def part_1(snafus: list[str]) -> str:
+    return decimal_to_snafu(sum(map(snafu_to_decimal, snafus)))
 
+
+def main() -> None:
     file_path = sys.argv[1]
     snafus = read_input(file_path)
-    total = sum(map(snafu_to_decimal, snafus))
-    part_1 = decimal_to_snafu(total)
-    print(part_1)
+    print(part_1(snafus))
 
 
 if __name__ == "__main__":
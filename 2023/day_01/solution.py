@@ -1,5 +1,6 @@
 import re
-from collections.abc import Callable, Generator
+import sys
+from collections.abc import Callable
 
 WORDS = ("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
 word_to_digit = {x: str(i) for i, x in enumerate(WORDS)}
@@ -16,10 +17,9 @@ def _assert_match(match: re.Match[str] | None) -> re.Match[str]:
     return match
 
 
-def read_data() -> Generator[str, None, None]:
-    with open("input.txt") as f:
-        for line in f:
-            yield line.rstrip("\n")
+def read_input(path: str) -> list[str]:
+    with open(path) as f:
+        return f.read().splitlines()
 
 
 def number_constructor(pattern: str | re.Pattern[str]) -> Callable[[str], int]:
@@ -42,11 +42,17 @@ def number_constructor(pattern: str | re.Pattern[str]) -> Callable[[str], int]:
     return construct_number
 
 
-def main() -> None:
-    part_1 = sum(map(number_constructor(pattern_1), read_data()))
-    part_2 = sum(map(number_constructor(pattern_2), read_data()))
+def part_1(lines: list[str]) -> int:
+    return sum(map(number_constructor(pattern_1), lines))
+
+
+def part_2(lines: list[str]) -> int:
+    return sum(map(number_constructor(pattern_2), lines))
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    lines = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(lines)}, part_2 = {part_2(lines)}")
 
 
 if __name__ == "__main__":
@@ -1,81 +1,81 @@
 import re
-from collections.abc import Generator
+import sys
+from array import array
 from dataclasses import dataclass
 
+# A whole line, which is checked before its cubes are counted.
+GAME = re.compile(r"Game (\d+): (\d+ (?:red|green|blue)(?:[,;] \d+ (?:red|green|blue))*)")
+CUBES = re.compile(r"(\d+) ([rgb])")
 
-def _assert_match(match: re.Match[str] | None) -> re.Match[str]:
-    if not match:
-        raise ValueError("Could not match pattern.")
-    return match
 
-
-@dataclass
+@dataclass(slots=True)
 class CubeSet:
     red: int = 0
     green: int = 0
     blue: int = 0
 
-    @classmethod
-    def from_string(cls, s: str) -> "CubeSet":
-        pattern = re.compile(r"(?P<num>\d+) (?P<color>red|green|blue)$")
-        init_kwargs = {
-            m["color"]: int(m["num"])
-            for m in map(_assert_match, map(pattern.match, s.split(", ")))
-        }
-        return cls(**init_kwargs)
-
     def power(self) -> int:
         return self.red * self.green * self.blue
 
 
-@dataclass
-class Game:
-    id: int
-    reveals: list[CubeSet]
+class Games:
+    """The games in columns: each game's id, and the most cubes of each color that
+    any of its reveals showed, which is all that either part needs."""
+
+    __slots__ = ["ids", "red", "green", "blue"]
+
+    def __init__(self) -> None:
+        self.ids = array("i")
+        self.red = array("i")
+        self.green = array("i")
+        self.blue = array("i")
 
     @classmethod
-    def from_string(cls, s: str) -> "Game":
-        game_id_str, reveals_str = _assert_match(
-            re.match(r"Game (.*?): (.*)", s)
-        ).groups()
-        game_id = int(game_id_str)
-        reveals = [
-            CubeSet.from_string(reveal_str) for reveal_str in reveals_str.split("; ")
+    def from_string(cls, s: str) -> "Games":
+        games = cls()
+        columns = {"r": games.red, "g": games.green, "b": games.blue}
+        for line in s.splitlines():
+            m = GAME.fullmatch(line)
+            if not m:
+                raise ValueError(f"Could not match pattern: {line!r}")
+            games.ids.append(int(m[1]))
+            for column in columns.values():
+                column.append(0)
+            for num, color in CUBES.findall(m[2]):
+                if (n := int(num)) > (column := columns[color])[-1]:
+                    column[-1] = n
+        return games
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def minimal_bag_cubeset(self, i: int) -> CubeSet:
+        return CubeSet(self.red[i], self.green[i], self.blue[i])
+
+    def possible_ids(self, red: int, green: int, blue: int) -> list[int]:
+        return [
+            game_id
+            for game_id, r, g, b in zip(self.ids, self.red, self.green, self.blue)
+            if r <= red and g <= green and b <= blue
         ]
 
-        return cls(id=game_id, reveals=reveals)
-
-    def is_possible(self, red: int, green: int, blue: int) -> bool:
-        res = all(
-            reveal.red <= red and reveal.green <= green and reveal.blue <= blue
-            for reveal in self.reveals
-        )
-        return res
 
-    def minimal_bag_cubeset(self) -> CubeSet:
-        red = 0
-        green = 0
-        blue = 0
+def read_input(path: str) -> Games:
+    with open(path) as f:
+        return Games.from_string(f.read())
 
-        for reveal in self.reveals:
-            red = max(red, reveal.red)
-            green = max(green, reveal.green)
-            blue = max(blue, reveal.blue)
 
-        return CubeSet(red, green, blue)
+def part_1(games: Games) -> int:
+    return sum(games.possible_ids(12, 13, 14))
 
 
-def read_data() -> Generator[Game, None, None]:
-    with open("input.txt") as f:
-        for line in f:
-            yield Game.from_string(line.rstrip("\n"))
+def part_2(games: Games) -> int:
+    return sum(games.minimal_bag_cubeset(i).power() for i in range(len(games)))
 
 
 def main() -> None:
-    part_1 = sum(game.id for game in read_data() if game.is_possible(12, 13, 14))
-    part_2 = sum(game.minimal_bag_cubeset().power() for game in read_data())
-
-    print(f"{part_1 = }, {part_2 = }")
+    games = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(games)}, part_2 = {part_2(games)}")
 
 
 if __name__ == "__main__":
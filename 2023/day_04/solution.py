@@ -1,9 +1,12 @@
 import re
-from collections.abc import Generator, Iterable
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass
 
+CARD = re.compile(r"Card +(\d+):([\d ]*)\|([\d ]*)")
 
-@dataclass
+
+@dataclass(slots=True)
 class Card:
     id: int
     winning_numbers: set[int]
@@ -11,17 +14,16 @@ class Card:
 
     @classmethod
     def from_string(cls, s: str) -> "Card":
-        match = re.match(
-            r"Card +(?P<id>\d+): +(?P<winning_numbers>.*?) +\| +(?P<numbers>.*)", s
-        )
+        match = CARD.fullmatch(s)
         if not match:
-            raise ValueError("Could not match pattern.")
-
-        card_id = int(match["id"])
-        winning_numbers = set(map(int, match["winning_numbers"].split()))
-        numbers = list(map(int, match["numbers"].split()))
+            raise ValueError(f"Could not match pattern: {s!r}")
+        return cls.from_groups(*match.groups())
 
-        return cls(card_id, winning_numbers, numbers)
+    @classmethod
+    def from_groups(cls, id_str: str, winning_str: str, numbers_str: str) -> "Card":
+        return cls(
+            int(id_str), set(map(int, winning_str.split())), list(map(int, numbers_str.split()))
+        )
 
     def is_winning(self, x: int) -> bool:
         return x in self.winning_numbers
@@ -33,10 +35,9 @@ class Card:
         return 2 ** (n - 1) if (n := self.num_wins()) > 0 else 0
 
 
-def read_input() -> Generator[Card, None, None]:
-    with open("input.txt") as f:
-        for line in f:
-            yield Card.from_string(line.rstrip("\n"))
+def read_input(path: str) -> list[Card]:
+    with open(path) as f:
+        return [Card.from_string(line) for line in f.read().splitlines()]
 
 
 def total_score(cards: Iterable[Card]) -> int:
@@ -56,11 +57,17 @@ def total_cards(cards: Iterable[Card]) -> int:
     return sum(card_copies)
 
 
-def main():
-    part_1 = total_score(read_input())
-    part_2 = total_cards(read_input())
+def part_1(cards: list[Card]) -> int:
+    return total_score(cards)
+
+
+def part_2(cards: list[Card]) -> int:
+    return total_cards(cards)
 
-    print(f"{part_1 = } {part_2 = }")
+
+def main():
+    cards = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(cards)} part_2 = {part_2(cards)}")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,10 @@
 import bisect
 import math
+import sys
 
 
-def read_input():
-    with open("input.txt") as f:
+def read_input(path: str) -> tuple[list[int], list[int], int, int]:
+    with open(path) as f:
         s = f.read()
 
     times_str, distances_str = s.splitlines()
@@ -28,13 +29,19 @@ def num_winning_ways(available_time: int, record_distance: int) -> int:
     return available_time - 2 * min_hold + 1
 
 
-def main():
-    times, distances, time, distance = read_input()
+def part_1(races: tuple[list[int], list[int], int, int]) -> int:
+    times, distances, _, _ = races
+    return math.prod(map(num_winning_ways, times, distances))
+
 
-    part_1 = math.prod(map(num_winning_ways, times, distances))
-    part_2 = num_winning_ways(time, distance)
+def part_2(races: tuple[list[int], list[int], int, int]) -> int:
+    _, _, time, distance = races
+    return num_winning_ways(time, distance)
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main():
+    races = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(races)}, part_2 = {part_2(races)}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import sys
 from collections import Counter
 
 
@@ -42,13 +43,19 @@ def total_winnings(hands: list[str], bids: list[int], hands_key) -> int:
     return res
 
 
-def main() -> None:
-    hands, bids = read_input("input.txt")
+def part_1(hands_and_bids: tuple[list[str], list[int]]) -> int:
+    hands, bids = hands_and_bids
+    return total_winnings(hands, bids, create_hands_key(use_j=False))
+
 
-    part_1 = total_winnings(hands, bids, create_hands_key(use_j=False))
-    part_2 = total_winnings(hands, bids, create_hands_key(use_j=True))
+def part_2(hands_and_bids: tuple[list[str], list[int]]) -> int:
+    hands, bids = hands_and_bids
+    return total_winnings(hands, bids, create_hands_key(use_j=True))
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    hands_and_bids = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(hands_and_bids)}, part_2 = {part_2(hands_and_bids)}")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import re
+import sys
 from collections.abc import Callable
 from itertools import cycle
 from math import lcm
@@ -44,24 +45,29 @@ def num_steps(
     return lcm(*steps)
 
 
-def main() -> None:
-    directions, nodes = read_input("input.txt")
-
-    part_1 = num_steps(
+def part_1(network: tuple[str, dict[str, tuple[str, str]]]) -> int:
+    directions, nodes = network
+    return num_steps(
         directions,
         nodes,
         is_source_fn=lambda s: s == "AAA",
         is_target_fn=lambda s: s == "ZZZ",
     )
 
-    part_2 = num_steps(
+
+def part_2(network: tuple[str, dict[str, tuple[str, str]]]) -> int:
+    directions, nodes = network
+    return num_steps(
         directions,
         nodes,
         is_source_fn=lambda s: s.endswith("A"),
         is_target_fn=lambda s: s.endswith("Z"),
     )
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    network = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(network)}, part_2 = {part_2(network)}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
+import sys
 from collections.abc import Generator
 
 
-def read_input(path: str) -> Generator[list[int], None, None]:
+def read_input(path: str) -> list[list[int]]:
     with open(path) as f:
-        for line in f:
-            yield list(map(int, line.split()))
+        return [list(map(int, line.split())) for line in f]
 
 
 def diff(seq: list[int]) -> list[int]:
@@ -27,13 +27,17 @@ def predict_past(seq: list[int]) -> int:
     return sum(d[0] if i % 2 == 0 else -d[0] for i, d in enumerate(full_diff(seq)))
 
 
-def main() -> None:
-    path = "input.txt"
+def part_1(seqs: list[list[int]]) -> int:
+    return sum(map(predict_future, seqs))
+
 
-    part_1 = sum(map(predict_future, read_input(path)))
-    part_2 = sum(map(predict_past, read_input(path)))
+def part_2(seqs: list[list[int]]) -> int:
+    return sum(map(predict_past, seqs))
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    seqs = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(seqs)}, part_2 = {part_2(seqs)}")
 
 
 if __name__ == "__main__":
@@ -1,79 +1,85 @@
-from itertools import chain
+import sys
 
-type Pair = tuple[int, int]
+from aoc.grid import Grid
 
-RIGHT = (0, 1)
-UP = (-1, 0)
-LEFT = (0, -1)
-DOWN = (1, 0)
+# In the order of `Grid.steps`.
+UP, RIGHT, DOWN, LEFT = range(4)
 
 
-PIPES: dict[str, dict[Pair, Pair]] = {
-    "|": {UP: UP, DOWN: DOWN},
-    "-": {LEFT: LEFT, RIGHT: RIGHT},
-    "F": {UP: RIGHT, LEFT: DOWN},
-    "J": {RIGHT: UP, DOWN: LEFT},
-    "L": {DOWN: RIGHT, LEFT: UP},
-    "7": {RIGHT: DOWN, UP: LEFT},
+# The direction a pipe leads on in, by the direction it is entered in.
+PIPES: dict[int, dict[int, int]] = {
+    ord("|"): {UP: UP, DOWN: DOWN},
+    ord("-"): {LEFT: LEFT, RIGHT: RIGHT},
+    ord("F"): {UP: RIGHT, LEFT: DOWN},
+    ord("J"): {RIGHT: UP, DOWN: LEFT},
+    ord("L"): {DOWN: RIGHT, LEFT: UP},
+    ord("7"): {RIGHT: DOWN, UP: LEFT},
 }
 
 
-def read_input(path: str) -> list[list[str]]:
-    with open(path) as f:
-        s = f.read()
-    grid = list(map(list, s.splitlines()))
+def read_input(path: str) -> Grid:
+    grid = Grid.read(path, fill=b".")
 
-    assert set(chain.from_iterable(grid)) <= {"S", "F", "|", "-", "J", ".", "L", "7"}
+    assert set(grid.cells) <= set(b"SF|-J.L7")
 
     return grid
 
 
-def find_steps_and_area(grid: list[list[str]]) -> tuple[int, int]:
-    source = next(
-        (i, j)
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] == "S"
-    )
+def find_steps_and_area(grid: Grid) -> tuple[int, int]:
+    cells, width = grid.cells, grid.width
+    steps = grid.steps
+    source = cells.index(b"S")
     initial_direction = next(
         direction
         for direction in (RIGHT, UP, LEFT, DOWN)
-        if direction in PIPES[grid[source[0] + direction[0]][source[1] + direction[1]]]
+        if direction in PIPES.get(cells[source + steps[direction]], {})
     )
 
-    cursor: tuple[Pair, Pair] = source, initial_direction
+    # The shoelace formula needs the coordinates of the vertices, which the
+    # border only moves, and moving the loop does not change its area.
+    def vertex(p: int) -> tuple[int, int]:
+        return divmod(p, width)
+
+    pos, direction = source, initial_direction
 
     length = 0
-    vertex = source
+    corner = vertex(source)
     area = 0
 
     while True:
-        old_pos, old_direction = cursor
-        pos = old_pos[0] + old_direction[0], old_pos[1] + old_direction[1]
+        pos += steps[direction]
 
         if pos == source:
-            area += vertex[0] * pos[1] - vertex[1] * pos[0]
+            i, j = vertex(pos)
+            area += corner[0] * j - corner[1] * i
             break
 
-        val = grid[pos[0]][pos[1]]
+        new_direction = PIPES[cells[pos]][direction]
 
-        direction = PIPES[val][old_direction]
+        if new_direction != direction:
+            i, j = vertex(pos)
+            area += corner[0] * j - corner[1] * i
+            corner = i, j
 
-        if old_direction != direction:
-            area += vertex[0] * pos[1] - vertex[1] * pos[0]
-            vertex = pos
-
-        cursor = pos, direction
+        direction = new_direction
         length += 1
 
-    steps = (length + 1) // 2
+    steps_to_farthest = (length + 1) // 2
     area = (abs(area) - (length - 1)) // 2
 
-    return steps, area
+    return steps_to_farthest, area
+
+
+def part_1(grid: Grid) -> int:
+    return find_steps_and_area(grid)[0]
+
+
+def part_2(grid: Grid) -> int:
+    return find_steps_and_area(grid)[1]
 
 
 def main() -> None:
-    grid = read_input("input.txt")
+    grid = read_input(sys.argv[1])
     part_1, part_2 = find_steps_and_area(grid)
     print(f"{part_1 = }, {part_2 = }")
 
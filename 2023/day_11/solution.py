@@ -1,3 +1,4 @@
+import sys
 from itertools import pairwise
 
 
@@ -50,13 +51,17 @@ def pairwise_l1_sum_2d(i_coords: list[int], j_coords: list[int]) -> int:
     return pairwise_l1_sum_1d(i_coords) + pairwise_l1_sum_1d(j_coords)
 
 
-def main() -> None:
-    grid = read_input("input.txt")
+def part_1(grid: list[str]) -> int:
+    return pairwise_l1_sum_2d(*get_coordinates(grid, expansion_coefficient=2))
+
 
-    part_1 = pairwise_l1_sum_2d(*get_coordinates(grid, expansion_coefficient=2))
-    part_2 = pairwise_l1_sum_2d(*get_coordinates(grid, expansion_coefficient=1_000_000))
+def part_2(grid: list[str]) -> int:
+    return pairwise_l1_sum_2d(*get_coordinates(grid, expansion_coefficient=1_000_000))
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    grid = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(grid)}, part_2 = {part_2(grid)}")
 
 
 if __name__ == "__main__":
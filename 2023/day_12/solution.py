@@ -1,11 +1,14 @@
 # Props to this: https://alexoxorn.github.io/posts/aoc-day12-regular_languages/
 
+import sys
 from collections import defaultdict
-from collections.abc import Generator, Sequence
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from itertools import repeat
 
+from aoc.parallel import parallel_map
+
 
 class Symbol(StrEnum):
     UNBROKEN = "."
@@ -13,18 +16,18 @@ class Symbol(StrEnum):
     UNKNOWN = "?"
 
 
-def read_input(
-    path: str, unfold: int = 1
-) -> Generator[tuple[str, list[int]], None, None]:
-    """Yields a symbol sequence and a pattern, for each line in the file at `path`."""
+def read_input(path: str) -> list[tuple[str, list[int]]]:
+    """Returns a symbol sequence and a pattern, for each line in the file at `path`."""
+    records: list[tuple[str, list[int]]] = []
     with open(path) as f:
         for line in f:
             string, pattern_str = line.split()
-            pattern = list(map(int, pattern_str.split(",")))
-            if unfold > 1:
-                string = "?".join(repeat(string, unfold))
-                pattern = pattern * unfold
-            yield string, pattern
+            records.append((string, list(map(int, pattern_str.split(",")))))
+    return records
+
+
+def unfold(string: str, pattern: list[int], times: int) -> tuple[str, list[int]]:
+    return "?".join(repeat(string, times)), pattern * times
 
 
 @dataclass(slots=True)
@@ -99,18 +102,24 @@ class StateMachine(Sequence[State]):
         return heads[len(self.states) - 1]
 
 
+def num_arrangements(s: str, pattern: list[int]) -> int:
+    return StateMachine(pattern).num_matches(s)
+
+
+def part_1(records: list[tuple[str, list[int]]]) -> int:
+    strings, patterns = zip(*records)
+    return sum(parallel_map(num_arrangements, strings, patterns))
+
+
+def part_2(records: list[tuple[str, list[int]]]) -> int:
+    strings, patterns = zip(*(unfold(s, pattern, 5) for s, pattern in records))
+    return sum(parallel_map(num_arrangements, strings, patterns))
+
+
 def main() -> None:
     """Main function."""
-    path = "input.txt"
-    part_1 = sum(
-        StateMachine(pattern).num_matches(s) for s, pattern in read_input(path)
-    )
-    part_2 = sum(
-        StateMachine(pattern).num_matches(s)
-        for s, pattern in read_input(path, unfold=5)
-    )
-
-    print(f"{part_1 = }, {part_2 = }")
+    records = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(records)}, part_2 = {part_2(records)}")
 
 
 if __name__ == "__main__":
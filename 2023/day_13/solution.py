@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Iterable, Sequence
 from enum import StrEnum
 from itertools import chain, takewhile
@@ -11,10 +12,12 @@ class Symbol(StrEnum):
 type Grid = list[list[Symbol]]
 
 
-def read_input(path: str) -> Iterable[Grid]:
+def read_input(path: str) -> list[Grid]:
+    grids: list[Grid] = []
     with open(path) as f:
         while grid := list(takewhile(lambda line: line != "", map(str.strip, f))):
-            yield [[Symbol(x) for x in line] for line in grid]
+            grids.append([[Symbol(x) for x in line] for line in grid])
+    return grids
 
 
 def as_int(symbols: Iterable[Symbol]) -> int:
@@ -68,13 +71,17 @@ def grid_value(grid: Grid, smudges: int = 0) -> int:
     return next(chain(row_seeker, col_seeker), 0)
 
 
-def main():
-    path = "input.txt"
+def part_1(grids: list[Grid]) -> int:
+    return sum(grid_value(grid) for grid in grids)
+
 
-    part_1 = sum(grid_value(grid) for grid in read_input(path))
-    part_2 = sum(grid_value(grid, smudges=1) for grid in read_input(path))
+def part_2(grids: list[Grid]) -> int:
+    return sum(grid_value(grid, smudges=1) for grid in grids)
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main():
+    grids = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(grids)}, part_2 = {part_2(grids)}")
 
 
 if __name__ == "__main__":
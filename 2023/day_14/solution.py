@@ -1,127 +1,103 @@
-from itertools import batched
+import sys
 
+from aoc.cycles import find_cycle
+from aoc.grid import Grid
 
-class Grid:
-    def __init__(self, grid: list[list[str]]):
-        m, n = len(grid), len(grid[0])
-        if m != n:
-            raise NotImplementedError("This class does not handle non-square grids.")
-        self.grid = grid
-        self.shape = m, n
+ROUND = ord("O")
+CUBE = ord("#")
+EMPTY = ord(".")
 
-    def __getitem__(self, index: tuple[int, int]) -> str:
-        i, j = index
-        return self.grid[i][j]
 
-    def __setitem__(self, index: tuple[int, int], value: str) -> None:
-        i, j = index
-        self.grid[i][j] = value
+class Platform:
+    """The platform as a mutable copy of the cells of its `Grid`.
 
-    def __iter__(self):
-        return iter(self.grid)
+    Rocks roll along lanes of flat indices, so tilting in any direction needs
+    neither rotations nor bounds checks.
+    """
 
-    def __repr__(self) -> str:
-        return "\n".join("".join(row) for row in self)
+    def __init__(self, grid: Grid, cells: bytearray | None = None):
+        self.grid = grid
+        self.cells = bytearray(grid.cells) if cells is None else cells
+        m, n = grid.shape
+        index = grid.index
+        # The lanes are listed from the side that the rocks roll towards.
+        self.lanes = {
+            "north": [range(index(0, j), index(m, j), grid.width) for j in range(n)],
+            "west": [range(index(i, 0), index(i, n)) for i in range(m)],
+            "south": [range(index(m - 1, j), index(-1, j), -grid.width) for j in range(n)],
+            "east": [range(index(i, n - 1), index(i, -1), -1) for i in range(m)],
+        }
 
-    def to_flat_str(self) -> str:
-        return "".join("".join(row) for row in self)
+    def __repr__(self) -> str:
+        return self.cells.decode()
 
-    def parse_flat_str(self, string: str) -> "Grid":
-        _, n = self.shape
-        data = [list(batch) for batch in batched(string, n)]
-        return type(self)(data)
+    def copy(self) -> "Platform":
+        return type(self)(self.grid, self.cells.copy())
 
     def north_load(self) -> int:
-        m, n = self.shape
-        return sum(m - i for i in range(m) for j in range(n) if self[i, j] == "O")
-
-    def tilt_north(self) -> None:
-        m, n = self.shape
-
-        cur = [-1] * n
-
-        for i in range(m):
-            for j in range(n):
-                match self[i, j]:
-                    case "O":
-                        cur[j] += 1
-                        self[cur[j], j], self[i, j] = self[i, j], self[cur[j], j]
-                    case "#":
-                        cur[j] = i
-                    case ".":
-                        pass
-                    case _:
-                        raise ValueError(f"Unknown symbol {self[i, j]}")
-
-    def reverse_rows(self) -> None:
-        self.grid.reverse()
-
-    def reverse_cols(self) -> None:
-        for row in self:
-            row.reverse()
-
-    def transpose(self) -> None:
-        m, n = self.shape
-
-        for i in range(m):
-            for j in range(i + 1, n):
-                self[i, j], self[j, i] = self[j, i], self[i, j]
+        m, _ = self.grid.shape
+        w = self.grid.width
+        start = self.grid.index(0, 0)
+        return sum(
+            (m - i) * self.cells.count(ROUND, start + i * w, start + (i + 1) * w) for i in range(m)
+        )
 
-    def rotate_clockwise(self) -> None:
-        self.reverse_rows()
-        self.transpose()
+    def tilt(self, direction: str) -> None:
+        cells = self.cells
+        for lane in self.lanes[direction]:
+            free = lane.start
+            for p in lane:
+                c = cells[p]
+                if c == ROUND:
+                    cells[p] = EMPTY
+                    cells[free] = ROUND
+                    free += lane.step
+                elif c == CUBE:
+                    free = p + lane.step
+                elif c != EMPTY:
+                    raise ValueError(f"Unknown symbol {chr(c)}")
 
-    def rotate_anticlockwise(self) -> None:
-        self.reverse_cols()
-        self.transpose()
+    def tilt_north(self) -> None:
+        self.tilt("north")
 
     def cycle(self) -> None:
-        for _ in range(4):
-            self.tilt_north()
-            self.rotate_clockwise()
-
-    def repeat_cycle(self, repetitions: int) -> None:
-        start: int = 0
-        period: int = repetitions
-        cache: dict[str, int] = {self.to_flat_str(): 0}
-
-        for i in range(1, repetitions + 1):
-            self.cycle()
-            s = self.to_flat_str()
-            if s in cache:
-                start = cache[s]
-                period = i - cache[s]
-                break
-            cache[s] = i
-
-        num_cycles = start + (repetitions - start) % period
-        final_grid_str = next(
-            grid_str
-            for grid_str, repetition in cache.items()
-            if repetition == num_cycles
+        for direction in "north", "west", "south", "east":
+            self.tilt(direction)
+
+    def cycled(self) -> "Platform":
+        self.cycle()
+        return self
+
+    def north_load_after_cycles(self, repetitions: int) -> int:
+        """Cycles until the grid repeats, keeping the load of each grid on the way,
+        then reads the load off the repeating part."""
+        cycle = find_cycle(
+            self.copy(),
+            Platform.cycled,
+            lambda platform: bytes(platform.cells),
+            Platform.north_load,
+            repetitions,
         )
-        final_grid = self.parse_flat_str(final_grid_str)
-        self.grid = final_grid.grid
+        return cycle.value(repetitions)
 
 
-def read_input(path: str) -> Grid:
-    with open(path) as f:
-        s = f.read()
-    return Grid(list(map(list, s.splitlines())))
+def read_input(path: str) -> Platform:
+    return Platform(Grid.read(path))
 
 
-def main() -> None:
-    path = "input.txt"
+def part_1(platform: Platform) -> int:
+    platform = platform.copy()
+    platform.tilt_north()
+    return platform.north_load()
 
-    grid = read_input(path)
-    grid.tilt_north()
-    part_1 = grid.north_load()
 
-    grid = read_input(path)
-    grid.repeat_cycle(1_000_000_000)
-    part_2 = grid.north_load()
+def part_2(platform: Platform) -> int:
+    return platform.north_load_after_cycles(1_000_000_000)
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    platform = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(platform)}, part_2 = {part_2(platform)}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,34 @@
+import re
+import sys
 from dataclasses import dataclass
 from functools import reduce
 from typing import Iterator
 
+from aoc.reader import iter_chunks, mapped
 
-def read_input(path: str) -> list[str]:
-    with open(path) as f:
-        instructions_str = f.read()
-    instructions = instructions_str.rstrip("\n").split(",")
-    return instructions
+
+class Instructions:
+    """The steps of the initialization sequence, read from a memory map of the
+    input one step at a time, so that they are never all in memory at once. The
+    file is mapped afresh by each iteration, and unmapped at its end."""
+
+    __slots__ = ["path"]
+
+    STEP = re.compile(rb"[^,\n]+")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __iter__(self) -> Iterator[str]:
+        with mapped(self.path) as data:
+            # Chunks end at commas, so that no step is split between two.
+            for chunk in iter_chunks(data, sep=b","):
+                for m in self.STEP.finditer(chunk):
+                    yield m[0].decode()
+
+
+def read_input(path: str) -> Instructions:
+    return Instructions(path)
 
 
 def ascii_hash(s: str) -> int:
@@ -126,17 +147,20 @@ class Boxes:
         return "\n".join(f"Box {i}: {box}" for i, box in enumerate(self) if box)
 
 
-def main() -> None:
-    instructions = read_input("input.txt")
+def part_1(instructions: Instructions) -> int:
+    return sum(map(ascii_hash, instructions))
 
-    part_1 = sum(map(ascii_hash, instructions))
 
+def part_2(instructions: Instructions) -> int:
     boxes = Boxes()
     for instruction in instructions:
         boxes.instruct(instruction)
-    part_2 = boxes.focusing_power()
+    return boxes.focusing_power()
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    instructions = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(instructions)}, part_2 = {part_2(instructions)}")
 
 
 if __name__ == "__main__":
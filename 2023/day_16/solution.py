@@ -1,134 +1,87 @@
-from collections import defaultdict, deque
-from dataclasses import dataclass
+import sys
+from functools import partial
 from typing import Iterator
 
+from aoc.grid import Grid
+from aoc.parallel import parallel_map
 
-@dataclass(slots=True, frozen=True)
-class Pair:
-    x: int
-    y: int
-
-    def __add__(self, other: "Pair") -> "Pair":
-        return type(self)(self.x + other.x, self.y + other.y)
-
-
-right = Pair(0, 1)
-up = Pair(-1, 0)
-left = Pair(0, -1)
-down = Pair(1, 0)
-
-type Beam = tuple[Pair, Pair]
-
-
-@dataclass(slots=True, frozen=True)
-class Mirror:
-    value: str
-    reflect: dict[Pair, list[Pair]]
-
-    def __repr__(self) -> str:
-        return self.value
-
-    def __call__(self, p: Pair):
-        return self.reflect[p]
-
-
-type MirrorGrid = list[list[Mirror]]
-
-pipe = Mirror(
-    "|",
-    {
-        right: [up, down],
-        up: [up],
-        left: [up, down],
-        down: [down],
-    },
-)
-dash = Mirror(
-    "-",
-    {
-        right: [right],
-        up: [left, right],
-        left: [left],
-        down: [left, right],
-    },
-)
-slash = Mirror(
-    "/",
-    {
-        right: [up],
-        up: [right],
-        left: [down],
-        down: [left],
-    },
-)
-bslash = Mirror(
-    "\\",
-    {
-        right: [down],
-        up: [left],
-        left: [up],
-        down: [right],
-    },
-)
-dot = Mirror(
-    ".",
-    {
-        right: [right],
-        up: [up],
-        left: [left],
-        down: [down],
-    },
-)
-
-
-def read_input(path: str) -> MirrorGrid:
-    d = {"|": pipe, "-": dash, "/": slash, "\\": bslash, ".": dot}
-    with open(path) as f:
-        lines = f.read().splitlines()
-    grid = [[d[c] for c in line] for line in lines]
-    return grid
-
-
-def energy(grid: MirrorGrid, beam: Beam) -> int:
-    m, n = len(grid), len(grid[0])
-
-    beams: deque[Beam] = deque([beam])
-    visited: dict[Pair, set[Pair]] = defaultdict(set)
+RIGHT, UP, LEFT, DOWN = range(4)
 
-    while beams:
-        p, d = beams.popleft()
+# The directions a beam leaves a tile in, indexed by the direction it came in.
+type Tile = tuple[tuple[int, ...], ...]
 
-        if d in visited[p]:
-            continue
-        visited[p].add(d)
+TILES: dict[str, Tile] = {
+    "|": ((UP, DOWN), (UP,), (UP, DOWN), (DOWN,)),
+    "-": ((RIGHT,), (LEFT, RIGHT), (LEFT,), (LEFT, RIGHT)),
+    "/": ((UP,), (RIGHT,), (DOWN,), (LEFT,)),
+    "\\": ((DOWN,), (LEFT,), (UP,), (RIGHT,)),
+    ".": ((RIGHT,), (UP,), (LEFT,), (DOWN,)),
+}
+OUTSIDE: Tile = ((), (), (), ())
+
+type Contraption = tuple[list[Tile], int]
+# A flat tile index and a direction.
+type Beam = tuple[int, int]
+
+
+def read_input(path: str) -> Contraption:
+    """The tiles in one flat list laid out like the cells of a `Grid`, and the
+    length of a row. The grid's border of newlines becomes `OUTSIDE` tiles, so
+    that beams need no bounds checks."""
+    grid = Grid.read(path)
+    outside = ord("\n")
+    tiles = [OUTSIDE if c == outside else TILES[chr(c)] for c in grid.cells]
+    return tiles, grid.width
+
+
+def energy(contraption: Contraption, beam: Beam) -> int:
+    tiles, width = contraption
+    steps = 1, -width, -1, width
 
-        mirror = grid[p.x][p.y]
+    beams = [beam]
+    # A bit for every direction a beam has crossed each tile in.
+    visited = bytearray(len(tiles))
 
-        for dd in mirror(d):
-            pp = p + dd
-            if pp.x in range(m) and pp.y in range(n):
-                beams.append((pp, dd))
+    while beams:
+        p, d = beams.pop()
+        # Only the outside has no way out. Unlike an identity check against
+        # OUTSIDE, this also holds for tiles that were pickled to a worker.
+        exits = tiles[p][d]
+        if not exits or visited[p] >> d & 1:
+            continue
+        visited[p] |= 1 << d
 
-    return len(visited)
+        for dd in exits:
+            beams.append((p + steps[dd], dd))
+
+    return len(visited) - visited.count(0)
 
 
 def iter_beams(m: int, n: int) -> Iterator[Beam]:
-    for i in range(m):
-        yield Pair(i, 0), right
-        yield Pair(i, n - 1), left
+    width = n + 1
+    for i in range(1, m + 1):
+        yield i * width, RIGHT
+        yield i * width + n - 1, LEFT
 
     for j in range(n):
-        yield Pair(0, j), down
-        yield Pair(m - 1, j), up
+        yield width + j, DOWN
+        yield m * width + j, UP
 
 
-def main() -> None:
-    grid = read_input("input.txt")
+def part_1(contraption: Contraption) -> int:
+    _, width = contraption
+    return energy(contraption, (width, RIGHT))
 
-    part_1 = energy(grid, (Pair(0, 0), right))
-    part_2 = max(energy(grid, beam) for beam in iter_beams(len(grid), len(grid[0])))
 
-    print(f"{part_1 = }, {part_2 = }")
+def part_2(contraption: Contraption) -> int:
+    tiles, width = contraption
+    m, n = len(tiles) // width - 2, width - 1
+    return max(parallel_map(partial(energy, contraption), iter_beams(m, n)))
+
+
+def main() -> None:
+    contraption = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(contraption)}, part_2 = {part_2(contraption)}")
 
 
 if __name__ == "__main__":
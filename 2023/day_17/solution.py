@@ -1,137 +1,75 @@
-from collections.abc import Iterator, Sequence
-from dataclasses import dataclass, field
-from heapq import heappop, heappush
-from typing import Any, Self
+import sys
+
+from aoc.grid import Grid
+from aoc.search import BucketQueue
+
+# Row ends and the rows above and below the city, which the crucible stays out of.
+BORDER = ord("\n")
+ZERO = ord("0")
+
+# The largest heat loss of a block.
+MAX_LOSS = 9
+
+
+def read_input(path: str) -> Grid:
+    return Grid.read(path)
+
+
+def min_heat_loss(city: Grid, min_num_straight: int, max_num_straight: int) -> int:
+    """Dijkstra's algorithm over a bucket queue, since the heat losses are small.
+
+    A state is a block and the axis the crucible arrived along, encoded as
+    `2 * block + axis`, with axis 0 for rows and 1 for columns. From a state, the
+    crucible turns and then goes straight for as many blocks as it is allowed,
+    up to the edge of the city.
+    """
+    cells = city.cells
+    m, n = city.shape
+    target = city.index(m - 1, n - 1)
+    up, right, down, left = city.steps
+    steps = (down, up), (right, left)
+
+    queue = BucketQueue(2 * len(cells), MAX_LOSS * max_num_straight)
+    dist = queue.dist
+    push = queue.push
+    # Starting on both axes lets the crucible set off either right or down.
+    source = city.index(0, 0)
+    push(2 * source, 0)
+    push(2 * source + 1, 0)
+
+    for cost, state in queue:
+        p, axis = divmod(state, 2)
+        if p == target:
+            return cost
+        for step in steps[axis]:
+            q = p
+            total = cost
+            for k in range(1, max_num_straight + 1):
+                q += step
+                c = cells[q]
+                if c == BORDER:
+                    break
+                total += c - ZERO
+                if k < min_num_straight:
+                    continue
+                next_state = 2 * q + 1 - axis
+                if total < dist[next_state]:
+                    push(next_state, total)
 
+    return -1
 
-def read_input(path: str) -> list[list[int]]:
-    with open(path) as f:
-        s = f.read()
-    grid = [[int(x) for x in line] for line in s.splitlines()]
-    return grid
-
-
-@dataclass(slots=True, frozen=True)
-class Pair:
-    x: int
-    y: int
-
-    def __add__(self, other: Self) -> Self:
-        return type(self)(self.x + other.x, self.y + other.y)
-
-    def left(self) -> Self:
-        return type(self)(-self.y, self.x)
-
-    def right(self) -> Self:
-        return type(self)(self.y, -self.x)
-
-    def conforms(self, grid: Sequence[Sequence[Any]]) -> bool:
-        m, n = len(grid), len(grid[0])
-        return 0 <= self.x < m and 0 <= self.y < n
-
-    def at[T](self, grid: Sequence[Sequence[T]]) -> T:
-        return grid[self.x][self.y]
-
-
-RIGHT = Pair(0, 1)
-UP = Pair(-1, 0)
-LEFT = Pair(0, -1)
-DOWN = Pair(1, 0)
-
-
-@dataclass(slots=True, frozen=True)
-class Crucible:
-    position: Pair
-    direction: Pair
-    num_straight: int
-
-    def move_straight(self) -> Self:
-        return type(self)(
-            self.position + self.direction,
-            self.direction,
-            self.num_straight + 1,
-        )
-
-    def move_left(self) -> Self:
-        return type(self)(
-            self.position + self.direction.left(),
-            self.direction.left(),
-            1,
-        )
-
-    def move_right(self) -> Self:
-        return type(self)(
-            self.position + self.direction.right(),
-            self.direction.right(),
-            1,
-        )
-
-    def moves(self, min_num_straight: int, max_num_straight: int) -> Iterator[Self]:
-        assert 0 <= min_num_straight < max_num_straight
-
-        if self.num_straight < max_num_straight:
-            yield self.move_straight()
-
-        if self.num_straight >= min_num_straight:
-            yield self.move_left()
-            yield self.move_right()
-
-
-@dataclass(order=True, slots=True, frozen=True)
-class HeapElement:
-    heat_loss: int
-    crucible: Crucible = field(compare=False)
-
-
-def min_heat_loss(
-    grid: list[list[int]], min_num_straight: int, max_num_straight: int
-) -> int:
-    m = len(grid)
-    n = len(grid[0])
-
-    source = Pair(0, 0)
-    target = Pair(m - 1, n - 1)
-
-    heap: list[HeapElement] = []
-    heappush(heap, HeapElement(0, Crucible(source, RIGHT, 0)))
-    heappush(heap, HeapElement(0, Crucible(source, DOWN, 0)))
-
-    done: set[Crucible] = set()
-
-    while heap:
-        element = heappop(heap)
-        heat_loss = element.heat_loss
-        crucible = element.crucible
-
-        if crucible.position == target and crucible.num_straight >= min_num_straight:
-            return heat_loss
-
-        for next_crucible in crucible.moves(min_num_straight, max_num_straight):
-            if not next_crucible.position.conforms(grid) or next_crucible in done:
-                continue
-
-            done.add(next_crucible)
 
-            next_heat_loss = heat_loss + next_crucible.position.at(grid)
+def part_1(city: Grid) -> int:
+    return min_heat_loss(city, 0, 3)
 
-            heappush(
-                heap,
-                HeapElement(
-                    next_heat_loss,
-                    next_crucible,
-                ),
-            )
 
-    return -1
+def part_2(city: Grid) -> int:
+    return min_heat_loss(city, 4, 10)
 
 
 def main() -> None:
-    grid = read_input("input.txt")
-
-    part_1 = min_heat_loss(grid, 0, 3)
-    part_2 = min_heat_loss(grid, 4, 10)
-
-    print(f"{part_1 = }, {part_2 = }")
+    city = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(city)}, part_2 = {part_2(city)}")
 
 
 if __name__ == "__main__":
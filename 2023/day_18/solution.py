@@ -1,4 +1,5 @@
 import re
+import sys
 from dataclasses import dataclass
 from itertools import accumulate, pairwise, starmap
 from typing import Self
@@ -66,14 +67,17 @@ def area(steps: list[Pair]) -> int:
     return num_interior + num_boundary
 
 
-def main() -> None:
-    path = "input.txt"
-    steps_1, steps_2 = read_input(path)
+def part_1(steps: tuple[list[Pair], list[Pair]]) -> int:
+    return area(steps[0])
+
 
-    part_1 = area(steps_1)
-    part_2 = area(steps_2)
+def part_2(steps: tuple[list[Pair], list[Pair]]) -> int:
+    return area(steps[1])
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    steps = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(steps)}, part_2 = {part_2(steps)}")
 
 
 if __name__ == "__main__":
@@ -1,18 +1,25 @@
 import math
 import re
+import sys
 from dataclasses import dataclass
 from typing import Generator, Iterator, Literal, NamedTuple, Self
 
+from aoc.intervals import IntervalSet
+
 type Xmas = Literal["x", "m", "a", "s"]
 type Op = Literal["<", ">"]
 
 XMAS = {"x": 0, "m": 1, "a": 2, "s": 3}
 
+WORKFLOW = re.compile(r"(?P<name>\w+)\{(?:(?P<conditions>.*),)?(?P<else_>\w+)\}")
+CONDITION = re.compile(r"(?P<var>[xmas])(?P<op>[<>])(?P<val>\d+):(?P<ret>\w+)")
+PART = re.compile(r"\{x=(\d+),m=(\d+),a=(\d+),s=(\d+)\}")
+
 
 def safematch[T: (str, bytes)](pattern: re.Pattern[T], s: T) -> re.Match[T]:
-    m = pattern.match(s)
+    m = pattern.fullmatch(s)
     if not m:
-        raise ValueError("Could not match pattern.")
+        raise ValueError(f"Could not match pattern: {s!r}")
     return m
 
 
@@ -22,49 +29,23 @@ class Part(NamedTuple):
     a: int
     s: int
 
-    @classmethod
-    def from_string(cls, part_str: str) -> Self:
-        part_pattern = re.compile(r"\{x=(\d+),m=(\d+),a=(\d+),s=(\d+)\}")
-        m = safematch(part_pattern, part_str)
-        return cls(*map(int, m.groups()))
-
-
-def split_lt(rn: range, val: int) -> tuple[range, range]:
-    a, b = rn.start, rn.stop - 1
-
-    if val < a <= b:
-        accepted, rejected = range(0), rn
-    elif a <= val <= b:
-        accepted, rejected = range(a, val), range(val, b + 1)
-    elif a <= b < val:
-        accepted, rejected = rn, range(0)
-    else:
-        raise ValueError(a, b, val)
-
-    return accepted, rejected
-
-
-def split_gt(rn: range, val: int) -> tuple[range, range]:
-    p, q = split_lt(rn, val + 1)
-    return q, p
-
 
 class PartRange(NamedTuple):
-    x: range
-    m: range
-    a: range
-    s: range
+    x: IntervalSet
+    m: IntervalSet
+    a: IntervalSet
+    s: IntervalSet
 
     def size(self) -> int:
-        return math.prod(map(len, self))
+        return math.prod(ratings.size() for ratings in self)
 
     def split(self, var: Xmas, val: int, op: Op) -> tuple[Self, Self]:
-        rn = self[XMAS[var]]
+        ratings = self[XMAS[var]]
 
         if op == "<":
-            accepted_range, rejected_range = split_lt(rn, val)
+            accepted_range, rejected_range = ratings.split(val)
         elif op == ">":
-            accepted_range, rejected_range = split_gt(rn, val)
+            rejected_range, accepted_range = ratings.split(val + 1)
         else:
             raise ValueError(f"Invalid op {op}")
 
@@ -91,12 +72,7 @@ class Condition:
 
     @classmethod
     def from_string(cls, condition_str: str) -> Self:
-        condition_pattern = re.compile(
-            r"(?P<var>x|m|a|s)(?P<op><|>)(?P<val>\d+):(?P<ret>\w+)"
-        )
-
-        m = safematch(condition_pattern, condition_str)
-
+        m = safematch(CONDITION, condition_str)
         return cls(m["var"], m["op"], int(m["val"]), m["ret"])  # type: ignore
 
 
@@ -131,14 +107,14 @@ class Workflow:
 
     @classmethod
     def from_string(cls, workflow_str: str) -> Self:
-        workflow_pattern = re.compile(r"(?P<name>.*?)\{(?P<logic>.*?)\}")
-
-        m = safematch(workflow_pattern, workflow_str)
-        name = m["name"]
-        *condition_strs, else_ = m["logic"].split(",")
-        conditions = list(map(Condition.from_string, condition_strs))
-
-        return cls(name, conditions, else_)
+        m = safematch(WORKFLOW, workflow_str)
+        conditions_str = m["conditions"]
+        conditions = (
+            [Condition.from_string(c) for c in conditions_str.split(",")]
+            if conditions_str
+            else []
+        )
+        return cls(m["name"], conditions, m["else_"])
 
 
 class System:
@@ -177,29 +153,32 @@ def read_input(path: str) -> tuple[System, list[Part]]:
 
     workflows_str, parts_str = s.split("\n\n")
 
-    workflows = list(map(Workflow.from_string, workflows_str.splitlines()))
+    workflows = [Workflow.from_string(line) for line in workflows_str.splitlines()]
     system = System(workflows)
 
-    parts = list(map(Part.from_string, parts_str.splitlines()))
+    parts = [
+        Part._make(map(int, safematch(PART, line).groups())) for line in parts_str.splitlines()
+    ]
 
     return system, parts
 
 
-def main():
-    path = "input.txt"
-
-    system, parts = read_input(path)
+def part_1(system_and_parts: tuple[System, list[Part]]) -> int:
+    system, parts = system_and_parts
+    return sum(sum(part) for part in parts if system.accepts_part(part))
 
-    part_1 = sum(sum(part) for part in parts if system.accepts_part(part))
 
-    part_range = PartRange(
-        range(1, 4001), range(1, 4001), range(1, 4001), range(1, 4001)
-    )
-    part_2 = sum(
+def part_2(system_and_parts: tuple[System, list[Part]]) -> int:
+    system, _ = system_and_parts
+    part_range = PartRange._make(IntervalSet.from_intervals([(1, 4001)]) for _ in XMAS)
+    return sum(
         part_range.size() for part_range in system.accepted_part_ranges(part_range)
     )
 
-    print(f"{part_1 = }, {part_2}")
+
+def main():
+    system_and_parts = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(system_and_parts)}, {part_2(system_and_parts)}")
 
 
 if __name__ == "__main__":
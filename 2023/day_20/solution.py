@@ -1,9 +1,12 @@
 import math
+import sys
 from collections import defaultdict, deque
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Iterator
 
+from aoc.cycles import find_cycle
+
 type Digraph = dict[str, set[str]]
 
 
@@ -153,6 +156,31 @@ class Circuit:
             self.update_pulse_count(signal.pulse)
             signal_queue.extend(self.propagate(signal))
 
+    def pushed(self) -> "Circuit":
+        self.push_button()
+        return self
+
+    def state(self) -> bytes:
+        """The flip-flops and the conjunctions' memories, one byte each."""
+        return bytes(self.flipflops.values()) + bytes(
+            pulse for memory in self.conjunctions.values() for pulse in memory.values()
+        )
+
+    def pulse_counts(self) -> tuple[int, int]:
+        return self.low_pulses, self.high_pulses
+
+    def pulse_counts_after(self, pushes: int) -> tuple[int, int]:
+        """The low and high pulses sent by `pushes` pushes of the button.
+
+        Once the circuit is back in a state it has been in, the pulses of every
+        whole period left are added up without pushing the button.
+        """
+        cycle = find_cycle(
+            deepcopy(self), Circuit.pushed, Circuit.state, Circuit.pulse_counts, pushes
+        )
+        lows, highs = zip(*cycle.values)
+        return cycle.extrapolate(lows, pushes), cycle.extrapolate(highs, pushes)
+
     def min_pushes_low_rx(self) -> int:
         """
         Assumes a very specific `System` structure:
@@ -188,18 +216,20 @@ class Circuit:
         return math.lcm(*button_push_periods.values())
 
 
-def main() -> None:
-    digraph, flipflops, conjunctions, broadcaster = read_input("input.txt")
-    system = Circuit(digraph, flipflops, conjunctions, broadcaster)
+def part_1(modules: tuple[Digraph, set[str], set[str], str]) -> int:
+    system = Circuit(*modules)
+    low_pulses, high_pulses = system.pulse_counts_after(1_000)
+    return low_pulses * high_pulses
 
-    for _ in range(1_000):
-        system.push_button()
-    part_1 = system.low_pulses * system.high_pulses
 
-    system = Circuit(digraph, flipflops, conjunctions, broadcaster)
-    part_2 = system.min_pushes_low_rx()
+def part_2(modules: tuple[Digraph, set[str], set[str], str]) -> int:
+    system = Circuit(*modules)
+    return system.min_pushes_low_rx()
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    modules = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(modules)}, part_2 = {part_2(modules)}")
 
 
 if __name__ == "__main__":
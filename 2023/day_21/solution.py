@@ -1,53 +1,52 @@
 # Props to https://github.com/villuna/aoc23/wiki/A-Geometric-solution-to-advent-of-code-2023,-day-21
 
-from collections import deque
-from typing import Sequence
+import sys
+from array import array
+from functools import partial
 
-type Grid[T] = Sequence[Sequence[T]]
-type Pair = tuple[int, int]
+from aoc.grid import Grid
+from aoc.search import bfs_levels
 
+ROCK = ord("#")
 
-def read_input(path: str) -> tuple[Grid[str], Pair]:
-    with open(path) as f:
-        s = f.read()
-    grid = [[x for x in line] for line in s.splitlines()]
+# The garden, fenced off with rocks, and the start's index.
+type Garden = tuple[Grid, int]
 
-    source = next(
-        (i, j)
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] == "S"
-    )
-
-    return grid, source
-
-
-def distances(grid: Grid[str], source: Pair) -> dict[Pair, int]:
-    m, n = len(grid), len(grid[0])
 
-    dists: dict[Pair, int] = {}
-    q: deque[tuple[Pair, int]] = deque([(source, 0)])
+def read_input(path: str) -> Garden:
+    grid = Grid.read(path, fill=b"#")
+    return grid, grid.cells.index(b"S")
 
-    while q:
-        (x, y), level = q.popleft()
 
-        if (x, y) in dists:
-            continue
-        dists[x, y] = level
+def plots_next_to(cells: bytes, steps: tuple[int, ...], seen: bytearray, frontier: list[int]) -> list[int]:
+    """The plots not yet seen next to any in `frontier`, which are marked seen."""
+    res = []
+    for p in frontier:
+        for step in steps:
+            q = p + step
+            if not seen[q] and cells[q] != ROCK:
+                seen[q] = 1
+                res.append(q)
+    return res
 
-        for dx, dy in (0, 1), (-1, 0), (0, -1), (1, 0):
-            xx, yy = x + dx, y + dy
-            if 0 <= xx < m and 0 <= yy < n and grid[xx][yy] != "#":
-                q.append(((xx, yy), level + 1))
 
+def distances(grid: Grid, source: int) -> array[int]:
+    """Steps from `source` to every reachable plot, in the order they are reached."""
+    seen = bytearray(len(grid.cells))
+    expand = partial(plots_next_to, grid.cells, grid.steps, seen)
+    dists = array("i")
+    for level, frontier in enumerate(bfs_levels([source], expand, seen)):
+        dists.extend([level] * len(frontier))
     return dists
 
 
-def main() -> None:
-    grid, source = read_input("./2023/day_21/input.txt")
+def part_1(garden: Garden) -> int:
+    dists = distances(*garden)
+    return sum(1 for d in dists if d <= 64 and d % 2 == 64 % 2)
+
 
-    dists = distances(grid, source)
-    part_1 = sum(1 for d in dists.values() if d <= 64 and d % 2 == 64 % 2)
+def part_2(garden: Garden) -> int:
+    dists = distances(*garden)
 
     source_steps, steps = divmod(26501365, 131)
     assert source_steps % 2 == 0 and steps == 65
@@ -55,20 +54,23 @@ def main() -> None:
     even_sources = source_steps**2
     odd_sources = (source_steps + 1) ** 2
 
-    reachables_even = sum(1 for d in dists.values() if d % 2 == 0)
-    reachables_odd = sum(1 for d in dists.values() if d % 2 == 1)
+    reachables_even = sum(1 for d in dists if d % 2 == 0)
+    reachables_odd = sum(1 for d in dists if d % 2 == 1)
 
-    even_corners = sum(1 for d in dists.values() if d > 65 and d % 2 == 0)
-    odd_corners = sum(1 for d in dists.values() if d > 65 and d % 2 == 1)
+    even_corners = sum(1 for d in dists if d > 65 and d % 2 == 0)
+    odd_corners = sum(1 for d in dists if d > 65 and d % 2 == 1)
 
-    part_2 = (
+    return (
         even_sources * reachables_even
         + odd_sources * reachables_odd
         - (source_steps + 1) * odd_corners
         + source_steps * even_corners
     )
 
-    print(f"{part_1 = }, {part_2 = }")
+
+def main() -> None:
+    garden = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(garden)}, part_2 = {part_2(garden)}")
 
 
 if __name__ == "__main__":
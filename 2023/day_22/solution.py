@@ -1,6 +1,9 @@
 import sys
 from dataclasses import dataclass
 from collections import defaultdict, deque, Counter
+from functools import partial
+
+from aoc.parallel import parallel_map
 
 
 @dataclass(slots=True, frozen=True)
@@ -61,18 +64,31 @@ def count_falls(brick_id: int, supportees: dict[int, set[int]]) -> int:
     return num_fallen
 
 
-def main():
-    file_path = sys.argv[1]
-    bricks = read_input(file_path)
+def safe_and_fallen(bricks: list[Brick]) -> tuple[int, int]:
     supportees = build_brick_graph(bricks)
-    part_1 = 0
-    part_2 = 0
-    for brick_id in range(len(bricks)):
-        num_fallen = count_falls(brick_id, supportees)
+    safe = 0
+    fallen = 0
+    falls = parallel_map(partial(count_falls, supportees=supportees), range(len(bricks)))
+    for num_fallen in falls:
         if num_fallen == 0:
-            part_1 += 1
+            safe += 1
         else:
-            part_2 += num_fallen
+            fallen += num_fallen
+    return safe, fallen
+
+
+def part_1(bricks: list[Brick]) -> int:
+    return safe_and_fallen(bricks)[0]
+
+
+def part_2(bricks: list[Brick]) -> int:
+    return safe_and_fallen(bricks)[1]
+
+
+def main():
+    file_path = sys.argv[1]
+    bricks = read_input(file_path)
+    part_1, part_2 = safe_and_fallen(bricks)
     print(f"{part_1 = } {part_2 = }")
 
 
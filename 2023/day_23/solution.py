@@ -1,36 +1,36 @@
+import sys
 from collections import defaultdict
 from collections.abc import Hashable
 
-type Pair = tuple[int, int]
+from aoc.grid import Grid
+
 type Graph[T: Hashable, W] = dict[T, dict[T, W]]
 
-DIRECTIONS = {">": (0, 1), "^": (-1, 0), "<": (0, -1), "v": (1, 0)}
+FOREST = ord("#")
 
 
-def read_input(file_path: str) -> list[str]:
-    with open(file_path) as f:
-        return f.read().splitlines()
+def read_input(file_path: str) -> Grid:
+    # A border of forest keeps the walks inside without bounds checks.
+    return Grid.read(file_path, fill=b"#")
 
 
-def junction_graph(
-    grid: list[str], source: Pair, target: Pair, slippery: bool
-) -> Graph[Pair, int]:
-    m, n = len(grid), len(grid[0])
+def junction_graph(grid: Grid, source: int, target: int, slippery: bool) -> Graph[int, int]:
+    cells = grid.cells
+    up, right, down, left = grid.steps
+    directions = right, up, left, down
+    # The step that each slope forces, by its byte.
+    downhill = dict(zip(b">^<v", directions))
     # dist from junction to junction
-    dist: Graph[Pair, int] = defaultdict(dict)
+    dist: Graph[int, int] = defaultdict(dict)
     # pos, from_junction, steps
-    stack: list[tuple[Pair, Pair, int]] = [(source, source, 0)]
+    stack: list[tuple[int, int, int]] = [(source, source, 0)]
     # pos, from_junction
-    seen: set[tuple[Pair, Pair]] = {(source, source)}
+    seen: set[tuple[int, int]] = {(source, source)}
     while stack:
         u, junction, steps = stack.pop()
 
-        vs: list[tuple[Pair, Pair]] = [
-            (d, (v0, v1))
-            for d in DIRECTIONS.values()
-            if 0 <= (v0 := u[0] + d[0]) < m
-            and 0 <= (v1 := u[1] + d[1]) < n
-            and grid[v0][v1] != "#"
+        vs: list[tuple[int, int]] = [
+            (d, u + d) for d in directions if cells[u + d] != FOREST
         ]
         if len(vs) > 2 or u == target:
             assert u not in dist[junction]
@@ -42,11 +42,7 @@ def junction_graph(
             seen.add((junction, u))
 
         for d, v in vs:
-            if (
-                slippery
-                and grid[u[0]][u[1]] in DIRECTIONS
-                and d != DIRECTIONS[grid[u[0]][u[1]]]
-            ):
+            if slippery and cells[u] in downhill and d != downhill[cells[u]]:
                 continue
             if (v, junction) in seen:
                 continue
@@ -61,8 +57,8 @@ def max_dist[T](graph: Graph[T, int], source: T, target: T) -> int:
 
     def dfs(u: T, d: int) -> int:
         if u == target:
-            return d
-        seen.add(u)
+            return d  # trace: paths
+        seen.add(u)  # trace: nodes
         max_length = max(
             (dfs(v, d + graph[u][v]) for v in graph[u] if v not in seen),
             default=0,
@@ -73,22 +69,29 @@ def max_dist[T](graph: Graph[T, int], source: T, target: T) -> int:
     return dfs(source, 0)
 
 
-def main():
-    import sys
+def source_and_target(grid: Grid) -> tuple[int, int]:
+    m, _ = grid.shape
+    source = grid.cells.index(b".", grid.index(0, 0))
+    target = grid.cells.index(b".", grid.index(m - 1, 0))
+    return source, target
 
-    file_path = sys.argv[1]
-    grid = read_input(file_path)
-    m, n = len(grid), len(grid[0])
-    source: Pair = next((0, j) for j in range(n) if grid[0][j] == ".")
-    target: Pair = next((m - 1, j) for j in range(n) if grid[m - 1][j] == ".")
 
+def part_1(grid: Grid) -> int:
+    source, target = source_and_target(grid)
     slippery_dist = junction_graph(grid, source, target, slippery=True)
-    part_1 = max_dist(slippery_dist, source, target)
+    return max_dist(slippery_dist, source, target)
+
 
+def part_2(grid: Grid) -> int:
+    source, target = source_and_target(grid)
     non_slippery_dist = junction_graph(grid, source, target, slippery=False)
-    part_2 = max_dist(non_slippery_dist, source, target)
+    return max_dist(non_slippery_dist, source, target)
 
-    print(f"{part_1 = } {part_2 = }")
+
+def main():
+    file_path = sys.argv[1]
+    grid = read_input(file_path)
+    print(f"part_1 = {part_1(grid)} part_2 = {part_2(grid)}")
 
 
 if __name__ == "__main__":
@@ -1,87 +1,55 @@
-from copy import deepcopy
+import sys
 
+from aoc.linalg import INT64_MAX, Vector, bareiss_solve, solve_2x2
 
-def read_input(file_path: str) -> list[tuple[list[float], list[float]]]:
-    hailstones: list[tuple[list[float], list[float]]] = []
+type Hailstone = tuple[Vector, Vector]
+
+
+def read_input(file_path: str) -> list[Hailstone]:
+    hailstones: list[Hailstone] = []
     with open(file_path) as f:
         for line in f:
             p_str, dp_str = line.split("@", maxsplit=1)
-            p = list(map(float, p_str.split(",")))
-            dp = list(map(float, dp_str.split(",")))
+            p = list(map(int, p_str.split(",")))
+            dp = list(map(int, dp_str.split(",")))
             hailstones.append((p, dp))
     return hailstones
 
 
-def row_echelon(
-    a: list[list[float]], b: list[float]
-) -> tuple[list[list[float]], list[float]]:
-    a = deepcopy(a)
-    b = deepcopy(b)
-    m, n = len(a), len(a[0])
-    h, k = 0, 0
-    while h < m and k < n:
-        i_max = max(range(h, m), key=lambda i: abs(a[i][k]))
-        if a[i_max][k] == 0:
-            k += 1
-            continue
-        a[h], a[i_max] = a[i_max], a[h]
-        b[h], b[i_max] = b[i_max], b[h]
-        for i in range(h + 1, m):
-            f = a[i][k] / a[h][k]
-            a[i][k] = 0
-            for j in range(k + 1, n):
-                a[i][j] -= a[h][j] * f
-            b[i] -= b[h] * f
-        h += 1
-        k += 1
-    return a, b
-
-
-def unique_solve(a: list[list[float]], b: list[float]) -> list[float] | None:
-    assert len(a) == len(b)
-    m, n = len(a), len(a[0])
-    if m < n:
-        return None
-    a, b = row_echelon(a, b)
-    if any(a[i][i] == 0 for i in range(n)):
-        return None
-    sol = [float("nan")] * n
-    sol[n - 1] = b[n - 1] / a[n - 1][n - 1]
-    for i in reversed(range(n - 1)):
-        sol[i] = (b[i] - sum(a[i][j] * sol[j] for j in range(i + 1, n))) / a[i][i]
-    return sol
-
-
-def find_collision_point(
-    p: list[float], dp: list[float], q: list[float], dq: list[float]
-) -> list[float] | None:
-    # p + s dp = q + t dq
-    # [dp -dq][s t]^T = q - p
-    n = len(p)
-    a = [[dp[i], -dq[i]] for i in range(n)]
-    b = [q[i] - p[i] for i in range(n)]
-    ts = unique_solve(a, b)
-    if ts is None or ts[0] < 0 or ts[1] < 0:
-        return None
-    return [p[i] + ts[0] * dp[i] for i in range(len(p))]
-
-
-def find_num_collissions(hailstones: list[tuple[list[float], list[float]]]) -> int:
-    LB, UB = 200_000_000_000_000, 400_000_000_000_000
-    num_collissions = 0
-    for i in range(len(hailstones)):
-        for j in range(i + 1, len(hailstones)):
-            p, dp = hailstones[i]
-            q, dq = hailstones[j]
-            collision_point = find_collision_point(p[:2], dp[:2], q[:2], dq[:2])
-            if collision_point is not None and all(
-                LB <= x <= UB for x in collision_point
-            ):
-                num_collissions += 1
-    return num_collissions
-
-
-def cross_prod(u: list[float], v: list[float]) -> list[float]:
+def find_num_collissions(hailstones: list[Hailstone], lb: int, ub: int) -> int:
+    """Counts the pairs of hailstones whose paths cross, ahead of both, within the
+    test area in x and y. All pairs are solved at once, in exact arithmetic."""
+    import numpy as np
+
+    # Columns x, y, dx, dy.
+    stones = np.array([p[:2] + dp[:2] for p, dp in hailstones], dtype=object)
+    if max(map(abs, stones.flat), default=0) <= INT64_MAX:
+        stones = stones.astype(np.int64)
+    i, j = np.triu_indices(len(stones), k=1)
+    p, q = stones[i], stones[j]
+
+    # p + s dp = q + t dq, i.e. [dp -dq] [s t]^T = q - p
+    det, det_s, det_t = solve_2x2(
+        p[:, 2], -q[:, 2], p[:, 3], -q[:, 3], q[:, 0] - p[:, 0], q[:, 1] - p[:, 1]
+    )
+    # Flip the signs so that det > 0, then both times are ahead iff their
+    # numerators are non-negative. Parallel paths have det == 0.
+    sign = np.sign(det)
+    det, det_s, det_t = det * sign, det_s * sign, det_t * sign
+    ahead = np.flatnonzero((det > 0) & (det_s >= 0) & (det_t >= 0))
+
+    # The crossing is at p + dp det_s / det; compare it to the bounds times det.
+    # Those products overflow int64 at the puzzle's coordinates.
+    det, det_s = det[ahead].astype(object), det_s[ahead].astype(object)
+    p = p[ahead].astype(object)
+    x = p[:, 0] * det + p[:, 2] * det_s
+    y = p[:, 1] * det + p[:, 3] * det_s
+    lo, hi = lb * det, ub * det
+    inside = (lo <= x) & (x <= hi) & (lo <= y) & (y <= hi)
+    return int(np.count_nonzero(inside.astype(bool)))
+
+
+def cross_prod(u: Vector, v: Vector) -> Vector:
     return [
         u[1] * v[2] - u[2] * v[1],
         u[2] * v[0] - u[0] * v[2],
@@ -90,8 +58,8 @@ def cross_prod(u: list[float], v: list[float]) -> list[float]:
 
 
 def generate_system(
-    p1: list[float], dp1: list[float], p2: list[float], dp2: list[float]
-) -> tuple[list[list[float]], list[float]]:
+    p1: Vector, dp1: Vector, p2: Vector, dp2: Vector
+) -> tuple[list[list[int]], Vector]:
     c = [a - b for a, b in zip(cross_prod(p1, dp1), cross_prod(p2, dp2))]
     a = [b - a for a, b in zip(dp1, dp2)]
     b = [a - b for a, b in zip(p1, p2)]
@@ -103,9 +71,7 @@ def generate_system(
     return mat, c
 
 
-def find_rock(
-    hailstones: list[tuple[list[float], list[float]]],
-) -> tuple[list[int], list[int]]:
+def find_rock(hailstones: list[Hailstone]) -> tuple[Vector, Vector]:
     # We want to find q, dq given that
     # q + t dq = p + t dp for all p, dp
     # This is equivalent to:
@@ -133,21 +99,27 @@ def find_rock(
     mat = mat1 + mat2
     c = c1 + c2
 
-    sol_approx = unique_solve(mat, c)
-    assert sol_approx is not None
-    sol = list(map(round, sol_approx))
+    solved = bareiss_solve(mat, c)
+    assert solved is not None
+    numerators, det = solved
+    assert all(x % det == 0 for x in numerators)
+    sol = [x // det for x in numerators]
     q, dq = sol[:3], sol[3:]
     return q, dq
 
 
-def main():
-    import sys
+def part_1(hailstones: list[Hailstone]) -> int:
+    return find_num_collissions(hailstones, 200_000_000_000_000, 400_000_000_000_000)
+
 
+def part_2(hailstones: list[Hailstone]) -> int:
+    return sum(find_rock(hailstones)[0])
+
+
+def main():
     file_path = sys.argv[1]
     hailstones = read_input(file_path)
-    part_1 = find_num_collissions(hailstones)
-    part_2 = sum(find_rock(hailstones)[0])
-    print(f"{part_1 = }, {part_2 =}")
+    print(f"part_1 = {part_1(hailstones)}, part_2 ={part_2(hailstones)}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 # Assuming that the graph has a Unique minimum cut of Three edges.
 
+import sys
 from collections import defaultdict
 
 type Graph = dict[str, set[str]]
@@ -42,11 +43,14 @@ def split(graph: Graph) -> tuple[set[str], set[str]]:
         nodeset.remove(max_leaker)
 
 
-def main() -> None:
-    graph = read_input("input.txt")
+def part_1(graph: Graph) -> int:
     nodeset_1, nodeset_2 = split(graph)
-    part_1 = len(nodeset_1) * len(nodeset_2)
-    print(f"{part_1 = }")
+    return len(nodeset_1) * len(nodeset_2)
+
+
+def main() -> None:
+    graph = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(graph)}")
 
 
 if __name__ == "__main__":
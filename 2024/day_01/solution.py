@@ -24,12 +24,20 @@ def similarity_score(left: Iterable[int], right: Iterable[int]) -> int:
     return sum(x * right_counter[x] for x in left)
 
 
+def part_1(lists: tuple[list[int], list[int]]) -> int:
+    left, right = lists
+    return total_distance(left, right)
+
+
+def part_2(lists: tuple[list[int], list[int]]) -> int:
+    left, right = lists
+    return similarity_score(left, right)
+
+
 def main() -> None:
     file = sys.argv[1]
-    left, right = read_input(file)
-    part_1 = total_distance(left, right)
-    part_2 = similarity_score(left, right)
-    print(f"{part_1 = } {part_2 = }")
+    lists = read_input(file)
+    print(f"part_1 = {part_1(lists)} part_2 = {part_2(lists)}")
 
 
 if __name__ == "__main__":
@@ -29,12 +29,18 @@ def is_safe(report: list[int], tolerate: bool) -> bool:
     return is_safe_asc(report, tolerate) or is_safe_asc(report[::-1], tolerate)
 
 
+def part_1(reports: list[list[int]]) -> int:
+    return sum(is_safe(report, tolerate=False) for report in reports)
+
+
+def part_2(reports: list[list[int]]) -> int:
+    return sum(is_safe(report, tolerate=True) for report in reports)
+
+
 def main() -> None:
     file = sys.argv[1]
     reports = read_input(file)
-    part_1 = sum(is_safe(report, tolerate=False) for report in reports)
-    part_2 = sum(is_safe(report, tolerate=True) for report in reports)
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(reports)} part_2 = {part_2(reports)}")
 
 
 if __name__ == "__main__":
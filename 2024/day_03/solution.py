@@ -2,20 +2,27 @@ from os import PathLike
 import sys
 import re
 
+from aoc.reader import iter_chunks, mapped
 
-def read_input(file: str | PathLike[str]) -> str:
-    with open(file) as f:
-        return f.read()
 
+def read_input(file: str | PathLike[str]) -> str | PathLike[str]:
+    """The parts map the file into memory and scan it in place, one line-aligned
+    chunk at a time, rather than reading it whole. No instruction spans a line
+    break, so none is split between two chunks."""
+    return file
 
-def sum_mul(memory: str) -> int:
-    pattern = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
-    return sum(int(m[1]) * int(m[2]) for m in pattern.finditer(memory))
 
+def sum_mul(file: str | PathLike[str]) -> int:
+    pattern = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+    with mapped(file) as memory:
+        return sum(
+            int(m[1]) * int(m[2]) for chunk in iter_chunks(memory) for m in pattern.finditer(chunk)
+        )
 
-def sum_mul_enabled(memory: str) -> int:
+
+def sum_mul_enabled(file: str | PathLike[str]) -> int:
     pattern = re.compile(
-        r"""
+        rb"""
         (?P<enable> do\(\))
         | (?P<disable> don't\(\))
         | mul\( (?P<x> \d{1,3}) , (?P<y> \d{1,3}) \)
@@ -24,23 +31,30 @@ def sum_mul_enabled(memory: str) -> int:
     )
     total = 0
     enable = True
-    for m in pattern.finditer(memory):
-        if m["enable"] is not None:
-            enable = True
-        elif m["disable"] is not None:
-            enable = False
-        else:
-            if enable:
-                total += int(m["x"]) * int(m["y"])
+    with mapped(file) as memory:
+        for chunk in iter_chunks(memory):
+            for m in pattern.finditer(chunk):
+                if m["enable"] is not None:
+                    enable = True
+                elif m["disable"] is not None:
+                    enable = False
+                else:
+                    if enable:
+                        total += int(m["x"]) * int(m["y"])
     return total
 
 
+def part_1(file: str | PathLike[str]) -> int:
+    return sum_mul(file)
+
+
+def part_2(file: str | PathLike[str]) -> int:
+    return sum_mul_enabled(file)
+
+
 def main():
-    file = sys.argv[1]
-    memory = read_input(file)
-    part_1 = sum_mul(memory)
-    part_2 = sum_mul_enabled(memory)
-    print(f"{part_1 = } {part_2 = }")
+    file = read_input(sys.argv[1])
+    print(f"part_1 = {part_1(file)} part_2 = {part_2(file)}")
 
 
 if __name__ == "__main__":
@@ -1,63 +1,57 @@
 import sys
 from os import PathLike
 
+from aoc.grid import Grid
 
-def read_input(file: str | PathLike[str]) -> list[str]:
-    with open(file) as f:
-        return f.readlines()
+# Enough padding that every word that starts inside the grid ends in it or in
+# the padding, so the searches need no bounds checks.
+PAD = 3
 
 
-def count_xmas(grid: list[str]) -> int:
-    rm = range(len(grid))
-    rn = range(len(grid[0]))
-    directions = (0, 1), (1, 0), (-1, 0), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)
+def read_input(file: str | PathLike[str]) -> Grid:
+    return Grid.read(file, pad=PAD, fill=b".")
+
+
+def count_xmas(grid: Grid) -> int:
+    cells = grid.cells
+    m, a, s = b"MAS"
 
     res = 0
-    x_positions = ((i, j) for i in rm for j in rn if grid[i][j] == "X")
-    for i, j in x_positions:
-        for dx, dy in directions:
-            if all(
-                (x := i + k * dx) in rm
-                and (y := j + k * dy) in rn
-                and grid[x][y] == "XMAS"[k]
-                for k in range(1, 4)
-            ):
+    for i in grid.find_all(b"X"):
+        for d in grid.all_steps:
+            if cells[i + d] == m and cells[i + 2 * d] == a and cells[i + 3 * d] == s:
                 res += 1
     return res
 
 
-def count_x_mas(grid: list[str]) -> int:
-    rm = range(len(grid))
-    rn = range(len(grid[0]))
+def count_x_mas(grid: Grid) -> int:
+    cells, width = grid.cells, grid.width
+    # Both diagonals through the A must read MAS one way or the other. M and S
+    # are the only two letters of XMAS, or padding, that xor to this.
+    ms = ord("M") ^ ord("S")
 
     res = 0
-    a_positions = ((i, j) for i in rm for j in rn if grid[i][j] == "A")
-    for i, j in a_positions:
+    for i in grid.find_all(b"A"):
         if (
-            (tli := i - 1) in rm
-            and (tlj := j - 1) in rn
-            and (bri := i + 1) in rm
-            and (brj := j + 1) in rn
-            and (tri := i - 1) in rm
-            and (trj := j + 1) in rn
-            and (bli := i + 1) in rm
-            and (blj := j - 1) in rn
-            and (
-                ord(grid[tli][tlj]) ^ ord(grid[bri][brj]) ^ ord("M") ^ ord("S")
-                | ord(grid[tri][trj]) ^ ord(grid[bli][blj]) ^ ord("M") ^ ord("S")
-                == 0
-            )
+            cells[i - width - 1] ^ cells[i + width + 1] == ms
+            and cells[i - width + 1] ^ cells[i + width - 1] == ms
         ):
             res += 1
     return res
 
 
+def part_1(grid: Grid) -> int:
+    return count_xmas(grid)
+
+
+def part_2(grid: Grid) -> int:
+    return count_x_mas(grid)
+
+
 def main():
     file = sys.argv[1]
     grid = read_input(file)
-    part_1 = count_xmas(grid)
-    part_2 = count_x_mas(grid)
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(grid)} part_2 = {part_2(grid)}")
 
 
 if __name__ == "__main__":
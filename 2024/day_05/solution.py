@@ -45,23 +45,35 @@ def cmp_key_from_graph(graph: Graph):
     return cmp_to_key(cmp)
 
 
-def main():
-    file_path = sys.argv[1]
-    rules, manuals = read_input(file_path)
-
+def sum_middle_pages(rules: list[Rule], manuals: list[Manual]) -> tuple[int, int]:
     graph = graph_from_rules(rules)
     cmp_key = cmp_key_from_graph(graph)
 
-    part_1 = 0
-    part_2 = 0
+    ordered = 0
+    reordered = 0
     for manual in manuals:
         sorted_manual = sorted(manual, key=cmp_key)
         mid = sorted_manual[len(sorted_manual) // 2]
         if sorted_manual == manual:
-            part_1 += mid
+            ordered += mid
         else:
-            part_2 += mid
+            reordered += mid
+
+    return ordered, reordered
+
+
+def part_1(data: tuple[list[Rule], list[Manual]]) -> int:
+    return sum_middle_pages(*data)[0]
 
+
+def part_2(data: tuple[list[Rule], list[Manual]]) -> int:
+    return sum_middle_pages(*data)[1]
+
+
+def main():
+    file_path = sys.argv[1]
+    rules, manuals = read_input(file_path)
+    part_1, part_2 = sum_middle_pages(rules, manuals)
     print(f"{part_1 = } {part_2 = }")
 
 
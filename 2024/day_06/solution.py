@@ -1,84 +1,89 @@
 import sys
-
-
-def read_input(file_path: str) -> list[str]:
-    with open(file_path) as f:
-        return f.read().splitlines()
-
-
-def find_initial_position_and_direction(
-    grid: list[str],
-) -> tuple[tuple[int, int], tuple[int, int]]:
-    directions = {">": (0, 1), "v": (1, 0), "<": (0, -1), "^": (-1, 0)}
-    position = next(
-        (i, j)
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] in directions
-    )
-    direction = directions[grid[position[0]][position[1]]]
-    return position, direction
-
-
-def visit(
-    grid: list[str],
-    initial_position: tuple[int, int],
-    initial_direction: tuple[int, int],
-) -> set[tuple[int, int]]:
-    m = len(grid)
-    n = len(grid[0])
-    i, j = initial_position
-    di, dj = initial_direction
-
-    visited: set[tuple[int, int]] = {(i, j)}
-
-    while 0 <= i < m and 0 <= j < n:
-        if grid[i][j] == "#":
-            i, j = i - di, j - dj
-            di, dj = dj, -di
+from functools import partial
+from itertools import compress
+
+from aoc.grid import Grid
+from aoc.parallel import parallel_map
+
+# The border of the lab's grid.
+OUTSIDE = ord("\n")
+OBSTACLE = ord("#")
+# In the order of `Grid.steps`.
+DIRECTIONS = "^>v<"
+
+
+def read_input(file_path: str) -> Grid:
+    return Grid.read(file_path)
+
+
+def find_initial_position_and_direction(cells: bytes) -> tuple[int, int]:
+    position = next(i for i, c in enumerate(cells) if chr(c) in DIRECTIONS)
+    return position, DIRECTIONS.index(chr(cells[position]))
+
+
+def visit(lab: Grid, position: int, direction: int) -> bytearray:
+    """Marks the cells that the guard walks over with a 1, in a bytearray laid out
+    like the lab's cells."""
+    cells = lab.cells
+    steps = lab.steps
+    visited = bytearray(len(cells))
+    visited[position] = 1
+    step = steps[direction]
+    while True:
+        c = cells[position + step]
+        if c == OBSTACLE:
+            direction = (direction + 1) % 4
+            step = steps[direction]
+        elif c == OUTSIDE:
+            return visited
         else:
-            visited.add((i, j))
-        i, j = i + di, j + dj
-
-    return visited
+            position += step
+            visited[position] = 1
+
+
+def has_loop(cells: bytearray, steps: tuple[int, ...], position: int, direction: int) -> bool:
+    # A loop has to bump into the same obstacle from the same side twice, so
+    # only the turns need remembering.
+    turned = bytearray(len(cells))
+    step = steps[direction]
+    while True:
+        c = cells[position + step]
+        if c == OBSTACLE:
+            if turned[position] >> direction & 1:
+                return True
+            turned[position] |= 1 << direction
+            direction = (direction + 1) % 4
+            step = steps[direction]
+        elif c == OUTSIDE:
+            return False
+        else:
+            position += step
 
 
-def has_loop(
-    grid: list[str],
-    initial_position: tuple[int, int],
-    initial_direction: tuple[int, int],
-    extra_obstacle: tuple[int, int],
-) -> bool:
-    m = len(grid)
-    n = len(grid[0])
-    i, j = initial_position
-    di, dj = initial_direction
+def loops_with_obstacle(lab: Grid, position: int, direction: int, obstacle: int) -> bool:
+    with_obstacle = bytearray(lab.cells)
+    with_obstacle[obstacle] = OBSTACLE
+    return has_loop(with_obstacle, lab.steps, position, direction)
 
-    visited: set[tuple[int, int, int, int]] = set()
 
-    while 0 <= i < m and 0 <= j < n:
-        if (i, j, di, dj) in visited:
-            return True
+def part_1(lab: Grid) -> int:
+    position, direction = find_initial_position_and_direction(lab.cells)
+    return visit(lab, position, direction).count(1)
 
-        if grid[i][j] == "#" or (i, j) == extra_obstacle:
-            i, j = i - di, j - dj
-            di, dj = dj, -di
-        else:
-            visited.add((i, j, di, dj))
-        i, j = i + di, j + dj
 
-    return False
+def part_2(lab: Grid) -> int:
+    position, direction = find_initial_position_and_direction(lab.cells)
+    visited = visit(lab, position, direction)
+    # The guard would see an obstacle placed where they stand.
+    visited[position] = 0
+    obstacles = compress(range(len(visited)), visited)
+    return sum(parallel_map(partial(loops_with_obstacle, lab, position, direction), obstacles))
 
 
 def main():
     file_path = sys.argv[1]
-    grid = read_input(file_path)
-    position, direction = find_initial_position_and_direction(grid)
-    visited = visit(grid, position, direction)
-    part_1 = len(visited)
-    part_2 = sum(has_loop(grid, position, direction, obstacle) for obstacle in visited)
-
-    print(f"{part_1 = }, {part_2 = }")
+    lab = read_input(file_path)
+    print(f"part_1 = {part_1(lab)}, part_2 = {part_2(lab)}")
 
 
 if __name__ == "__main__":
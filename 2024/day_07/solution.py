@@ -1,4 +1,7 @@
 import sys
+from functools import partial
+
+from aoc.parallel import parallel_map
 
 
 def read_input(file_path: str) -> list[tuple[int, list[int]]]:
@@ -23,12 +26,12 @@ def concat(left: int, right: int) -> int:
 def is_valid(expected: int, nums: list[int], with_concat: bool) -> bool:
     stack = [(1, nums[0])]
     while stack:
-        level, evaluation = stack.pop()
+        level, evaluation = stack.pop()  # trace: nodes, max len(stack)
         if level == len(nums):
             if evaluation == expected:
                 return True
         elif evaluation > expected:  # perf
-            continue
+            continue  # trace: prunes
         else:
             stack.append((level + 1, evaluation * nums[level]))
             stack.append((level + 1, evaluation + nums[level]))
@@ -38,20 +41,24 @@ def is_valid(expected: int, nums: list[int], with_concat: bool) -> bool:
     return False
 
 
+def calibration_result(equations: list[tuple[int, list[int]]], with_concat: bool) -> int:
+    expecteds, numss = zip(*equations)
+    valid = parallel_map(partial(is_valid, with_concat=with_concat), expecteds, numss)
+    return sum(expected for expected, ok in zip(expecteds, valid) if ok)
+
+
+def part_1(equations: list[tuple[int, list[int]]]) -> int:
+    return calibration_result(equations, with_concat=False)
+
+
+def part_2(equations: list[tuple[int, list[int]]]) -> int:
+    return calibration_result(equations, with_concat=True)
+
+
 def main():
     file_path = sys.argv[1]
     equations = read_input(file_path)
-    part_1 = sum(
-        expected
-        for expected, nums in equations
-        if is_valid(expected, nums, with_concat=False)
-    )
-    part_2 = sum(
-        expected
-        for expected, nums in equations
-        if is_valid(expected, nums, with_concat=True)
-    )
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(equations)} part_2 = {part_2(equations)}")
 
 
 if __name__ == "__main__":
@@ -45,12 +45,18 @@ def find_unique_antinodes(
     return antinodes
 
 
+def part_1(grid: list[str]) -> int:
+    return len(find_unique_antinodes(grid, min_k=1, max_k=1))
+
+
+def part_2(grid: list[str]) -> int:
+    return len(find_unique_antinodes(grid, min_k=0, max_k=None))
+
+
 def main():
     file_path = sys.argv[1]
     grid = read_input(file_path)
-    part_1 = len(find_unique_antinodes(grid, min_k=1, max_k=1))
-    part_2 = len(find_unique_antinodes(grid, min_k=0, max_k=None))
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(grid)} part_2 = {part_2(grid)}")
 
 
 if __name__ == "__main__":
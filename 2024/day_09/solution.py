@@ -109,19 +109,22 @@ def read_input(file_path: str) -> list[int]:
     return disk_list
 
 
-def main():
-    file_path = sys.argv[1]
-    disk_list = read_input(file_path)
-
+def part_1(disk_list: list[int]) -> int:
     disk = Disk.from_seq(disk_list)
     disk.compact_with_frag()
-    part_1 = disk.checksum()
+    return disk.checksum()
+
 
+def part_2(disk_list: list[int]) -> int:
     disk = Disk.from_seq(disk_list)
     disk.compact_without_frag()
-    part_2 = disk.checksum()
+    return disk.checksum()
 
-    print(f"{part_1 = } {part_2 = }")
+
+def main():
+    file_path = sys.argv[1]
+    disk_list = read_input(file_path)
+    print(f"part_1 = {part_1(disk_list)} part_2 = {part_2(disk_list)}")
 
 
 if __name__ == "__main__":
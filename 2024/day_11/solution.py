@@ -1,6 +1,7 @@
-import functools
 import sys
 
+from aoc.memo import memoize
+
 
 def read_input(file_path: str) -> list[int]:
     with open(file_path) as f:
@@ -23,7 +24,10 @@ def rsplit_int(n: int, position: int, base: int = 10) -> tuple[int, int]:
     return divmod(n, divisor)
 
 
-@functools.cache
+# Enough for every (rock, blinks) pair of a real input, so nothing is evicted
+# while it is still needed, but bounded for inputs with far more distinct rocks.
+# The counts hold whatever the input, so they carry over from one to the next.
+@memoize(maxsize=2**18, scope="process")
 def blink(rock: int, nblinks: int) -> int:
     if nblinks == 0:
         return 1
@@ -36,12 +40,18 @@ def blink(rock: int, nblinks: int) -> int:
         return blink(2024 * rock, nblinks - 1)
 
 
+def part_1(rocks: list[int]) -> int:
+    return sum(blink(rock, 25) for rock in rocks)
+
+
+def part_2(rocks: list[int]) -> int:
+    return sum(blink(rock, 75) for rock in rocks)
+
+
 def main():
     file_path = sys.argv[1]
     rocks = read_input(file_path)
-    part_1 = sum(blink(rock, 25) for rock in rocks)
-    part_2 = sum(blink(rock, 75) for rock in rocks)
-    print(f"{part_1} {part_2}")
+    print(f"{part_1(rocks)} {part_2(rocks)}")
 
 
 if __name__ == "__main__":
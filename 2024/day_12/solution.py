@@ -1,64 +1,48 @@
 import sys
-import itertools
 
+from aoc.grid import Grid
 
-def read_input(file_path: str) -> list[str]:
-    with open(file_path) as f:
-        return f.read().splitlines()
 
+def read_input(file_path: str) -> Grid:
+    # The border of newlines stands for the outside, which is no plant's region.
+    return Grid.read(file_path)
 
-def is_opposite(u: tuple[int, int], v: tuple[int, int]) -> bool:
-    return u == (-v[0], -v[1])
 
-
-def fencing_prices(grid: list[str]) -> tuple[int, int]:
-    directions = (1, 0), (0, 1), (-1, 0), (0, -1)
-    rm, rn = range(len(grid)), range(len(grid[0]))
-    visited = [[False for _ in rn] for _ in rm]
+def fencing_prices(garden: Grid) -> tuple[int, int]:
+    cells = garden.cells
+    directions = garden.steps
+    # Each direction with the one after it, turning the same way round.
+    corner_pairs = list(zip(directions, directions[1:] + directions[:1]))
+    visited = bytearray(len(cells))
     part_1 = 0
     part_2 = 0
-    for start_i, start_j in itertools.product(rm, rn):
-        if visited[start_i][start_j]:
+    for start, plant in enumerate(cells):
+        if visited[start] or plant == ord("\n"):
             continue
-        stack = [(start_i, start_j)]
-        visited[start_i][start_j] = True
+        stack = [start]
+        visited[start] = True
         area = 0
         perimeter = 0
         corners = 0
         while stack:
-            i, j = stack.pop()
+            p = stack.pop()
             area += 1
 
-            def is_foreign(x: int, y: int) -> bool:
-                return x not in rm or y not in rm or grid[x][y] != grid[i][j]
-
-            # Compute corners
-            neighbors = [
-                (di, dj) for di, dj in directions if not is_foreign(i + di, j + dj)
-            ]
-            if len(neighbors) == 0:
-                corners += 4
-            elif len(neighbors) == 1:
-                corners += 2
-            elif len(neighbors) == 2:
-                a, b = neighbors
-                if not is_opposite(a, b):
-                    corners += is_foreign(i + a[0] + b[0], j + a[1] + b[1]) + (
-                        is_foreign(i - a[0], j - a[1])
-                        and is_foreign(i - b[0], j - b[1])
-                    )
-            else:
-                for a, b in itertools.combinations(neighbors, 2):
-                    corners += not is_opposite(a, b) and is_foreign(
-                        i + a[0] + b[0], j + a[1] + b[1]
-                    )
-
-            for di, dj in directions:
-                x, y = i + di, j + dj
-                if not is_foreign(x, y):
-                    if not visited[x][y]:
-                        stack.append((x, y))
-                        visited[x][y] = True
+            # A corner is either convex, with neither side in the region, or
+            # concave, with both sides but not the diagonal between them.
+            for a, b in corner_pairs:
+                in_a = cells[p + a] == plant
+                in_b = cells[p + b] == plant
+                corners += (not in_a and not in_b) or (
+                    in_a and in_b and cells[p + a + b] != plant
+                )
+
+            for d in directions:
+                q = p + d
+                if cells[q] == plant:
+                    if not visited[q]:
+                        stack.append(q)
+                        visited[q] = True
                 else:
                     perimeter += 1
 
@@ -68,10 +52,18 @@ def fencing_prices(grid: list[str]) -> tuple[int, int]:
     return part_1, part_2
 
 
+def part_1(garden: Grid) -> int:
+    return fencing_prices(garden)[0]
+
+
+def part_2(garden: Grid) -> int:
+    return fencing_prices(garden)[1]
+
+
 def main():
     file_path = sys.argv[1]
-    grid = read_input(file_path)
-    part_1, part_2 = fencing_prices(grid)
+    garden = read_input(file_path)
+    part_1, part_2 = fencing_prices(garden)
     print(f"{part_1 = } {part_2 = }")
 
 
@@ -1,62 +1,98 @@
 import re
-from dataclasses import dataclass, replace
 import sys
-from typing import Self
-
-
-@dataclass(slots=True)
-class ClawMachine:
-    button_a: tuple[int, int]
-    button_b: tuple[int, int]
-    prize: tuple[int, int]
-
-    def min_winning_coins(self) -> int | None:
-        (a11, a21), (a12, a22) = self.button_a, self.button_b
-        b1, b2 = self.prize
-        det = a11 * a22 - a21 * a12
-
-        if det == 0:
-            q, r = divmod(b1, a12)
-            if r == 0:
-                return q
-        else:
-            det1 = b1 * a22 - b2 * a12
-            det2 = a11 * b2 - a21 * b1
-            q1, r = divmod(det1, det)
-            q2 = det2 // det
-            if r == 0:
-                return 3 * q1 + q2
+from typing import TYPE_CHECKING
 
+import numpy as np
+
+from aoc.linalg import solve_2x2
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# One row per machine, with columns ax, ay, bx, by, px, py.
+type Machines = npt.NDArray[np.int64]
+CORRECTION = 10_000_000_000_000
+NUMBER = re.compile(r"\d+")
+
+
+def extended_gcd(a: int, b: int) -> tuple[int, int, int]:
+    """`g, u, v` such that `g = gcd(a, b) = a u + b v`."""
+    u0, u1, v0, v1 = 1, 0, 0, 1
+    while b:
+        q, a, b = a // b, b, a % b
+        u0, u1 = u1, u0 - q * u1
+        v0, v1 = v1, v0 - q * v1
+    return a, u0, v0
+
+
+def min_coins_collinear(ax: int, ay: int, bx: int, by: int, px: int, py: int) -> int | None:
+    """The cheapest win on a machine whose buttons move along the same line.
+
+    If the prize is on that line too, the presses are the non-negative solutions
+    of `ax i + bx j = px`, which form an arithmetic progression along which the
+    cost `3 i + j` changes linearly, so the cheapest is at one of its ends.
+    """
+    if ax * py != ay * px:
+        return None
+    g, u, v = extended_gcd(ax, bx)
+    if px % g:
         return None
+    i0, j0 = u * (px // g), v * (px // g)
+    # i = i0 + di k and j = j0 - dj k, for any integer k.
+    di, dj = bx // g, ax // g
+    k_min, k_max = -(i0 // di), j0 // dj
+    if k_min > k_max:
+        return None
+    k = k_min if 3 * di > dj else k_max
+    return 3 * (i0 + di * k) + (j0 - dj * k)
+
 
-    def corrected(self) -> Self:
-        incr = 10_000_000_000_000
-        corrected_prize = (self.prize[0] + incr, self.prize[1] + incr)
-        return replace(self, prize=corrected_prize)
+def min_winning_coins(machines: Machines) -> int:
+    """The fewest coins to win every prize that can be won, over all machines.
 
+    The presses of each machine solve a 2x2 system, which is solved for all
+    machines at once, exactly. The rare machines with parallel buttons are left
+    to `min_coins_collinear`.
+    """
+    ax, ay, bx, by, px, py = machines.T
+    det, det_a, det_b = solve_2x2(ax, bx, ay, by, px, py)
+    regular = det != 0
+    divisor = np.where(regular, det, 1)
+    presses_a, presses_b = det_a // divisor, det_b // divisor
+    won = (
+        regular
+        & (det_a % divisor == 0)
+        & (det_b % divisor == 0)
+        & (presses_a >= 0)
+        & (presses_b >= 0)
+    )
+    coins = int((3 * presses_a + presses_b)[won.astype(bool)].sum())
+    for machine in machines[~regular.astype(bool)].tolist():
+        coins += min_coins_collinear(*machine) or 0
+    return coins
 
-def read_input(file_path: str) -> list[ClawMachine]:
+
+def read_input(file_path: str) -> Machines:
     with open(file_path) as f:
         s = f.read()
-    p = re.compile(
-        r"Button A: X\+(\d+), Y\+(\d+)\nButton B: X\+(\d+), Y\+(\d+)\nPrize: X=(\d+), Y=(\d+)"
-    )
-    return [
-        ClawMachine(
-            button_a=(int(m[1]), int(m[2])),
-            button_b=(int(m[3]), int(m[4])),
-            prize=(int(m[5]), int(m[6])),
-        )
-        for m in p.finditer(s)
-    ]
+    numbers = np.fromiter(map(int, NUMBER.findall(s)), dtype=np.int64)
+    return numbers.reshape(-1, 6)
+
+
+def part_1(machines: Machines) -> int:
+    return min_winning_coins(machines)
+
+
+def part_2(machines: Machines) -> int:
+    corrected = machines.copy()
+    corrected[:, 4:] += CORRECTION
+    return min_winning_coins(corrected)
 
 
 def main():
     file_path = sys.argv[1]
     machines = read_input(file_path)
-    part_1 = sum(machine.min_winning_coins() or 0 for machine in machines)
-    part_2 = sum(machine.corrected().min_winning_coins() or 0 for machine in machines)
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(machines)} part_2 = {part_2(machines)}")
 
 
 if __name__ == "__main__":
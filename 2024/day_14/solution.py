@@ -2,8 +2,6 @@ from dataclasses import dataclass, replace
 import re
 import sys
 from typing import Self
-import numpy as np
-from PIL import Image
 
 
 @dataclass(slots=True)
@@ -38,6 +36,10 @@ def robots_density(robots: list[Robot]) -> float:
 
 
 def plot_grid(robots: list[Robot], bounds: tuple[int, int], steps: int) -> None:
+    # Only main() draws the tree, so the parts do not pay for importing these.
+    import numpy as np
+    from PIL import Image
+
     grid = np.zeros(bounds, dtype=np.bool_)
     for robot in robots:
         i, j = robot.move(steps, bounds).position
@@ -66,22 +68,30 @@ def read_input(file_path: str) -> list[Robot]:
     return robots
 
 
-def main():
-    file_path = sys.argv[1]
-    bounds = (103, 101)
-    robots = read_input(file_path)
+BOUNDS = (103, 101)
+
+
+def part_1(robots: list[Robot]) -> int:
+    return safety_factor(robots, BOUNDS, 100)
 
-    part_1 = safety_factor(robots, bounds, 100)
-    _, part_2 = min(
+
+def part_2(robots: list[Robot]) -> int:
+    _, steps = min(
         (
-            robots_density([robot.move(steps, bounds) for robot in robots]),
+            robots_density([robot.move(steps, BOUNDS) for robot in robots]),
             steps,
         )
-        for steps in range(bounds[0] * bounds[1])
+        for steps in range(BOUNDS[0] * BOUNDS[1])
     )
+    return steps
+
 
-    plot_grid(robots, bounds, part_2)
-    print(f"{part_1 = } {part_2 = }")
+def main():
+    file_path = sys.argv[1]
+    robots = read_input(file_path)
+    steps = part_2(robots)
+    plot_grid(robots, BOUNDS, steps)
+    print(f"part_1 = {part_1(robots)} part_2 = {steps}")
 
 
 if __name__ == "__main__":
@@ -1,114 +1,105 @@
 import sys
 
+from aoc.grid import Grid
 
-def read_input(
-    file_path: str, expanded: bool
-) -> tuple[list[list[str]], tuple[int, int], list[tuple[int, int]]]:
+
+def read_input(file_path: str) -> tuple[str, str]:
     with open(file_path) as f:
         grid_str, directions_str = f.read().split("\n\n")
+    return grid_str, directions_str
+
+
+def parse_warehouse(
+    grid_str: str, directions_str: str, expanded: bool
+) -> tuple[Grid, bytearray, int, list[int]]:
+    """The warehouse's grid, a copy of its cells to move the boxes in, the
+    robot's starting position, and the steps that it tries to take."""
     if expanded:
         trans = str.maketrans({"#": "##", ".": "..", "@": "@.", "O": "[]"})
         grid_str = grid_str.translate(trans)
-    grid = [list(line) for line in grid_str.splitlines()]
-    starting_position = next(
-        (i, j)
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] == "@"
-    )
-    grid[starting_position[0]][starting_position[1]] = "."
-    dmap = {">": (0, 1), "^": (-1, 0), "<": (0, -1), "v": (1, 0)}
+    grid = Grid.from_bytes(grid_str.encode(), fill=b"#")
+    cells = bytearray(grid.cells)
+    starting_position = cells.index(b"@")
+    cells[starting_position] = ord(".")
+    up, right, down, left = grid.steps
+    dmap = {">": right, "^": up, "<": left, "v": down}
     directions = [dmap[d] for d in directions_str.replace("\n", "")]
-    return grid, starting_position, directions
+    return grid, cells, starting_position, directions
 
 
-def can_move(
-    grid: list[list[str]], position: tuple[int, int], direction: tuple[int, int]
-) -> bool:
-    x, y = position
-    dx, dy = direction
-    xx, yy = x + dx, y + dy
+def can_move(cells: bytearray, position: int, step: int) -> bool:
+    p = position + step
 
-    match dx, grid[xx][yy]:
+    match abs(step) == 1, chr(cells[p]):
         case _, "#":
             return False
         case _, ".":
             return True
         case _, "O":
-            return can_move(grid, (xx, yy), direction)
-        case 0, "[" | "]":
-            return can_move(grid, (xx, yy), direction)
+            return can_move(cells, p, step)
+        case True, "[" | "]":
+            return can_move(cells, p, step)
         case _, "[":
-            return can_move(grid, (xx, yy), direction) and can_move(
-                grid, (xx, yy + 1), direction
-            )
+            return can_move(cells, p, step) and can_move(cells, p + 1, step)
         case _, "]":
-            return can_move(grid, (xx, yy), direction) and can_move(
-                grid, (xx, yy - 1), direction
-            )
-        case _:
-            raise ValueError(f"Invalid symbol {grid[xx][yy]}")
+            return can_move(cells, p, step) and can_move(cells, p - 1, step)
+        case _, c:
+            raise ValueError(f"Invalid symbol {c}")
 
 
-def unsafe_single_step_move(
-    grid: list[list[str]], position: tuple[int, int], direction: tuple[int, int]
-) -> None:
-    x, y = position
-    dx, dy = direction
-    xx, yy = x + dx, y + dy
+def unsafe_single_step_move(cells: bytearray, position: int, step: int) -> None:
+    p = position + step
 
-    match dx, grid[xx][yy]:
+    match abs(step) == 1, chr(cells[p]):
         case _, "#":
             raise ValueError("Invalid Move")
         case _, ".":
             pass
         case _, "O":
-            unsafe_single_step_move(grid, (xx, yy), direction)
-        case 0, "[" | "]":
-            unsafe_single_step_move(grid, (xx, yy), direction)
+            unsafe_single_step_move(cells, p, step)
+        case True, "[" | "]":
+            unsafe_single_step_move(cells, p, step)
         case _, "[":
-            unsafe_single_step_move(grid, (xx, yy + 1), direction)
-            unsafe_single_step_move(grid, (xx, yy), direction)
+            unsafe_single_step_move(cells, p + 1, step)
+            unsafe_single_step_move(cells, p, step)
         case _, "]":
-            unsafe_single_step_move(grid, (xx, yy), direction)
-            unsafe_single_step_move(grid, (xx, yy - 1), direction)
-        case _:
-            raise ValueError(f"Invalid symbol {grid[xx][yy]}")
+            unsafe_single_step_move(cells, p, step)
+            unsafe_single_step_move(cells, p - 1, step)
+        case _, c:
+            raise ValueError(f"Invalid symbol {c}")
 
-    grid[x][y], grid[xx][yy] = grid[xx][yy], grid[x][y]
+    cells[position], cells[p] = cells[p], cells[position]
 
 
-def safe_multi_step_move(
-    grid: list[list[str]], position: tuple[int, int], directions: list[tuple[int, int]]
-) -> None:
+def safe_multi_step_move(cells: bytearray, position: int, directions: list[int]) -> None:
     p = position
-    for direction in directions:
-        if can_move(grid, p, direction):
-            unsafe_single_step_move(grid, p, direction)
-            p = (p[0] + direction[0], p[1] + direction[1])
+    for step in directions:
+        if can_move(cells, p, step):
+            unsafe_single_step_move(cells, p, step)
+            p += step
 
 
-def gps_sum(grid: list[list[str]]) -> int:
-    return sum(
-        100 * i + j
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] in {"O", "["}
-    )
+def gps_sum(grid: Grid, cells: bytearray) -> int:
+    boxes = (grid.coords(p) for p, c in enumerate(cells) if c in b"O[")
+    return sum(100 * i + j for i, j in boxes)
 
 
-def main():
-    file_path = sys.argv[1]
+def part_1(sections: tuple[str, str]) -> int:
+    grid, cells, position, directions = parse_warehouse(*sections, expanded=False)
+    safe_multi_step_move(cells, position, directions)
+    return gps_sum(grid, cells)
+
 
-    grid, position, directions = read_input(file_path, expanded=False)
-    safe_multi_step_move(grid, position, directions)
-    part_1 = gps_sum(grid)
+def part_2(sections: tuple[str, str]) -> int:
+    grid, cells, position, directions = parse_warehouse(*sections, expanded=True)
+    safe_multi_step_move(cells, position, directions)
+    return gps_sum(grid, cells)
 
-    grid, position, directions = read_input(file_path, expanded=True)
-    safe_multi_step_move(grid, position, directions)
-    part_2 = gps_sum(grid)
 
-    print(f"{part_1 = } {part_2 = }")
+def main():
+    file_path = sys.argv[1]
+    sections = read_input(file_path)
+    print(f"part_1 = {part_1(sections)} part_2 = {part_2(sections)}")
 
 
 if __name__ == "__main__":
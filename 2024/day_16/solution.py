@@ -1,104 +1,107 @@
 import sys
-from heapq import heappush, heappop
-
-type Grid = list[str]
-type Point = tuple[int, int]
-type Node = tuple[Point, Point]
-
-
-def read_input(
-    file_path: str,
-) -> tuple[Grid, Point, Point, Point]:
-    with open(file_path) as f:
-        grid = f.read().splitlines()
-    source = next(
-        (i, j)
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] == "S"
-    )
-    target = next(
-        (i, j)
-        for i in range(len(grid))
-        for j in range(len(grid[0]))
-        if grid[i][j] == "E"
-    )
-    direction = (0, 1)
-    return grid, source, target, direction
-
-
-def lowest_score(
-    grid: Grid, source: Point, target: Point, direction: Point
-) -> int | None:
-    # A*
-    def heurestic(source: Point, target: Point) -> int:
-        x_dist = abs(target[0] - source[0])
-        y_dist = abs(target[1] - source[1])
-        must_turn = (x_dist == 0) ^ (y_dist == 0)
-        return x_dist + y_dist + 1_000 * must_turn
-
-    dist: dict[Point, int] = {source: 0}
-    boundary: list[tuple[int, Node]] = [(0, (source, direction))]
-    while boundary:
-        f, (p, d) = heappop(boundary)
-        if p == target:
-            return f
-
-        for dd in d, (-d[1], d[0]), (d[1], -d[0]):
-            pp = (p[0] + dd[0], p[1] + dd[1])
-            if grid[pp[0]][pp[1]] == "#":
+from array import array
+
+from aoc.grid import Grid
+from aoc.search import UNREACHED, BucketQueue
+
+# The maze, and the indices of the start and the end tile.
+type Maze = tuple[Grid, int, int]
+
+WALL = ord("#")
+TURN_COST = 1_000
+
+
+def read_input(file_path: str) -> Maze:
+    grid = Grid.read(file_path)
+    return grid, grid.cells.index(b"S"), grid.cells.index(b"E")
+
+
+def moves(grid: Grid, reverse: bool) -> list[list[tuple[int, int]]]:
+    """How each move changes a state, and what it costs, by the direction faced.
+
+    A state is a tile and the direction the reindeer faces on it, encoded as
+    `4 * tile + direction`, with the directions east, south, west and north.
+    Each move steps forward, optionally after turning once. With `reverse`, the
+    moves lead back to the states that could have come before.
+    """
+    up, right, down, left = grid.steps
+    steps = right, down, left, up
+    table: list[list[tuple[int, int]]] = [[] for _ in range(4)]
+    for d in range(4):
+        for turn, cost in (0, 1), (1, TURN_COST + 1), (3, TURN_COST + 1):
+            dd = (d + turn) % 4
+            tile_change = -steps[d] if reverse else steps[dd]
+            table[d].append((4 * tile_change + dd - d, cost))
+    return table
+
+
+def scores(grid: Grid, source: int, until: int | None = None) -> array[int]:
+    """Dijkstra's algorithm from `source`, facing east, over the states of `moves`.
+
+    The search stops early once a state on the tile `until` has its score.
+    """
+    cells = grid.cells
+    forward = moves(grid, False)
+    queue = BucketQueue(4 * len(cells), TURN_COST + 1)
+    dist = queue.dist
+    push = queue.push
+    push(4 * source, 0)
+
+    for score, state in queue:
+        if state >> 2 == until:
+            break
+        for change, cost in forward[state & 3]:
+            next_state = state + change
+            if cells[next_state >> 2] == WALL:
                 continue
-            alt_dist = dist[p] + 1 + (1_000) * (d != dd)
-            if pp not in dist or alt_dist < dist[pp]:
-                dist[pp] = alt_dist
-                ff = alt_dist + heurestic(pp, target)
-                heappush(boundary, (ff, (pp, dd)))
-
-    return None
-
-
-def find_num_spots(grid: Grid, source: Point, target: Point, direction: Point) -> int:
-    # Dijkstra
-    prevs: dict[Node, set[Node]] = {}
-    boundary: list[tuple[int, Node]] = [(0, (source, direction))]
-    dist: dict[Node, int] = {(source, direction): 0}
-    while boundary:
-        _, (p, d) = heappop(boundary)
-
-        for dd in d, (-d[1], d[0]), (d[1], -d[0]):
-            pp = (p[0] + dd[0], p[1] + dd[1])
-            if grid[pp[0]][pp[1]] == "#":
-                continue
-            alt_dist = dist[p, d] + 1 + (1_000) * (d != dd)
-            if (pp, dd) not in dist or alt_dist < dist[pp, dd]:
-                dist[pp, dd] = alt_dist
-                prevs[pp, dd] = {(p, d)}
-                heappush(boundary, (alt_dist, (pp, dd)))
-            elif (pp, dd) in dist and alt_dist == dist[pp, dd]:
-                prevs[pp, dd].add((p, d))
-
-    def walk_back(node: Node) -> None:
-        spots.add(node[0])
-        if node not in prevs:
-            return
-        for prev in prevs[node]:
-            walk_back(prev)
-
-    spots: set[Point] = set()
-    dirs = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-    min_dist = min(dist[target, d] for d in dirs if (target, d) in dist)
-    for d in dirs:
-        if (target, d) in dist and dist[target, d] == min_dist:
-            walk_back((target, d))
+            alt_dist = score + cost
+            if alt_dist < dist[next_state]:
+                push(next_state, alt_dist)
+
+    return dist
+
+
+def lowest_score(grid: Grid, source: int, target: int) -> int | None:
+    dist = scores(grid, source, until=target)
+    best = min(dist[4 * target : 4 * target + 4])
+    return None if best == UNREACHED else best
+
+
+def find_num_spots(grid: Grid, source: int, target: int) -> int:
+    """Walks back from the best end states through every state that one of the
+    best paths could have come from."""
+    dist = scores(grid, source)
+    best = min(dist[4 * target : 4 * target + 4])
+    backward = moves(grid, True)
+
+    on_path = bytearray(len(dist))
+    stack = [4 * target + d for d in range(4) if dist[4 * target + d] == best]
+    for state in stack:
+        on_path[state] = 1
+    spots = {target}
+    while stack:
+        state = stack.pop()
+        for change, cost in backward[state & 3]:
+            prev = state + change
+            if not on_path[prev] and dist[prev] + cost == dist[state]:
+                on_path[prev] = 1
+                stack.append(prev)
+                spots.add(prev >> 2)
     return len(spots)
 
 
+def part_1(maze: Maze) -> int | None:
+    return lowest_score(*maze)
+
+
+def part_2(maze: Maze) -> int:
+    return find_num_spots(*maze)
+
+
 def main():
     file_path = sys.argv[1]
-    grid, source, target, direction = read_input(file_path)
-    part_1 = lowest_score(grid, source, target, direction)
-    part_2 = find_num_spots(grid, source, target, direction)
-    print(f"{part_1 = } {part_2 = }")
+    maze = read_input(file_path)
+    print(f"part_1 = {part_1(maze)} part_2 = {part_2(maze)}")
 
 
 if __name__ == "__main__":
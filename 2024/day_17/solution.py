@@ -86,12 +86,12 @@ def find_a(b: int, c: int, program: list[int]) -> int | None:
     stack = [(0, len(program) - 1)]
     min_a: int | None = None
     while stack:
-        a, pos = stack.pop()
+        a, pos = stack.pop()  # trace: nodes, max len(stack)
         if pos == -1:
             min_a = min(min_a, a) if min_a is not None else a
         for i in range(1 << 3):
             cand_a = (a << 3) | i
-            computer = Computer(cand_a, b, c, program)
+            computer = Computer(cand_a, b, c, program)  # trace: candidates
             computer.execute_until_jump()
             assert len(computer.out) == 1
             if computer.out[0] == program[pos]:
@@ -99,17 +99,22 @@ def find_a(b: int, c: int, program: list[int]) -> int | None:
     return min_a
 
 
-def main():
-    file_path = sys.argv[1]
-    a, b, c, program = read_input(file_path)
-
+def part_1(registers_and_program: tuple[int, int, int, list[int]]) -> str:
+    a, b, c, program = registers_and_program
     computer = Computer(a, b, c, program)
     computer.execute_all()
-    part_1 = computer.out_str()
+    return computer.out_str()
+
 
-    part_2 = find_a(b, c, program)
+def part_2(registers_and_program: tuple[int, int, int, list[int]]) -> int | None:
+    _, b, c, program = registers_and_program
+    return find_a(b, c, program)
 
-    print(f"part_1 = {part_1} part_2 = {part_2}")
+
+def main():
+    file_path = sys.argv[1]
+    data = read_input(file_path)
+    print(f"part_1 = {part_1(data)} part_2 = {part_2(data)}")
 
 
 if __name__ == "__main__":
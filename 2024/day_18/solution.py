@@ -1,6 +1,9 @@
-from collections import deque
+from array import array
+from functools import partial
 import sys
 
+from aoc.search import bfs_levels
+
 
 type Pair = tuple[int, int]
 
@@ -14,35 +17,57 @@ def read_input(file_path: str) -> list[Pair]:
     return blockers
 
 
-def min_steps(size: Pair, blockers: dict[Pair, int], n_fallen: int) -> int | None:
-    q = deque([(0, 0)])
-    level = 0
-    visited = {(0, 0)}
-    while q:
-        for _ in range(len(q)):
-            x, y = q.popleft()
-            if (x, y) == size:
-                return level
-
-            for dx, dy in (1, 0), (0, 1), (-1, 0), (0, -1):
-                if (
-                    0 <= (xx := x + dx) <= size[0]
-                    and 0 <= (yy := y + dy) <= size[1]
-                    and (xx, yy) not in visited
-                    and ((xx, yy) not in blockers or blockers[xx, yy] >= n_fallen)
-                ):
-                    q.append((xx, yy))
-                    visited.add((xx, yy))
-        level += 1
+# Falls after every byte that could; memory outside the space falls before any.
+NEVER = 2**31 - 1
+
+
+def fall_times(size: Pair, blockers: dict[Pair, int]) -> array[int]:
+    """When each position is corrupted, flattened row by row into rows of
+    `size[0] + 2`. The last position of every row, and the rows above and below
+    the memory space, are corrupted from the start."""
+    width = size[0] + 2
+    row = array("i", [NEVER]) * (size[0] + 1) + array("i", [-1])
+    border = array("i", [-1]) * width
+    times = border + row * (size[1] + 1) + border
+    for (x, y), i in blockers.items():
+        times[(y + 1) * width + x] = i
+    return times
+
+
+def open_next_to(
+    times: array[int], n_fallen: int, steps: tuple[int, ...], seen: bytearray, frontier: list[int]
+) -> list[int]:
+    """The positions not yet seen next to any in `frontier` that are still open
+    after `n_fallen` bytes, which are marked seen."""
+    res = []
+    for p in frontier:
+        for step in steps:
+            q = p + step
+            if not seen[q] and times[q] >= n_fallen:
+                seen[q] = 1
+                res.append(q)
+    return res
+
+
+def min_steps(size: Pair, times: array[int], n_fallen: int) -> int | None:
+    width = size[0] + 2
+    source, target = width, (size[1] + 1) * width + size[0]
+    steps = 1, width, -1, -width
+    seen = bytearray(len(times))
+    expand = partial(open_next_to, times, n_fallen, steps, seen)
+    for level, frontier in enumerate(bfs_levels([source], expand, seen)):
+        if target in frontier:
+            return level
     return None
 
 
 def full_block_pos(size: Pair, blockers: dict[Pair, int]) -> int:
+    times = fall_times(size, blockers)
     lo = 0
     hi = len(blockers)
     while lo <= hi:
         mid = lo + (hi - lo) // 2
-        steps = min_steps(size, blockers, mid)
+        steps = min_steps(size, times, mid)
         if steps is None:
             hi = mid - 1
         else:
@@ -50,14 +75,24 @@ def full_block_pos(size: Pair, blockers: dict[Pair, int]) -> int:
     return hi
 
 
+SIZE = (70, 70)
+
+
+def part_1(blockers_list: list[Pair]) -> int | None:
+    blockers = {p: i for i, p in enumerate(blockers_list)}
+    return min_steps(SIZE, fall_times(SIZE, blockers), 1024)
+
+
+def part_2(blockers_list: list[Pair]) -> str:
+    blockers = {p: i for i, p in enumerate(blockers_list)}
+    x, y = blockers_list[full_block_pos(SIZE, blockers)]
+    return f"{x},{y}"
+
+
 def main():
-    size = (70, 70)
     file_path = sys.argv[1]
-    blockers_list = list(read_input(file_path))
-    blockers = {p: i for i, p in enumerate(blockers_list)}
-    part_1 = min_steps(size, blockers, 1024)
-    part_2 = blockers_list[full_block_pos(size, blockers)]
-    print(f"part_1 = {part_1} part_2 = {part_2[0]},{part_2[1]}")
+    blockers_list = read_input(file_path)
+    print(f"part_1 = {part_1(blockers_list)} part_2 = {part_2(blockers_list)}")
 
 
 if __name__ == "__main__":
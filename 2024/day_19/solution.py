@@ -1,4 +1,3 @@
-from functools import cache
 import sys
 
 
@@ -10,33 +9,34 @@ def read_input(file_path: str) -> tuple[frozenset[str], list[str]]:
     return towels, designs
 
 
-def is_possible(design: str, towels: frozenset[str]) -> bool:
-    if design in towels:
-        return True
-    return any(
-        is_possible(design[len(towel) :], towels)
-        for towel in towels
-        if design.startswith(towel)
-    )
+def num_possible(design: str, towels: frozenset[str]) -> int:
+    """Counts the arrangements from the end of the design back, where `ways[i]` is
+    the number of ways to make `design[i:]`. Only prefixes up to the longest
+    towel are looked up, so the work does not grow with the number of towels."""
+    n = len(design)
+    longest = max(map(len, towels))
+    ways = [0] * n + [1]
+    for i in reversed(range(n)):
+        ways[i] = sum(
+            ways[j] for j in range(i + 1, min(n, i + longest) + 1) if design[i:j] in towels
+        )
+    return ways[0]
 
 
-@cache
-def num_possible(design: str, towels: frozenset[str]) -> int:
-    if not design:
-        return 1
-    return sum(
-        num_possible(design[len(towel) :], towels)
-        for towel in towels
-        if design.startswith(towel)
-    )
+def part_1(towels_and_designs: tuple[frozenset[str], list[str]]) -> int:
+    towels, designs = towels_and_designs
+    return sum(num_possible(design, towels) > 0 for design in designs)
+
+
+def part_2(towels_and_designs: tuple[frozenset[str], list[str]]) -> int:
+    towels, designs = towels_and_designs
+    return sum(num_possible(design, towels) for design in designs)
 
 
 def main():
     file_path = sys.argv[1]
-    towels, designs = read_input(file_path)
-    part_1 = sum(is_possible(design, towels) for design in designs)
-    part_2 = sum(num_possible(design, towels) for design in designs)
-    print(f"{part_1 = } {part_2 = }")
+    data = read_input(file_path)
+    print(f"part_1 = {part_1(data)} part_2 = {part_2(data)}")
 
 
 if __name__ == "__main__":
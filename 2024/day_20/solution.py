@@ -1,29 +1,26 @@
 import sys
 
+from aoc.grid import Grid
 
-def read_input(file_path: str) -> list[str]:
-    with open(file_path) as f:
-        return f.read().splitlines()
 
+def read_input(file_path: str) -> Grid:
+    # A border of walls keeps the walk inside without bounds checks.
+    return Grid.read(file_path, fill=b"#")
 
-def parse_path(grid: list[str]) -> list[tuple[int, int]]:
-    source = next(
-        (x, y)
-        for x in range(len(grid))
-        for y in range(len(grid[0]))
-        if grid[x][y] == "S"
-    )
-    cur = source
-    path: list[tuple[int, int]] = [cur]
-    while grid[cur[0]][cur[1]] != "E":
-        cur = next(
-            (cur[0] + d[0], cur[1] + d[1])
-            for d in ((0, 1), (1, 0), (-1, 0), (0, -1))
-            if (len(path) < 2 or (cur[0] + d[0], cur[1] + d[1]) != path[-2])
-            and grid[cur[0] + d[0]][cur[1] + d[1]] != "#"
+
+def parse_path(grid: Grid) -> list[tuple[int, int]]:
+    """The coordinates of the cells of the track, in order from the start."""
+    cells = grid.cells
+    wall, end = b"#E"
+    cur = cells.index(b"S")
+    path = [cur]
+    prev = -1
+    while cells[cur] != end:
+        prev, cur = cur, next(
+            p for d in grid.steps if (p := cur + d) != prev and cells[p] != wall
         )
         path.append(cur)
-    return path
+    return [grid.coords(p) for p in path]
 
 
 def count_cheats(path: list[tuple[int, int]], allowed_time: int, min_saved: int) -> int:
@@ -36,13 +33,18 @@ def count_cheats(path: list[tuple[int, int]], allowed_time: int, min_saved: int)
     )
 
 
+def part_1(grid: Grid) -> int:
+    return count_cheats(parse_path(grid), 2, 100)
+
+
+def part_2(grid: Grid) -> int:
+    return count_cheats(parse_path(grid), 20, 100)
+
+
 def main():
     file_path = sys.argv[1]
     grid = read_input(file_path)
-    path = parse_path(grid)
-    part_1 = count_cheats(path, 2, 100)
-    part_2 = count_cheats(path, 20, 100)
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(grid)} part_2 = {part_2(grid)}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 import sys
-from functools import cache
 from itertools import pairwise
 
+from aoc.memo import memoize
+
 NUMPAD = [
     ["7", "8", "9"],
     ["4", "5", "6"],
@@ -26,7 +27,9 @@ def read_input(file_path: str) -> list[str]:
         return f.read().splitlines()
 
 
-@cache
+# Both caches have room for every key there is: pairs of keys on a pad, and for
+# the lengths, also every number of robots. Neither depends on the codes.
+@memoize(maxsize=256, scope="process")
 def candidate_paths(source_str: str, target_str: str) -> list[str]:
     if source_str in DIRPAD_POS and target_str in DIRPAD_POS:
         pad_pos = DIRPAD_POS
@@ -74,7 +77,7 @@ def candidate_paths(source_str: str, target_str: str) -> list[str]:
     return res
 
 
-@cache
+@memoize(maxsize=1024, scope="process")
 def shortest_path_length(source: str, target: str, num_robot_dirpads: int) -> int:
     paths = candidate_paths(source, target)
     if num_robot_dirpads == 0:
@@ -95,12 +98,18 @@ def code_complexity(code: str, num_robot_dirpads: int) -> int:
     return path_len * int(code[:-1])
 
 
+def part_1(codes: list[str]) -> int:
+    return sum(code_complexity(code, 2) for code in codes)
+
+
+def part_2(codes: list[str]) -> int:
+    return sum(code_complexity(code, 25) for code in codes)
+
+
 def main():
     file_path = sys.argv[1]
     codes = read_input(file_path)
-    part_1 = sum(code_complexity(code, 2) for code in codes)
-    part_2 = sum(code_complexity(code, 25) for code in codes)
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(codes)} part_2 = {part_2(codes)}")
 
 
 if __name__ == "__main__":
@@ -41,12 +41,18 @@ def max_bananas(seeds: list[int]) -> int:
     return max(sum(v.values()) for v in cache.values())
 
 
+def part_1(seeds: list[int]) -> int:
+    return sum(next(islice(rng, 2_000, None)) for rng in map(create_rng, seeds))
+
+
+def part_2(seeds: list[int]) -> int:
+    return max_bananas(seeds)
+
+
 def main():
     file_path = sys.argv[1]
     seeds = read_input(file_path)
-    part_1 = sum(next(islice(rng, 2_000, None)) for rng in map(create_rng, seeds))
-    part_2 = max_bananas(seeds)
-    print(f"{part_1 = } {part_2 = }")
+    print(f"part_1 = {part_1(seeds)} part_2 = {part_2(seeds)}")
 
 
 if __name__ == "__main__":
@@ -44,12 +44,18 @@ def complete_components[T: Hashable](graph: Graph[T]) -> Generator[set[T]]:
         seen.update(component)
 
 
+def part_1(graph: Graph[str]) -> int:
+    return n_triangles(graph, {node for node in graph if node.startswith("t")})
+
+
+def part_2(graph: Graph[str]) -> str:
+    return ",".join(sorted(max(complete_components(graph), key=len)))
+
+
 def main():
     file_path = sys.argv[1]
     graph = read_input(file_path)
-    part_1 = n_triangles(graph, {node for node in graph if node.startswith("t")})
-    part_2 = ",".join(sorted(max(complete_components(graph), key=len)))
-    print(f"part_1 = {part_1} part_2 = {part_2}")
+    print(f"part_1 = {part_1(graph)} part_2 = {part_2(graph)}")
 
 
 if __name__ == "__main__":
@@ -107,12 +107,20 @@ def traverse(gates_list: list[tuple[str, str, str, str]]) -> set[tuple[str, str]
     return swapped
 
 
+def part_1(circuit: tuple[dict[str, bool], list[tuple[str, str, str, str]]]) -> int:
+    wires, gates = circuit
+    return compute_z(dict(wires), gates)
+
+
+def part_2(circuit: tuple[dict[str, bool], list[tuple[str, str, str, str]]]) -> str:
+    _, gates = circuit
+    return ",".join(sorted(c for t in traverse(gates) for c in t))
+
+
 def main():
     file_path = sys.argv[1]
-    wires, gates = read_input(file_path)
-    part_1 = compute_z(wires, gates)
-    part_2 = ",".join(sorted(c for t in traverse(gates) for c in t))
-    print(f"part_1 = {part_1} part_2 = {part_2}")
+    circuit = read_input(file_path)
+    print(f"part_1 = {part_1(circuit)} part_2 = {part_2(circuit)}")
 
 
 if __name__ == "__main__":
@@ -33,12 +33,15 @@ def fits(key: list[int], lock: list[int]) -> bool:
     return all(a + b <= 5 for a, b in zip(key, lock))
 
 
+def part_1(grids: list[Grid]) -> int:
+    locks, keys = locks_and_keys(grids)
+    return sum(fits(lock, key) for lock in locks for key in keys)
+
+
 def main():
     file_path = sys.argv[1]
     grids = read_input(file_path)
-    locks, keys = locks_and_keys(grids)
-    part_1 = sum(fits(lock, key) for lock in locks for key in keys)
-    print(part_1)
+    print(part_1(grids))
 
 
 if __name__ == "__main__":
@@ -11,9 +11,6 @@
 import sys
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-import networkx as nx
-
 
 def parse(contents: str) -> list[tuple[str, str]]:
     edges: list[tuple[str, str]] = []
@@ -26,6 +23,10 @@ def parse(contents: str) -> list[tuple[str, str]]:
 
 
 def main():
+    # Imported here, so that parse() can be used without the plotting stack.
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     file_path = sys.argv[1]
     contents = Path(file_path).read_text()
     edges = parse(contents)
@@ -0,0 +1 @@
+"""Tooling to run, benchmark and profile the Python solutions, and code that they share."""
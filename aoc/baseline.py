@@ -0,0 +1,144 @@
+import hashlib
+import json
+import statistics
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aoc.scaling import peak_memory
+from aoc.solutions import ROOT, Solution
+from aoc.timing import format_bytes, format_seconds, time_solution
+
+DEFAULT_BASELINE = ROOT / "baseline.json"
+
+
+@dataclass(slots=True)
+class StepBaseline:
+    # Median of the cold runs, which is what running the script once costs.
+    seconds: float
+    peak_bytes: int | None = None
+
+
+@dataclass(slots=True)
+class SolutionBaseline:
+    # A hash of the input, so that timings are only compared on the same input.
+    input_sha256: str
+    input: str
+    steps: dict[str, StepBaseline] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Baseline:
+    python: str = sys.version.split()[0]
+    solutions: dict[str, SolutionBaseline] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Baseline":
+        with open(path) as f:
+            obj = json.load(f)
+        baseline = cls(obj["python"])
+        for name, entry in obj["solutions"].items():
+            steps = {step: StepBaseline(**s) for step, s in entry["steps"].items()}
+            baseline.solutions[name] = SolutionBaseline(
+                entry["input_sha256"], entry["input"], steps
+            )
+        return baseline
+
+    def save(self, path: Path) -> None:
+        obj: dict[str, Any] = asdict(self)
+        obj["solutions"] = dict(sorted(obj["solutions"].items()))
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+            f.write("\n")
+
+
+def input_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def measure_baseline(
+    solution: Solution, path: Path, label: str, repeat: int = 5, memory: bool = True
+) -> SolutionBaseline:
+    """Median cold run time and, unless `memory` is off, peak traced memory of
+    `read_input` and every part."""
+    report = time_solution(solution, path, repeat, warmup=0)
+    peaks = peak_memory(solution.load(), path) if memory else {}
+    entry = SolutionBaseline(input_sha256(path), label)
+    for step, samples in report.steps.items():
+        entry.steps[step] = StepBaseline(statistics.median(samples.cold), peaks.get(step))
+    return entry
+
+
+@dataclass(slots=True, frozen=True)
+class Change:
+    solution: str
+    step: str
+    metric: str
+    before: float
+    after: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.after / self.before if self.before else float("inf")
+
+
+def compare_baselines(
+    before: SolutionBaseline,
+    after: SolutionBaseline,
+    name: str,
+    threshold: float,
+    memory_threshold: float,
+    min_seconds: float,
+) -> list[Change]:
+    """Compares every step measured in both. A step regresses when it got slower
+    by more than `threshold` (0.2 is 20%), or grew its peak memory by more than
+    `memory_threshold`. Steps faster than `min_seconds` both times are too noisy
+    to judge by their time."""
+    changes: list[Change] = []
+    for step, old in before.steps.items():
+        new = after.steps.get(step)
+        if new is None:
+            continue
+        slower = new.seconds > old.seconds * (1 + threshold)
+        noisy = max(old.seconds, new.seconds) < min_seconds
+        changes.append(
+            Change(name, step, "time", old.seconds, new.seconds, slower and not noisy)
+        )
+        if old.peak_bytes is not None and new.peak_bytes is not None:
+            bigger = new.peak_bytes > old.peak_bytes * (1 + memory_threshold)
+            changes.append(
+                Change(name, step, "peak", old.peak_bytes, new.peak_bytes, bigger)
+            )
+    return changes
+
+
+def format_changes(changes: list[Change]) -> str:
+    header = ("solution", "step", "metric", "baseline", "current", "ratio", "")
+    rows: list[tuple[str, ...]] = []
+    previous = ""
+    for c in changes:
+        fmt = format_seconds if c.metric == "time" else format_bytes
+        rows.append(
+            (
+                c.solution if c.solution != previous else "",
+                c.step,
+                c.metric,
+                fmt(c.before),
+                fmt(c.after),
+                f"{c.ratio:.2f}x",
+                "REGRESSED" if c.regressed else "",
+            )
+        )
+        previous = c.solution
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(w) if i in (0, 1, 2, len(row) - 1) else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in [header, *rows]
+    ]
+    return "\n".join(lines)
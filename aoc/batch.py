@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import sys
+import time
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, TextIO
+
+from aoc.memo import clear_caches
+from aoc.solutions import Solution, iter_parts
+
+# The solution module of this process. Workers forked from the batch process
+# inherit it already imported, along with whatever its tables and caches hold.
+_solution: Solution | None = None
+_module: ModuleType | None = None
+
+
+@dataclass(slots=True)
+class BatchResult:
+    input: str
+    answers: dict[str, Any] = field(default_factory=dict)
+    seconds: float = 0.0
+    error: str | None = None
+
+    def to_json(self) -> str:
+        # Answers are mostly ints, but a few days answer with strings or lists.
+        obj = {
+            "input": self.input,
+            "answers": self.answers,
+            "seconds": self.seconds,
+            "error": self.error,
+        }
+        return json.dumps(obj, default=str)
+
+
+def solve(path: str, clear: bool = False) -> BatchResult:
+    """Runs `read_input` and every part of this process's solution module on `path`.
+
+    The module's caches scoped to an input are emptied first, and with `clear`,
+    all of its memoized functions, for days whose plain caches only make sense
+    for one input. Otherwise tables and caches that do not depend on the input
+    carry over from one input to the next.
+    """
+    assert _module is not None
+    result = BatchResult(path)
+    start = time.perf_counter()
+    try:
+        clear_caches(_module, None if clear else "input")
+        # Solutions print their own progress at times; keep it out of the stream.
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = _module.read_input(path)
+            for name, part in iter_parts(_module):
+                result.answers[name] = part(data)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _executor(workers: int) -> Executor:
+    if workers == 1:
+        # One thread keeps the event loop free to read inputs and write results.
+        return ThreadPoolExecutor(1)
+    if "fork" in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+    # Spawned workers import the solution once each instead.
+    assert _solution is not None
+    return ProcessPoolExecutor(workers, initializer=_load, initargs=(_solution,))
+
+
+def _load(solution: Solution) -> None:
+    global _solution, _module
+    _solution, _module = solution, solution.load()
+
+
+def input_paths(source: str) -> AsyncIterator[str]:
+    """The inputs of a batch: the files of a directory, in order, or with `-`,
+    the paths that arrive on stdin, one per line, as soon as they arrive."""
+
+    async def from_stdin() -> AsyncIterator[str]:
+        while line := await asyncio.to_thread(sys.stdin.readline):
+            if line := line.strip():
+                yield line
+
+    async def from_files(paths: Iterable[Path]) -> AsyncIterator[str]:
+        for path in paths:
+            yield str(path)
+
+    if source == "-":
+        return from_stdin()
+    directory = Path(source)
+    if directory.is_dir():
+        return from_files(
+            sorted(p for p in directory.iterdir() if p.is_file() and not p.name.startswith("."))
+        )
+    return from_files([directory])
+
+
+async def run_batch(
+    solution: Solution,
+    sources: list[str],
+    out: TextIO,
+    workers: int = 1,
+    clear: bool = False,
+) -> int:
+    """Solves every input of `sources` with one long-lived import of `solution`,
+    writing each result to `out` as a JSON line as soon as it completes, which
+    need not be in the order of the inputs.
+
+    At most twice as many inputs as there are workers are in flight at once, so
+    that a long stream on stdin is not read into memory ahead of the workers.
+    Returns the number of inputs that failed.
+    """
+    _load(solution)
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(2 * workers)
+    failed = 0
+
+    async def dispatch(executor: Executor, path: str) -> None:
+        nonlocal failed
+        try:
+            result = await loop.run_in_executor(executor, solve, path, clear)
+        finally:
+            slots.release()
+        failed += result.error is not None
+        out.write(result.to_json() + "\n")
+        out.flush()
+
+    with _executor(workers) as executor:
+        async with asyncio.TaskGroup() as tasks:
+            for source in sources:
+                async for path in input_paths(source):
+                    await slots.acquire()
+                    tasks.create_task(dispatch(executor, path))
+    return failed
@@ -0,0 +1,63 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Self
+
+
+@dataclass(slots=True)
+class Bitboard:
+    """A set of cells, as one int per row: bit j of `rows[i]` is set if cell
+    `(i, j)` is in the set.
+
+    Moving every cell a column over is a shift of each row, and the cells next
+    to those of a row in it are `row << 1 | row >> 1`, so simulations step
+    whole rows at a time. A board at most 8 columns wide can keep its rows in a
+    bytearray, at a byte per row; otherwise the rows are a list of ints, which
+    grow as wide as the widest row.
+    """
+
+    rows: bytearray | list[int]
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], on: str = "#", left: int = 0) -> Self:
+        """The cells that are `on` in `lines`, the first row first, moved `left`
+        columns from column 0."""
+        return cls([sum(1 << j for j, c in enumerate(line) if c == on) << left for line in lines])
+
+    def count(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def columns(self) -> int:
+        """The columns that have any cell, as the bits of a row."""
+        union = 0
+        for row in self.rows:
+            union |= row
+        return union
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        """The smallest rectangle that holds every cell, as `(top, bottom, left,
+        right)` with the bottom and the right exclusive."""
+        occupied = [i for i, row in enumerate(self.rows) if row]
+        if not occupied:
+            raise ValueError("an empty board has no bounds")
+        union = self.columns()
+        return occupied[0], occupied[-1] + 1, (union & -union).bit_length() - 1, union.bit_length()
+
+    def shifted(self, columns: int) -> Self:
+        """The board with every cell moved `columns` columns further from column 0."""
+        return type(self)([row << columns for row in self.rows])
+
+    def render(self, on: str = "#", off: str = ".") -> str:
+        """The cells within the bounds, a line per row."""
+        top, bottom, left, right = self.bounds()
+        return "\n".join(
+            "".join(on if row >> j & 1 else off for j in range(left, right))
+            for row in self.rows[top:bottom]
+        )
+
+
+def flood_row(seed: int, space: int) -> int:
+    """The cells of `space` that connect to those of `seed` within one row."""
+    reached = seed & space
+    while (spread := (reached | reached << 1 | reached >> 1) & space) != reached:
+        reached = spread
+    return reached
@@ -0,0 +1,106 @@
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from aoc.memo import CacheStats
+from aoc.solutions import ROOT, Solution
+from aoc.timing import Report, Samples
+
+DEFAULT_CACHE_DIR = ROOT / ".aoc-cache"
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+@functools.cache
+def package_digest() -> bytes:
+    """A hash of the source of every module of the `aoc` package, by path.
+
+    Solutions import shared code from the package, and the runner that times
+    them lives there too, so a change to any of it can change a report. The
+    package is hashed once per process.
+    """
+    h = hashlib.sha256()
+    for module in sorted(PACKAGE_DIR.rglob("*.py")):
+        for chunk in (module.relative_to(PACKAGE_DIR).as_posix().encode(), module.read_bytes()):
+            h.update(len(chunk).to_bytes(8, "little"))
+            h.update(chunk)
+    return h.digest()
+
+
+def cache_key(solution: Solution, path: Path, *params: object) -> str:
+    """Hashes everything a report depends on: the solution's source, the source
+    of the `aoc` package, the input bytes, the interpreter and the timing
+    parameters."""
+    h = hashlib.sha256()
+    for chunk in (
+        solution.path.read_bytes(),
+        package_digest(),
+        path.read_bytes(),
+        sys.version.encode(),
+        repr(params).encode(),
+    ):
+        # Length prefixes keep the boundaries between the chunks unambiguous.
+        h.update(len(chunk).to_bytes(8, "little"))
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def report_to_json(report: Report) -> dict[str, Any]:
+    return {
+        "steps": {
+            name: {"cold": samples.cold, "warm": samples.warm}
+            for name, samples in report.steps.items()
+        },
+        "answers": report.answers,
+        "caches": [
+            [s.name, s.hits, s.misses, s.size, s.maxsize, s.scope] for s in report.caches
+        ],
+    }
+
+
+def report_from_json(solution: Solution, obj: dict[str, Any]) -> Report:
+    report = Report(solution, answers=obj["answers"])
+    report.caches = [CacheStats(*fields) for fields in obj.get("caches", [])]
+    for name, samples in obj["steps"].items():
+        report.steps[name] = Samples(samples["cold"], samples["warm"])
+    return report
+
+
+class ResultCache:
+    """Reports stored on disk under the hash of their inputs.
+
+    Answers that JSON cannot represent are stored as their `str`, which is all
+    the report tables show of them anyway.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR) -> None:
+        self.directory = directory
+
+    def _file(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, solution: Solution, key: str) -> Report | None:
+        try:
+            with open(self._file(key)) as f:
+                return report_from_json(solution, json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, report: Report) -> None:
+        if report.error is not None:
+            return
+        file = self._file(key)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so readers never see half a report.
+        fd, tmp = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(report_to_json(report), f, default=str)
+            os.replace(tmp, file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
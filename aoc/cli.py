@@ -0,0 +1,633 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+from aoc.baseline import (
+    DEFAULT_BASELINE,
+    Baseline,
+    Change,
+    compare_baselines,
+    format_changes,
+    input_sha256,
+    measure_baseline,
+)
+from aoc.batch import run_batch
+from aoc.cache import DEFAULT_CACHE_DIR, ResultCache, cache_key
+from aoc.generators import GENERATORS
+from aoc.imports import ImportReport, bare_startup, format_import_reports, measure_imports
+from aoc.memo import format_cache_stats
+from aoc.memory import MemoryReport, format_memory_reports, measure_memory, parse_size
+from aoc.parallel import PARALLEL_ENV
+from aoc.profiling import FORMATS, format_top, profile_solution, write_profiles
+from aoc.scaling import Curve, format_curves, measure_scaling, write_json
+from aoc.solutions import Solution, discover, input_path
+from aoc.timing import Report, format_reports, format_seconds, time_solutions
+from aoc.tracing import TraceReport, trace_solution
+
+
+def run(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    if not solutions:
+        print(f"No solutions match {args.selectors}", file=sys.stderr)
+        return 1
+
+    jobs: list[tuple[Solution, Path]] = []
+    for solution in solutions:
+        path = input_path(solution, args.input)
+        if not path.exists():
+            print(f"{solution.name}: skipped, {path} does not exist", file=sys.stderr)
+            continue
+        jobs.append((solution, path))
+
+    if args.parallel is not None:
+        # Read by aoc.parallel, in this process and in the -j workers alike.
+        os.environ[PARALLEL_ENV] = str(args.parallel)
+
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    keys: dict[Solution, str] = {}
+    done: dict[Solution, Report] = {}
+    pending: list[tuple[Solution, Path]] = []
+    for solution, path in jobs:
+        if cache is not None:
+            keys[solution] = cache_key(
+                solution, path, args.repeat, args.warmup, os.environ.get(PARALLEL_ENV)
+            )
+            report = cache.get(solution, keys[solution])
+            if report is not None:
+                done[solution] = report
+                continue
+        pending.append((solution, path))
+    if done:
+        print(f"{len(done)} of {len(jobs)} reports from the cache", file=sys.stderr)
+
+    # A --jobs of 0 sizes the pool to the number of cores.
+    workers = args.jobs or None
+    for report in time_solutions(pending, args.repeat, args.warmup, workers):
+        done[report.solution] = report
+        if cache is not None:
+            cache.put(keys[report.solution], report)
+
+    reports = [done[solution] for solution, _ in jobs]
+    if reports:
+        print(format_reports(reports))
+    if reports and args.cache_stats:
+        print()
+        print(
+            format_cache_stats(
+                [(report.solution.name, report.caches) for report in reports if report.caches]
+            )
+        )
+    return 1 if any(report.error is not None for report in reports) else 0
+
+
+def batch(args: argparse.Namespace) -> int:
+    solutions = discover([args.solution])
+    if len(solutions) != 1:
+        print(f"{args.solution} matches {len(solutions)} solutions, not one", file=sys.stderr)
+        return 1
+
+    # A --jobs of 0 sizes the pool to the number of cores.
+    workers = args.jobs or os.cpu_count() or 1
+    failed = asyncio.run(
+        run_batch(solutions[0], args.inputs, sys.stdout, workers, args.clear_caches)
+    )
+    if failed:
+        print(f"{failed} inputs failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def scale(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    if not solutions:
+        print(f"No solutions match {args.selectors}", file=sys.stderr)
+        return 1
+
+    curves: list[Curve] = []
+    for solution in solutions:
+        generate = GENERATORS.get(solution.name)
+        if generate is None:
+            print(f"{solution.name}: skipped, no input generator", file=sys.stderr)
+            continue
+        scales = tuple(args.scales) if args.scales else generate.scales
+        try:
+            curve = measure_scaling(
+                solution,
+                generate,
+                scales,
+                args.seed,
+                args.repeat,
+                not args.no_memory,
+                args.parse_only,
+            )
+        except Exception as e:
+            curve = Curve(solution, error=f"{type(e).__name__}: {e}")
+        curves.append(curve)
+
+    if curves:
+        print(format_curves(curves))
+    if args.json is not None:
+        write_json(curves, args.json)
+    return 1 if any(curve.error is not None for curve in curves) else 0
+
+
+def memory(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    if not solutions:
+        print(f"No solutions match {args.selectors}", file=sys.stderr)
+        return 1
+
+    reports: list[MemoryReport] = []
+    for solution in solutions:
+        path = input_path(solution, args.input)
+        if not path.exists():
+            print(f"{solution.name}: skipped, {path} does not exist", file=sys.stderr)
+            continue
+        try:
+            report = measure_memory(solution, path, args.budget, args.top)
+        except Exception as e:
+            report = MemoryReport(solution, error=f"{type(e).__name__}: {e}")
+        reports.append(report)
+
+    if reports:
+        print(format_memory_reports(reports))
+    return 1 if any(report.error is not None for report in reports) else 0
+
+
+def imports(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    if not solutions:
+        print(f"No solutions match {args.selectors}", file=sys.stderr)
+        return 1
+
+    bare = bare_startup(args.repeat)
+    reports: list[ImportReport] = []
+    for solution in solutions:
+        try:
+            report = measure_imports(solution, bare, args.repeat)
+        except Exception as e:
+            report = ImportReport(solution, error=f"{type(e).__name__}: {e}")
+        reports.append(report)
+
+    if args.sort:
+        reports.sort(key=lambda r: r.startup, reverse=True)
+    print(f"bare interpreter: {format_seconds(bare)}")
+    print(format_import_reports(reports, args.top))
+    return 1 if any(report.error is not None for report in reports) else 0
+
+
+def profile(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    if not solutions:
+        print(f"No solutions match {args.selectors}", file=sys.stderr)
+        return 1
+
+    failed = False
+    for solution in solutions:
+        path = input_path(solution, args.input)
+        if not path.exists():
+            print(f"{solution.name}: skipped, {path} does not exist", file=sys.stderr)
+            continue
+        try:
+            profiles = profile_solution(solution, path, args.interval / 1_000)
+        except Exception as e:
+            print(f"{solution.name}: {type(e).__name__}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        written = write_profiles(solution, profiles, args.output, args.format)
+        for step, step_profile in profiles.items():
+            print(f"== {solution.name} {step}")
+            print(format_top(step_profile.stats, args.sort, args.top))
+            print()
+        print(f"wrote {len(written)} files to {args.output}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def trace(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    if not solutions:
+        print(f"No solutions match {args.selectors}", file=sys.stderr)
+        return 1
+
+    # Counters only see the work done in this process.
+    os.environ.pop(PARALLEL_ENV, None)
+    reports: list[TraceReport] = []
+    for solution in solutions:
+        path = input_path(solution, args.input)
+        if not path.exists():
+            print(f"{solution.name}: skipped, {path} does not exist", file=sys.stderr)
+            continue
+        try:
+            report = trace_solution(solution, path)
+        except Exception as e:
+            report = TraceReport(solution, str(path), error=f"{type(e).__name__}: {e}")
+        reports.append(report)
+
+    document = json.dumps([report.to_json() for report in reports], indent=2)
+    if args.output is None:
+        print(document)
+    else:
+        args.output.write_text(document + "\n")
+        print(f"wrote {len(reports)} traces to {args.output}", file=sys.stderr)
+    return 1 if any(report.error is not None for report in reports) else 0
+
+
+@contextmanager
+def reference_inputs(
+    solutions: list[Solution], args: argparse.Namespace
+) -> Iterator[list[tuple[Solution, Path, str]]]:
+    """The input of each solution, with a label for the baseline file: the file
+    from the input template, or with --scale, a generated input in a temporary
+    directory."""
+    with tempfile.TemporaryDirectory(prefix="aoc-baseline-") as tmp:
+        inputs: list[tuple[Solution, Path, str]] = []
+        for solution in solutions:
+            if args.scale is None:
+                path = input_path(solution, args.input)
+                if not path.exists():
+                    print(f"{solution.name}: skipped, {path} does not exist", file=sys.stderr)
+                    continue
+                inputs.append((solution, path, args.input))
+                continue
+            generate = GENERATORS.get(solution.name)
+            if generate is None:
+                print(f"{solution.name}: skipped, no input generator", file=sys.stderr)
+                continue
+            path = Path(tmp) / f"{solution.year}_day_{solution.day:02d}.txt"
+            path.write_text(generate(args.scale, args.seed))
+            inputs.append((solution, path, f"generated, scale {args.scale}, seed {args.seed}"))
+        yield inputs
+
+
+def baseline(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    if not solutions:
+        print(f"No solutions match {args.selectors}", file=sys.stderr)
+        return 1
+
+    # Days that are not measured again keep their entries.
+    stored = Baseline.load(args.baseline) if args.baseline.exists() else Baseline()
+    failed = False
+    with reference_inputs(solutions, args) as inputs:
+        for solution, path, label in inputs:
+            try:
+                entry = measure_baseline(solution, path, label, args.repeat, not args.no_memory)
+            except Exception as e:
+                print(f"{solution.name}: {type(e).__name__}: {e}", file=sys.stderr)
+                failed = True
+                continue
+            stored.solutions[solution.name] = entry
+            print(f"{solution.name}: measured", file=sys.stderr)
+    stored.save(args.baseline)
+    print(f"wrote {args.baseline}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    solutions = discover(args.selectors)
+    stored = Baseline.load(args.baseline)
+    solutions = [s for s in solutions if s.name in stored.solutions]
+    if not solutions:
+        print(f"No solutions in {args.baseline} match {args.selectors}", file=sys.stderr)
+        return 1
+
+    python = sys.version.split()[0]
+    if stored.python != python:
+        print(
+            f"warning: the baseline was recorded on Python {stored.python}, this is {python}",
+            file=sys.stderr,
+        )
+
+    changes: list[Change] = []
+    failed = False
+    with reference_inputs(solutions, args) as inputs:
+        for solution, path, label in inputs:
+            before = stored.solutions[solution.name]
+            if input_sha256(path) != before.input_sha256:
+                print(
+                    f"{solution.name}: skipped, the input differs from the baseline's "
+                    f"({before.input})",
+                    file=sys.stderr,
+                )
+                continue
+            # Peak memory is only measured again if the baseline has it.
+            memory = any(step.peak_bytes is not None for step in before.steps.values())
+            try:
+                after = measure_baseline(solution, path, label, args.repeat, memory)
+            except Exception as e:
+                print(f"{solution.name}: {type(e).__name__}: {e}", file=sys.stderr)
+                failed = True
+                continue
+            changes += compare_baselines(
+                before,
+                after,
+                solution.name,
+                args.threshold,
+                args.memory_threshold if args.memory_threshold is not None else args.threshold,
+                args.min_seconds,
+            )
+
+    if changes:
+        print(format_changes(changes))
+    regressions = [c for c in changes if c.regressed]
+    if regressions:
+        print(f"{len(regressions)} of {len(changes)} measurements regressed", file=sys.stderr)
+    return 1 if failed or regressions else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc", description="Run and benchmark the Python solutions."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="time read_input and every part of each selected solution"
+    )
+    run_parser.add_argument(
+        "selectors",
+        nargs="*",
+        help="solutions to run, e.g. 2024, 2023/day_17 or '2022/day_1?' (default: all)",
+    )
+    run_parser.add_argument(
+        "-i",
+        "--input",
+        default="input.txt",
+        help="input path template, relative to each day's directory; "
+        "{year} and {day} are substituted (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "-n", "--repeat", type=int, default=5, help="timed runs of each kind"
+    )
+    run_parser.add_argument(
+        "-w", "--warmup", type=int, default=1, help="untimed runs before warm timings"
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        default=1,
+        help="time the days in this many processes at once; "
+        "-j alone uses one per core (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "-p",
+        "--parallel",
+        type=int,
+        nargs="?",
+        const=0,
+        help="spread the parts that support it over this many workers; "
+        "-p alone uses one per core (default: $AOC_PARALLEL, or serial)",
+    )
+    run_parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="also show the hits, misses and sizes of each day's memoized functions",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="time every day again, even if its source and input have not changed",
+    )
+    run_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="where reports are cached (default: %(default)s)",
+    )
+    run_parser.set_defaults(func=run)
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="solve many inputs with one solution, streaming the answers as JSON lines",
+    )
+    batch_parser.add_argument("solution", help="the solution, e.g. 2024/day_21")
+    batch_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="input files, directories of input files, or - to read input paths "
+        "from stdin, one per line",
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        default=1,
+        help="solve this many inputs at once, in forked processes; "
+        "-j alone uses one per core (default: %(default)s)",
+    )
+    batch_parser.add_argument(
+        "--clear-caches",
+        action="store_true",
+        help="empty every memoized function before each input, not only those "
+        "scoped to an input, for days whose plain caches only hold for one input",
+    )
+    batch_parser.set_defaults(func=batch)
+
+    memory_parser = subparsers.add_parser(
+        "memory",
+        help="trace the peak memory and the top allocating lines of every part",
+    )
+    memory_parser.add_argument("selectors", nargs="*", help="solutions to trace")
+    memory_parser.add_argument(
+        "-i",
+        "--input",
+        default="input.txt",
+        help="input path template, as for run (default: %(default)s)",
+    )
+    memory_parser.add_argument(
+        "-b",
+        "--budget",
+        type=parse_size,
+        help="fail any step whose traced memory exceeds this size, e.g. 512M",
+    )
+    memory_parser.add_argument(
+        "--top", type=int, default=5, help="allocating lines to show for each step"
+    )
+    memory_parser.set_defaults(func=memory)
+
+    imports_parser = subparsers.add_parser(
+        "imports",
+        help="time the startup of a fresh interpreter that loads each solution, "
+        "and break down its imports",
+    )
+    imports_parser.add_argument("selectors", nargs="*", help="solutions to load")
+    imports_parser.add_argument(
+        "-n", "--repeat", type=int, default=5, help="interpreters started per solution"
+    )
+    imports_parser.add_argument(
+        "--top", type=int, default=3, help="slowest imports to show for each solution"
+    )
+    imports_parser.add_argument(
+        "--sort", action="store_true", help="slowest to start first, instead of by day"
+    )
+    imports_parser.set_defaults(func=imports)
+
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="profile read_input and every part with cProfile and a stack sampler",
+    )
+    profile_parser.add_argument("selectors", nargs="*", help="solutions to profile")
+    profile_parser.add_argument(
+        "-i",
+        "--input",
+        default="input.txt",
+        help="input path template, as for run (default: %(default)s)",
+    )
+    profile_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("profiles"),
+        help="directory for the .prof files and the sampled stacks (default: %(default)s)",
+    )
+    profile_parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default="speedscope",
+        help="format of the sampled stacks (default: %(default)s)",
+    )
+    profile_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="milliseconds of CPU time between stack samples (default: %(default)s)",
+    )
+    profile_parser.add_argument(
+        "--sort",
+        default="cumulative",
+        help="pstats sort key of the printed summary (default: %(default)s)",
+    )
+    profile_parser.add_argument(
+        "--top", type=int, default=15, help="functions in the printed summary"
+    )
+    profile_parser.set_defaults(func=profile)
+
+    trace_parser = subparsers.add_parser(
+        "trace",
+        help="count the nodes, prunes and stack depths that search solutions mark "
+        "with `# trace:` comments, as JSON",
+    )
+    trace_parser.add_argument("selectors", nargs="*", help="solutions to trace")
+    trace_parser.add_argument(
+        "-i",
+        "--input",
+        default="input.txt",
+        help="input path template, as for run (default: %(default)s)",
+    )
+    trace_parser.add_argument(
+        "-o", "--output", type=Path, help="write the JSON here instead of to stdout"
+    )
+    trace_parser.set_defaults(func=trace)
+
+    scale_parser = subparsers.add_parser(
+        "scale",
+        help="time each selected solution on generated inputs of growing size",
+    )
+    scale_parser.add_argument(
+        "selectors", nargs="*", help="solutions to run (default: all with a generator)"
+    )
+    scale_parser.add_argument(
+        "-s",
+        "--scales",
+        type=int,
+        nargs="+",
+        help="input scales, relative to a real puzzle input "
+        "(default: 1 10 100, or 1 2 4 for the super-linear days)",
+    )
+    scale_parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the input generators"
+    )
+    scale_parser.add_argument(
+        "-n", "--repeat", type=int, default=3, help="timed runs at each scale"
+    )
+    scale_parser.add_argument(
+        "--no-memory", action="store_true", help="skip the peak memory measurements"
+    )
+    scale_parser.add_argument(
+        "--parse-only",
+        action="store_true",
+        help="only time read_input, to benchmark the parsers on large inputs",
+    )
+    scale_parser.add_argument(
+        "--json", type=Path, help="also write the measurements to this JSON file"
+    )
+    scale_parser.set_defaults(func=scale)
+
+    baseline_parser = subparsers.add_parser(
+        "baseline",
+        help="record the times and peak memory of each selected solution in a baseline file",
+    )
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="measure each solution in the baseline file again and fail on regressions",
+    )
+    for sub in (baseline_parser, compare_parser):
+        sub.add_argument("selectors", nargs="*", help="solutions to measure")
+        sub.add_argument(
+            "-i",
+            "--input",
+            default="input.txt",
+            help="input path template, as for run (default: %(default)s)",
+        )
+        sub.add_argument(
+            "--scale",
+            type=int,
+            help="measure on generated inputs of this scale instead, "
+            "for days without a puzzle input",
+        )
+        sub.add_argument(
+            "--seed", type=int, default=0, help="seed of the input generators"
+        )
+        sub.add_argument(
+            "-n", "--repeat", type=int, default=5, help="cold runs of each step"
+        )
+        sub.add_argument(
+            "-b",
+            "--baseline",
+            type=Path,
+            default=DEFAULT_BASELINE,
+            help="the baseline file (default: %(default)s)",
+        )
+    baseline_parser.add_argument(
+        "--no-memory", action="store_true", help="skip the peak memory measurements"
+    )
+    baseline_parser.set_defaults(func=baseline)
+    compare_parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="fail a step that got slower by more than this fraction (default: %(default)s)",
+    )
+    compare_parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        help="fail a step whose peak memory grew by more than this fraction "
+        "(default: the --threshold)",
+    )
+    compare_parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.001,
+        help="do not judge the time of steps quicker than this, "
+        "which is mostly noise (default: %(default)s)",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,86 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from hashlib import blake2b
+
+
+@dataclass(frozen=True, slots=True)
+class Cycle[V]:
+    """The values of the states that a run went through, from the first one.
+
+    State `start + period` was the same as state `start`, so the run stopped
+    there, and every state n from `start` on is the same as state
+    `start + (n - start) % period`. A run that stopped without a repeat has a
+    `period` of 0, and covers only the states that it went through.
+    """
+
+    values: list[V]
+    start: int
+    period: int
+
+    def index(self, n: int) -> int:
+        """The index of the state that the run went through which is the same as state `n`."""
+        if n < len(self.values):
+            return n
+        if not self.period:
+            raise IndexError(f"state {n} is past the end of a run without a cycle")
+        return self.start + (n - self.start) % self.period
+
+    def value(self, n: int) -> V:
+        """The value of state `n`, for a value that the state determines."""
+        return self.values[self.index(n)]
+
+    def extrapolate(self, totals: Sequence[int], n: int) -> int:
+        """Total `n` of a running total over the states, given its `totals` for the
+        states that the run went through. Each state adds the same to it as the
+        state that it is the same as, so it grows by the same every period."""
+        i = self.index(n)
+        if i == n:
+            return totals[n]
+        per_period = totals[self.start + self.period] - totals[self.start]
+        return totals[i] + (n - i) // self.period * per_period
+
+
+def _fingerprint(key: bytes) -> int:
+    return int.from_bytes(blake2b(key, digest_size=8).digest())
+
+
+def find_cycle[S, V](
+    state: S,
+    step: Callable[[S], S],
+    key: Callable[[S], bytes],
+    value: Callable[[S], V],
+    steps: int,
+) -> Cycle[V]:
+    """Steps from `state` until the states repeat, or `steps` times.
+
+    `step` gives the next state, and may change the one that it is given to get
+    it. States are the same when their `key`s are, which must pack whatever
+    decides the states that follow. Only a 64-bit hash of each key is kept, and
+    the `value` of each state.
+
+    A hash that was seen `period` steps back only hints at a cycle. The key of
+    the state is kept, and compared with the key of the state `period` steps
+    later, so that a collision of hashes cannot pass for a cycle. A cycle that
+    is confirmed starts at the first of those two states rather than where it
+    really starts, which costs at most a period of steps more.
+    """
+    seen: dict[int, int] = {}
+    values: list[V] = []
+    # The state that a hint of a cycle is checked against, as (index, key, period).
+    hint: tuple[int, bytes, int] | None = None
+    for i in range(steps + 1):
+        if i:
+            state = step(state)
+        values.append(value(state))
+        k = key(state)
+        if hint is not None and i == hint[0] + hint[2]:
+            start, start_key, period = hint
+            if k == start_key:
+                return Cycle(values, start, period)
+            hint = None
+        h = _fingerprint(k)
+        j = seen.get(h)
+        if j is not None and hint is None:
+            hint = i, k, i - j
+        seen[h] = i
+    return Cycle(values, len(values), 0)
@@ -0,0 +1,1162 @@
+"""Seeded generators of synthetic puzzle inputs, for the scaling benchmarks.
+
+Each generator writes an input in the format of its day, sized so that scale 1
+is roughly as large as a real puzzle input, and scale `k` is about `k` times as
+large in the quantity that drives the solution (lines, cells, path length, ...).
+
+A few days are left out on purpose, since their inputs have a fixed size or a
+hand-crafted structure that the solutions rely on: 2022/day_10 (the CRT is 240
+cycles), 2023/day_06, 2023/day_21 (131x131 diamond garden), 2023/day_23 (the
+slope maze), 2024/day_17 (the program), 2024/day_18 (71x71 memory space) and
+2024/day_24 (the 45 bit adder).
+"""
+
+import json
+import math
+import random
+import string
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+DEFAULT_SCALES = (1, 10, 100)
+# For solutions that are quadratic or worse in the size of their input.
+SMALL_SCALES = (1, 2, 4)
+
+type Generate = Callable[[random.Random, int], str]
+
+
+@dataclass(slots=True, frozen=True)
+class InputGenerator:
+    name: str
+    generate: Generate
+    scales: tuple[int, ...]
+
+    def __call__(self, scale: int, seed: int = 0) -> str:
+        # String seeds are hashed deterministically, unlike tuples.
+        rng = random.Random(f"{self.name}:{scale}:{seed}")
+        return self.generate(rng, scale)
+
+
+GENERATORS: dict[str, InputGenerator] = {}
+
+
+def generator(
+    name: str, scales: tuple[int, ...] = DEFAULT_SCALES
+) -> Callable[[Generate], Generate]:
+    def register(generate: Generate) -> Generate:
+        GENERATORS[name] = InputGenerator(name, generate, scales)
+        return generate
+
+    return register
+
+
+def _side(base: int, scale: int) -> int:
+    """Side of a square-ish grid whose area grows linearly with `scale`."""
+    return max(1, round(base * math.sqrt(scale)))
+
+
+def _lines(lines: Iterable[str]) -> str:
+    return "".join(line + "\n" for line in lines)
+
+
+def _names(rng: random.Random, count: int, length: int, alphabet: str) -> list[str]:
+    names: set[str] = set()
+    while len(names) < count:
+        names.add("".join(rng.choices(alphabet, k=length)))
+    return sorted(names, key=lambda _: rng.random())
+
+
+# 2022
+
+
+@generator("2022/day_01")
+def calories(rng: random.Random, scale: int) -> str:
+    elves = (
+        [str(rng.randint(1_000, 60_000)) for _ in range(rng.randint(1, 15))]
+        for _ in range(250 * scale)
+    )
+    return "\n".join("\n".join(elf) + "\n" for elf in elves)
+
+
+@generator("2022/day_02")
+def strategy_guide(rng: random.Random, scale: int) -> str:
+    return _lines(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(2_500 * scale)
+    )
+
+
+@generator("2022/day_03")
+def rucksacks(rng: random.Random, scale: int) -> str:
+    lines: list[str] = []
+    for _ in range(100 * scale):
+        badge = rng.choice(string.ascii_letters)
+        for _ in range(3):
+            n = rng.randint(8, 24)
+            shared = rng.choice(string.ascii_letters)
+            first = [shared, badge] + rng.choices(string.ascii_letters, k=n - 2)
+            second = [shared] + rng.choices(string.ascii_letters, k=n - 1)
+            rng.shuffle(first)
+            rng.shuffle(second)
+            lines.append("".join(first + second))
+    return _lines(lines)
+
+
+@generator("2022/day_04")
+def section_pairs(rng: random.Random, scale: int) -> str:
+    def section() -> str:
+        a, b = sorted(rng.randint(1, 99) for _ in range(2))
+        return f"{a}-{b}"
+
+    return _lines(f"{section()},{section()}" for _ in range(1_000 * scale))
+
+
+@generator("2022/day_05")
+def crate_stacks(rng: random.Random, scale: int) -> str:
+    n_stacks = 9
+    heights = [rng.randint(2, 8) for _ in range(n_stacks)]
+    stacks = [rng.choices(string.ascii_uppercase, k=h) for h in heights]
+    rows: list[str] = []
+    for level in reversed(range(max(heights))):
+        rows.append(
+            " ".join(
+                f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+            )
+        )
+    rows.append(" " + "   ".join(str(i + 1) for i in range(n_stacks)) + " ")
+
+    # No stack is ever emptied, since the answers read the top of every stack.
+    moves: list[str] = []
+    for _ in range(500 * scale):
+        source = rng.choice([i for i in range(n_stacks) if heights[i] > 1])
+        target = rng.choice([i for i in range(n_stacks) if i != source])
+        num = rng.randint(1, min(heights[source] - 1, 10))
+        heights[source] -= num
+        heights[target] += num
+        moves.append(f"move {num} from {source + 1} to {target + 1}")
+
+    return _lines(rows) + "\n" + _lines(moves)
+
+
+@generator("2022/day_06")
+def datastream(rng: random.Random, scale: int) -> str:
+    # Only three distinct letters, so no marker shows up before the very end.
+    prefix = rng.choices("abc", k=4_096 * scale)
+    return "".join(prefix) + string.ascii_lowercase[:14] + "\n"
+
+
+@generator("2022/day_07")
+def terminal_output(rng: random.Random, scale: int) -> str:
+    children: list[list[int]] = [[]]
+    depth = [0]
+    for i in range(1, 180 * scale):
+        parent = rng.choice([d for d in range(i) if depth[d] < 10])
+        children[parent].append(i)
+        children.append([])
+        depth.append(depth[parent] + 1)
+
+    lines = ["$ cd /"]
+
+    def listing(d: int) -> None:
+        lines.append("$ ls")
+        lines.extend(f"dir d{child}" for child in children[d])
+        lines.extend(
+            f"{rng.randint(1_000, 300_000)} f{k}.{rng.choice(['txt', 'dat', 'log'])}"
+            for k in range(rng.randint(0, 5))
+        )
+        for child in children[d]:
+            lines.append(f"$ cd d{child}")
+            listing(child)
+            lines.append("$ cd ..")
+
+    listing(0)
+    return _lines(lines)
+
+
+@generator("2022/day_08")
+def tree_heights(rng: random.Random, scale: int) -> str:
+    n = _side(99, scale)
+    return _lines("".join(rng.choices(string.digits, k=n)) for _ in range(n))
+
+
+@generator("2022/day_09")
+def rope_motions(rng: random.Random, scale: int) -> str:
+    return _lines(
+        f"{rng.choice('LRUD')} {rng.randint(1, 19)}" for _ in range(2_000 * scale)
+    )
+
+
+@generator("2022/day_11")
+def monkeys(rng: random.Random, scale: int) -> str:
+    n = 8
+    divisors = [2, 3, 5, 7, 11, 13, 17, 19]
+    rng.shuffle(divisors)
+    operations = ["old * old", f"old * {rng.randint(2, 19)}"] + [
+        f"old + {rng.randint(1, 8)}" for _ in range(n - 2)
+    ]
+    rng.shuffle(operations)
+    specs: list[str] = []
+    for i in range(n):
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8) * scale)]
+        if_true, if_false = rng.sample([j for j in range(n) if j != i], 2)
+        specs.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {', '.join(map(str, items))}\n"
+            f"  Operation: new = {operations[i]}\n"
+            f"  Test: divisible by {divisors[i]}\n"
+            f"    If true: throw to monkey {if_true}\n"
+            f"    If false: throw to monkey {if_false}\n"
+        )
+    return "\n".join(specs)
+
+
+@generator("2022/day_12")
+def heightmap(rng: random.Random, scale: int) -> str:
+    m, n = _side(41, scale), _side(170, scale)
+    rows: list[list[str]] = []
+    for i in range(m):
+        row: list[str] = []
+        for j in range(n):
+            h = j * 25 // (n - 1)
+            # The top row and the last column stay clean, so a path always exists.
+            if i > 0 and j < n - 1 and rng.random() < 0.3:
+                h = max(0, h - rng.randint(1, 2))
+            row.append(chr(ord("a") + h))
+        rows.append(row)
+    rows[0][0] = "S"
+    rows[m // 2][n - 1] = "E"
+    return _lines("".join(row) for row in rows)
+
+
+@generator("2022/day_13")
+def packets(rng: random.Random, scale: int) -> str:
+    def packet(depth: int = 0) -> list[object]:
+        return [
+            packet(depth + 1) if depth < 3 and rng.random() < 0.3 else rng.randint(0, 10)
+            for _ in range(rng.randint(0, 5))
+        ]
+
+    def dump(p: list[object]) -> str:
+        return json.dumps(p, separators=(",", ":"))
+
+    return "\n".join(
+        f"{dump(packet())}\n{dump(packet())}\n" for _ in range(150 * scale)
+    )
+
+
+@generator("2022/day_14", SMALL_SCALES)
+def rock_paths(rng: random.Random, scale: int) -> str:
+    depth = _side(170, scale)
+    lines: list[str] = []
+    for _ in range(150 * scale):
+        x, y = rng.randint(500 - depth // 2, 500 + depth // 2), rng.randint(10, depth)
+        points = [(x, y)]
+        for k in range(rng.randint(1, 4)):
+            if k % 2 == 0:
+                x += rng.randint(-6, 6)
+            else:
+                y = min(depth, max(10, y + rng.randint(-6, 6)))
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return _lines(lines)
+
+
+@generator("2022/day_15")
+def sensors(rng: random.Random, scale: int) -> str:
+    bound = 4_000_000
+    hidden = rng.randint(0, bound), rng.randint(0, bound)
+    lines: list[str] = []
+    while len(lines) < 30 * scale:
+        x, y = rng.randint(0, bound), rng.randint(0, bound)
+        # Every sensor's range stops just short of the hidden beacon.
+        r = abs(x - hidden[0]) + abs(y - hidden[1]) - 1
+        if r < 1:
+            continue
+        dx = rng.randint(-r, r)
+        dy = rng.choice((-1, 1)) * (r - abs(dx))
+        lines.append(
+            f"Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y + dy}"
+        )
+    return _lines(lines)
+
+
+@generator("2022/day_16", SMALL_SCALES)
+def valves(rng: random.Random, scale: int) -> str:
+    all_names = [a + b for a in string.ascii_uppercase for b in string.ascii_uppercase]
+    all_names.remove("AA")
+    n = min(len(all_names) + 1, 60 * scale)
+    names = ["AA"] + rng.sample(all_names, n - 1)
+    edges: set[tuple[int, int]] = set()
+    for i in range(1, n):
+        edges.add((rng.randrange(i), i))
+    for _ in range(n // 4):
+        u, v = rng.sample(range(n), 2)
+        edges.add((min(u, v), max(u, v)))
+    tunnels: list[list[str]] = [[] for _ in range(n)]
+    for u, v in edges:
+        tunnels[u].append(names[v])
+        tunnels[v].append(names[u])
+    rates = [0] * n
+    for i in rng.sample(range(1, n), 15):
+        rates[i] = rng.randint(3, 25)
+
+    lines: list[str] = []
+    for i in range(n):
+        if len(tunnels[i]) == 1:
+            rest = f"tunnel leads to valve {tunnels[i][0]}"
+        else:
+            rest = f"tunnels lead to valves {', '.join(tunnels[i])}"
+        lines.append(f"Valve {names[i]} has flow rate={rates[i]}; {rest}")
+    return _lines(lines)
+
+
+@generator("2022/day_17")
+def jets(rng: random.Random, scale: int) -> str:
+    return "".join(rng.choices("<>", k=10_091 * scale)) + "\n"
+
+
+@generator("2022/day_18")
+def lava_droplet(rng: random.Random, scale: int) -> str:
+    side = max(2, round(20 * scale ** (1 / 3)))
+    cubes = {
+        (rng.randint(1, side), rng.randint(1, side), rng.randint(1, side))
+        for _ in range(round(0.35 * side**3))
+    }
+    return _lines(f"{x},{y},{z}" for x, y, z in sorted(cubes))
+
+
+@generator("2022/day_19", SMALL_SCALES)
+def blueprints(rng: random.Random, scale: int) -> str:
+    def cost() -> int:
+        return rng.randint(2, 4)
+
+    return _lines(
+        f"Blueprint {i}: Each ore robot costs {cost()} ore. "
+        f"Each clay robot costs {cost()} ore. "
+        f"Each obsidian robot costs {cost()} ore and {rng.randint(5, 20)} clay. "
+        f"Each geode robot costs {cost()} ore and {rng.randint(5, 20)} obsidian."
+        for i in range(1, 30 * scale + 1)
+    )
+
+
+@generator("2022/day_20", SMALL_SCALES)
+def encrypted_file(rng: random.Random, scale: int) -> str:
+    n = 5_000 * scale
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10_000) for _ in range(n - 1)]
+    numbers.insert(rng.randrange(n), 0)
+    return _lines(map(str, numbers))
+
+
+@generator("2022/day_21")
+def monkey_riddle(rng: random.Random, scale: int) -> str:
+    leaves = 1_000 * scale
+    names = iter(
+        name
+        for name in _names(rng, 2 * leaves + 2, 4, string.ascii_lowercase)
+        if name not in ("root", "humn")
+    )
+    humn_leaf = rng.randrange(1, leaves - 1)
+    lines: list[str] = []
+
+    def build(lo: int, hi: int) -> tuple[str, int, bool]:
+        """Returns the name and value of the monkey over leaves lo..hi-1, and whether humn is below it."""
+        if hi - lo == 1:
+            name = "humn" if lo == humn_leaf else next(names)
+            value = rng.randint(1, 20)
+            lines.append(f"{name}: {value}")
+            return name, value, lo == humn_leaf
+        mid = rng.randint(lo + 1, hi - 1)
+        left, a, left_humn = build(lo, mid)
+        right, b, right_humn = build(mid, hi)
+        ops = ["+"] + ["*"] * (a * b <= 1_000_000)
+        # With humn on the right, keep to operations whose inverse is exact.
+        if not right_humn:
+            ops += ["-"] * (a > b) + ["/"] * (b > 1 and a % b == 0)
+        op = rng.choice(ops)
+        value = {"+": a + b, "*": a * b, "-": a - b, "/": a // b}[op]
+        name = next(names)
+        lines.append(f"{name}: {left} {op} {right}")
+        return name, value, left_humn or right_humn
+
+    mid = rng.randint(1, leaves - 1)
+    left, _, _ = build(0, mid)
+    right, _, _ = build(mid, leaves)
+    lines.append(f"root: {left} + {right}")
+    rng.shuffle(lines)
+    return _lines(lines)
+
+
+@generator("2022/day_22")
+def monkey_map(rng: random.Random, scale: int) -> str:
+    n = 150
+    rows = ["".join(rng.choices(".#", weights=(9, 1), k=n)) for _ in range(n)]
+    rows[0] = "." + rows[0][1:]
+    steps = [str(rng.randint(1, 50)) for _ in range(2_000 * scale)]
+    turns = rng.choices("LR", k=len(steps) - 1)
+    path = "".join(s + t for s, t in zip(steps, turns)) + steps[-1]
+    return _lines(rows) + "\n" + path + "\n"
+
+
+@generator("2022/day_23", SMALL_SCALES)
+def elves(rng: random.Random, scale: int) -> str:
+    n = _side(72, scale)
+    return _lines("".join(rng.choices(".#", k=n)) for _ in range(n))
+
+
+@generator("2022/day_24", SMALL_SCALES)
+def blizzard_valley(rng: random.Random, scale: int) -> str:
+    # The width is a multiple of the height, so the blizzards repeat every `w` minutes.
+    h = _side(25, scale)
+    w = 5 * h
+    rows = ["#." + "#" * w]
+    for _ in range(h):
+        cells = rng.choices("<>^v.", weights=(1, 1, 1, 1, 3), k=w)
+        # Nothing blows through the columns of the entrance and the exit.
+        for j in (0, w - 1):
+            if cells[j] in "^v":
+                cells[j] = "."
+        rows.append("#" + "".join(cells) + "#")
+    rows.append("#" * w + ".#")
+    return _lines(rows)
+
+
+@generator("2022/day_25")
+def snafu_numbers(rng: random.Random, scale: int) -> str:
+    return _lines(
+        rng.choice("12") + "".join(rng.choices("=-012", k=rng.randint(0, 19)))
+        for _ in range(120 * scale)
+    )
+
+
+# 2023
+
+DIGIT_WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+@generator("2023/day_01")
+def calibration(rng: random.Random, scale: int) -> str:
+    lines: list[str] = []
+    for _ in range(1_000 * scale):
+        tokens = [
+            rng.choice(DIGIT_WORDS) if rng.random() < 0.2 else rng.choice(string.ascii_lowercase + string.digits)
+            for _ in range(rng.randint(3, 20))
+        ]
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice("123456789"))
+        lines.append("".join(tokens))
+    return _lines(lines)
+
+
+@generator("2023/day_02")
+def cube_games(rng: random.Random, scale: int) -> str:
+    def draw() -> str:
+        colors = rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+        return ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+
+    return _lines(
+        f"Game {i}: " + "; ".join(draw() for _ in range(rng.randint(1, 6)))
+        for i in range(1, 100 * scale + 1)
+    )
+
+
+@generator("2023/day_03")
+def engine_schematic(rng: random.Random, scale: int) -> str:
+    n = _side(140, scale)
+    rows: list[str] = []
+    for _ in range(n):
+        row: list[str] = []
+        while len(row) < n:
+            r = rng.random()
+            if r < 0.1 and len(row) + 4 <= n:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif r < 0.15:
+                row.append(rng.choice("*#+$/=%@&-"))
+            else:
+                row.append(".")
+        rows.append("".join(row[:n]))
+    return _lines(rows)
+
+
+@generator("2023/day_04")
+def scratchcards(rng: random.Random, scale: int) -> str:
+    n = 200 * scale
+    lines: list[str] = []
+    for i in range(n):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        # A card must not win copies of cards past the end of the table.
+        k = min(rng.choice((0, 0, 1, 2, 3, 5, 10)), n - 1 - i)
+        have = rng.sample(winning, k) + others[: 25 - k]
+        rng.shuffle(have)
+        lines.append(
+            f"Card {i + 1:>3}: "
+            + " ".join(f"{x:>2}" for x in winning)
+            + " | "
+            + " ".join(f"{x:>2}" for x in have)
+        )
+    return _lines(lines)
+
+
+@generator("2023/day_05")
+def almanac(rng: random.Random, scale: int) -> str:
+    total = 4_000_000_000
+    n_ranges = 30 * scale
+    seeds: list[int] = []
+    for _ in range(10 * scale):
+        start = rng.randrange(total - 100_000_000)
+        seeds += [start, rng.randint(1, 100_000_000)]
+    blocks = [f"seeds: {' '.join(map(str, seeds))}"]
+    names = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+    for source, dest in zip(names, names[1:]):
+        # The map is a bijection, which shuffles the segments between the cuts.
+        cuts = sorted(rng.sample(range(1, total), n_ranges - 1))
+        segments = list(zip([0] + cuts, cuts + [total]))
+        shuffled = segments[:]
+        rng.shuffle(shuffled)
+        dest_start = 0
+        lines = [f"{source}-to-{dest} map:"]
+        for lo, hi in shuffled:
+            lines.append(f"{dest_start} {lo} {hi - lo}")
+            dest_start += hi - lo
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+@generator("2023/day_07")
+def camel_cards(rng: random.Random, scale: int) -> str:
+    return _lines(
+        f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1_000)}"
+        for _ in range(1_000 * scale)
+    )
+
+
+@generator("2023/day_08")
+def desert_network(rng: random.Random, scale: int) -> str:
+    directions = "".join(rng.choices("LR", k=263))
+    lines: list[str] = []
+    # Every ghost walks a loop whose only target is as far from the source as
+    # from itself, which is what the lcm in part 2 relies on.
+    for ghost in range(6):
+        length = _next_prime(rng.randint(800, 1_200) * scale)
+        source, target = ("AAA", "ZZZ") if ghost == 0 else (f"S{ghost}A", f"T{ghost}Z")
+        loop = [f"N{ghost}x{i}" for i in range(length - 1)] + [target]
+        lines.append(f"{source} = ({loop[0]}, {loop[0]})")
+        for a, b in zip(loop, loop[1:] + loop[:1]):
+            lines.append(f"{a} = ({b}, {b})")
+    rng.shuffle(lines)
+    return directions + "\n\n" + _lines(lines)
+
+
+def _next_prime(n: int) -> int:
+    while any(n % p == 0 for p in range(2, math.isqrt(n) + 1)):
+        n += 1
+    return n
+
+
+@generator("2023/day_09")
+def oasis_report(rng: random.Random, scale: int) -> str:
+    def sequence() -> list[int]:
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 9))]
+        return [
+            sum(c * math.comb(x, k) for k, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+
+    return _lines(" ".join(map(str, sequence())) for _ in range(200 * scale))
+
+
+@generator("2023/day_10")
+def pipe_maze(rng: random.Random, scale: int) -> str:
+    h = w = _side(140, scale)
+    # A comb shaped loop: right along the top row, then back left through U
+    # shaped teeth that hang from the second row. The insides of the teeth are
+    # enclosed by the loop.
+    loop = [(0, j) for j in range(w)]
+
+    def walk_to(i: int, j: int) -> None:
+        ci, cj = loop[-1]
+        di, dj = (i > ci) - (i < ci), (j > cj) - (j < cj)
+        while (ci, cj) != (i, j):
+            ci, cj = ci + di, cj + dj
+            loop.append((ci, cj))
+
+    j = w - 1
+    walk_to(1, j)
+    while (width := rng.randint(1, 4)) < j:
+        depth = rng.randint(3, h - 1)
+        walk_to(depth, j)
+        j -= width + 1
+        walk_to(depth, j)
+        walk_to(1, j)
+        j = max(0, j - rng.randint(1, 3))
+        walk_to(1, j)
+    walk_to(1, 0)
+
+    pipes = {
+        frozenset(((-1, 0), (1, 0))): "|",
+        frozenset(((0, -1), (0, 1))): "-",
+        frozenset(((-1, 0), (0, 1))): "L",
+        frozenset(((-1, 0), (0, -1))): "J",
+        frozenset(((1, 0), (0, -1))): "7",
+        frozenset(((1, 0), (0, 1))): "F",
+    }
+    grid = [rng.choices("|-LJ7F.", k=w) for _ in range(h)]
+    on_loop = set(loop)
+    for k, (i, j) in enumerate(loop):
+        prev, succ = loop[k - 1], loop[(k + 1) % len(loop)]
+        grid[i][j] = pipes[frozenset(((prev[0] - i, prev[1] - j), (succ[0] - i, succ[1] - j)))]
+
+    si, sj = rng.choice([(i, j) for i, j in loop if 0 < i < h - 1 and 0 < j < w - 1])
+    grid[si][sj] = "S"
+    # Pipes next to S that are not on the loop must not look connected to it.
+    for di, dj in (0, 1), (-1, 0), (0, -1), (1, 0):
+        if (si + di, sj + dj) not in on_loop:
+            grid[si + di][sj + dj] = "|" if di == 0 else "-"
+    return _lines("".join(row) for row in grid)
+
+
+@generator("2023/day_11")
+def galaxies(rng: random.Random, scale: int) -> str:
+    n = _side(140, scale)
+    empty_rows = set(rng.sample(range(n), n // 20))
+    empty_cols = set(rng.sample(range(n), n // 20))
+    return _lines(
+        "".join(
+            "#" if i not in empty_rows and j not in empty_cols and rng.random() < 0.025 else "."
+            for j in range(n)
+        )
+        for i in range(n)
+    )
+
+
+@generator("2023/day_12")
+def spring_records(rng: random.Random, scale: int) -> str:
+    lines: list[str] = []
+    for _ in range(1_000 * scale):
+        springs = rng.choices(".#", k=rng.randint(1, 20))
+        springs[rng.randrange(len(springs))] = "#"
+        groups = [len(run) for run in "".join(springs).split(".") if run]
+        masked = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        lines.append(f"{masked} {','.join(map(str, groups))}")
+    return _lines(lines)
+
+
+@generator("2023/day_13")
+def mirror_patterns(rng: random.Random, scale: int) -> str:
+    patterns: list[str] = []
+    for _ in range(100 * scale):
+        h, w = rng.randint(7, 17), rng.randint(7, 17)
+        vertical = rng.random() < 0.5
+        if vertical:
+            h, w = w, h
+        rows = [rng.choices("#.", k=w) for _ in range(h)]
+        axis = rng.randint(1, h - 1)
+        for t in range(min(axis, h - axis)):
+            rows[axis + t] = rows[axis - 1 - t][:]
+        if rng.random() < 0.5:
+            # A single smudge, for part 2.
+            t = rng.randrange(min(axis, h - axis))
+            j = rng.randrange(w)
+            rows[axis + t][j] = "." if rows[axis + t][j] == "#" else "#"
+        if vertical:
+            rows = [list(col) for col in zip(*rows)]
+        patterns.append(_lines("".join(row) for row in rows))
+    return "\n".join(patterns)
+
+
+@generator("2023/day_14")
+def rock_platform(rng: random.Random, scale: int) -> str:
+    n = _side(100, scale)
+    return _lines(
+        "".join(rng.choices("O#.", weights=(2, 1, 7), k=n)) for _ in range(n)
+    )
+
+
+@generator("2023/day_15")
+def init_sequence(rng: random.Random, scale: int) -> str:
+    labels = _names(rng, 500, 4, string.ascii_lowercase)
+    steps = (
+        f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-"
+        for label in rng.choices(labels, k=4_000 * scale)
+    )
+    return ",".join(steps) + "\n"
+
+
+@generator("2023/day_16", SMALL_SCALES)
+def mirror_contraption(rng: random.Random, scale: int) -> str:
+    n = _side(110, scale)
+    return _lines(
+        "".join(rng.choices(".|-/\\", weights=(36, 1, 1, 1, 1), k=n)) for _ in range(n)
+    )
+
+
+@generator("2023/day_17", SMALL_SCALES)
+def heat_loss_map(rng: random.Random, scale: int) -> str:
+    n = _side(141, scale)
+    return _lines("".join(rng.choices("123456789", k=n)) for _ in range(n))
+
+
+@generator("2023/day_18")
+def dig_plan(rng: random.Random, scale: int) -> str:
+    m = 175 * scale
+
+    def polygon(max_step: int) -> list[tuple[str, int]]:
+        # A staircase to the right, then the same staircase shifted down and
+        # walked back, so the loop never crosses itself.
+        upper: list[tuple[str, int]] = []
+        y = lo = hi = 0
+        for k in range(m):
+            upper.append(("R", rng.randint(1, max_step)))
+            if k < m - 1:
+                dy = rng.randint(1, max_step)
+                direction = "D" if y > 0 else "U" if y < 0 else rng.choice("UD")
+                y += dy if direction == "U" else -dy
+                lo, hi = min(lo, y), max(hi, y)
+                upper.append((direction, dy))
+        shift = hi - lo + 1
+        opposite = {"R": "L", "U": "D", "D": "U"}
+        lower = [(opposite[d], k) for d, k in reversed(upper)]
+        return upper + [("D", shift)] + lower + [("U", shift)]
+
+    plan_1 = polygon(10)
+    plan_2 = polygon(400_000)
+    hex_directions = {"R": 0, "D": 1, "L": 2, "U": 3}
+    return _lines(
+        f"{d1} {k1} (#{k2:05x}{hex_directions[d2]})"
+        for (d1, k1), (d2, k2) in zip(plan_1, plan_2)
+    )
+
+
+@generator("2023/day_19")
+def workflows(rng: random.Random, scale: int) -> str:
+    n = 550 * scale
+    names = ["in"] + [
+        name for name in _names(rng, n, 3, string.ascii_lowercase) if name != "in"
+    ][: n - 1]
+    queue = deque(names[:1])
+    used = 1
+    lines: list[str] = []
+    while queue:
+        name = queue.popleft()
+        targets: list[str] = []
+        for slot in range(rng.randint(2, 4)):
+            force = not queue and slot == 0
+            if used < n and (force or rng.random() < 0.6):
+                targets.append(names[used])
+                queue.append(names[used])
+                used += 1
+            else:
+                targets.append(rng.choice("AR"))
+        *conditions, fallback = targets
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4_000)}:{target}"
+            for target in conditions
+        ]
+        lines.append(f"{name}{{{','.join(rules + [fallback])}}}")
+    rng.shuffle(lines)
+    parts = (
+        "{" + ",".join(f"{v}={rng.randint(1, 4_000)}" for v in "xmas") + "}"
+        for _ in range(200 * scale)
+    )
+    return _lines(lines) + "\n" + _lines(parts)
+
+
+@generator("2023/day_20")
+def pulse_modules(rng: random.Random, scale: int) -> str:
+    # Each block is a 12 bit counter that resets, and fires its inverter, at
+    # its own period. The periods are what part 2 looks for.
+    bits = 12
+    periods = rng.sample(range(2_049, 4_096, 2), 4 * scale)
+    lines = [f"broadcaster -> {', '.join(f'f{k}x0' for k in range(len(periods)))}"]
+    for k, period in enumerate(periods):
+        flipflops = [f"f{k}x{i}" for i in range(bits)]
+        counter, inverter = f"c{k}x", f"i{k}x"
+        for i, flipflop in enumerate(flipflops):
+            targets = flipflops[i + 1 : i + 2] + [counter] * ((period >> i) & 1)
+            lines.append(f"%{flipflop} -> {', '.join(targets)}")
+        resets = [flipflops[i] for i in range(bits) if not (period >> i) & 1]
+        lines.append(f"&{counter} -> {', '.join(resets + [flipflops[0], inverter])}")
+        lines.append(f"&{inverter} -> px")
+    lines.append("&px -> rx")
+    return _lines(lines)
+
+
+@generator("2023/day_22")
+def sand_bricks(rng: random.Random, scale: int) -> str:
+    n = 1_200 * scale
+    height = 300 * scale
+    occupied: set[tuple[int, int, int]] = set()
+    lines: list[str] = []
+    while len(lines) < n:
+        start = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, height)]
+        end = start[:]
+        axis = rng.randrange(3)
+        end[axis] += rng.randint(0, 3)
+        if end[0] > 9 or end[1] > 9:
+            continue
+        cells = {
+            (x, y, z)
+            for x in range(start[0], end[0] + 1)
+            for y in range(start[1], end[1] + 1)
+            for z in range(start[2], end[2] + 1)
+        }
+        if cells & occupied:
+            continue
+        occupied |= cells
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    return _lines(lines)
+
+
+@generator("2023/day_24", SMALL_SCALES)
+def hailstones(rng: random.Random, scale: int) -> str:
+    # All hailstones are on a collision course with a single rock.
+    rock = [rng.randint(200_000_000_000_000, 400_000_000_000_000) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    lines: list[str] = []
+    for _ in range(300 * scale):
+        t = rng.randint(1, 1_000_000_000_000)
+        velocity = [rng.randint(-300, 300) for _ in range(3)]
+        position = [q + t * (dq - dp) for q, dq, dp in zip(rock, rock_velocity, velocity)]
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+    return _lines(lines)
+
+
+@generator("2023/day_25")
+def wiring(rng: random.Random, scale: int) -> str:
+    # Two dense clusters joined by exactly three wires.
+    n = 1_500 * scale
+    names = _names(rng, n, 5, string.ascii_lowercase)
+    halves = names[: n // 2], names[n // 2 :]
+    edges: set[tuple[str, str]] = set()
+    for half in halves:
+        for i, u in enumerate(half[1:], 1):
+            for v in rng.sample(half[:i], min(i, 3)):
+                edges.add((u, v))
+    for _ in range(3):
+        edges.add((rng.choice(halves[0]), rng.choice(halves[1])))
+    adjacency: dict[str, list[str]] = {}
+    for u, v in edges:
+        adjacency.setdefault(u, []).append(v)
+    return _lines(f"{u}: {' '.join(vs)}" for u, vs in adjacency.items())
+
+
+# 2024
+
+
+@generator("2024/day_01")
+def location_lists(rng: random.Random, scale: int) -> str:
+    n = 1_000 * scale
+    left = rng.sample(range(10_000, 100_000), n)
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10_000, 99_999) for _ in range(n)]
+    return _lines(f"{a}   {b}" for a, b in zip(left, right))
+
+
+@generator("2024/day_02")
+def reactor_reports(rng: random.Random, scale: int) -> str:
+    def report() -> list[int]:
+        sign = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] += rng.randint(-5, 5)
+        return levels
+
+    return _lines(" ".join(map(str, report())) for _ in range(1_000 * scale))
+
+
+@generator("2024/day_03")
+def corrupted_memory(rng: random.Random, scale: int) -> str:
+    tokens = [
+        lambda: f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})",
+        lambda: f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)})",
+        lambda: "do()",
+        lambda: "don't()",
+        lambda: "".join(rng.choices(string.punctuation + "mul", k=rng.randint(1, 8))),
+    ]
+    lines = [
+        "".join(rng.choices(tokens, weights=(6, 1, 1, 1, 8))[0]() for _ in range(200))
+        for _ in range(6 * scale)
+    ]
+    return _lines(lines)
+
+
+@generator("2024/day_04")
+def word_search(rng: random.Random, scale: int) -> str:
+    n = _side(140, scale)
+    return _lines("".join(rng.choices("XMAS", k=n)) for _ in range(n))
+
+
+@generator("2024/day_05")
+def print_queue(rng: random.Random, scale: int) -> str:
+    # The rules order every pair of pages, as in the real puzzle input.
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{x}|{y}" for i, x in enumerate(pages) for y in pages[i + 1 :]]
+    rng.shuffle(rules)
+    rank = {page: i for i, page in enumerate(pages)}
+
+    def update() -> str:
+        sample = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            sample.sort(key=rank.__getitem__)
+        return ",".join(map(str, sample))
+
+    updates = (update() for _ in range(200 * scale))
+    return _lines(rules) + "\n" + _lines(updates)
+
+
+@generator("2024/day_06", SMALL_SCALES)
+def guard_lab(rng: random.Random, scale: int) -> str:
+    n = _side(130, scale)
+    grid = [rng.choices(".#", weights=(15, 1), k=n) for _ in range(n)]
+
+    def patrol_length(i: int, j: int) -> int:
+        # Steps until the guard leaves the lab, or 0 if the guard never does.
+        di, dj = -1, 0
+        seen: set[tuple[int, int, int, int]] = set()
+        while 0 <= i < n and 0 <= j < n:
+            if (i, j, di, dj) in seen:
+                return 0
+            seen.add((i, j, di, dj))
+            if 0 <= i + di < n and 0 <= j + dj < n and grid[i + di][j + dj] == "#":
+                di, dj = dj, -di
+            else:
+                i, j = i + di, j + dj
+        return len(seen)
+
+    # Random labs mostly let the guard out in a few steps, so start the guard
+    # where the patrol is longest.
+    starts = [(rng.randrange(n), rng.randrange(n)) for _ in range(200)]
+    i, j = max((s for s in starts if grid[s[0]][s[1]] == "."), key=lambda s: patrol_length(*s))
+    grid[i][j] = "^"
+    return _lines("".join(row) for row in grid)
+
+
+@generator("2024/day_07")
+def calibration_equations(rng: random.Random, scale: int) -> str:
+    lines: list[str] = []
+    for _ in range(850 * scale):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        result = numbers[0]
+        for x in numbers[1:]:
+            match rng.randrange(3):
+                case 0:
+                    result += x
+                case 1:
+                    result *= x
+                case _:
+                    result = int(f"{result}{x}")
+        if rng.random() < 0.5:
+            result += 1
+        lines.append(f"{result}: {' '.join(map(str, numbers))}")
+    return _lines(lines)
+
+
+@generator("2024/day_08")
+def antennas(rng: random.Random, scale: int) -> str:
+    n = _side(50, scale)
+    frequencies = string.ascii_letters + string.digits
+    grid = [["."] * n for _ in range(n)]
+    for _ in range(n * n // 12):
+        grid[rng.randrange(n)][rng.randrange(n)] = rng.choice(frequencies)
+    return _lines("".join(row) for row in grid)
+
+
+@generator("2024/day_09", SMALL_SCALES)
+def disk_map(rng: random.Random, scale: int) -> str:
+    files = 2_000 * scale
+    digits = [rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9) for i in range(2 * files - 1)]
+    return "".join(map(str, digits)) + "\n"
+
+
+@generator("2024/day_10")
+def topographic_map(rng: random.Random, scale: int) -> str:
+    n = _side(50, scale)
+    return _lines(
+        "".join(str((i + j + (rng.random() < 0.2)) % 10) for j in range(n))
+        for i in range(n)
+    )
+
+
+@generator("2024/day_11")
+def stones(rng: random.Random, scale: int) -> str:
+    return " ".join(str(rng.randint(0, 10_000_000)) for _ in range(8 * scale)) + "\n"
+
+
+@generator("2024/day_12")
+def garden_plots(rng: random.Random, scale: int) -> str:
+    n = _side(140, scale)
+    grid = [[""] * n for _ in range(n)]
+    queue: deque[tuple[int, int]] = deque()
+    for _ in range(n * n // 80):
+        i, j = rng.randrange(n), rng.randrange(n)
+        if not grid[i][j]:
+            grid[i][j] = rng.choice(string.ascii_uppercase)
+            queue.append((i, j))
+    # Grow the regions from their seeds, one layer at a time.
+    while queue:
+        i, j = queue.popleft()
+        for ii, jj in (i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1):
+            if 0 <= ii < n and 0 <= jj < n and not grid[ii][jj]:
+                grid[ii][jj] = grid[i][j]
+                queue.append((ii, jj))
+    return _lines("".join(row) for row in grid)
+
+
+@generator("2024/day_13")
+def claw_machines(rng: random.Random, scale: int) -> str:
+    machines: list[str] = []
+    for _ in range(320 * scale):
+        a = rng.randint(10, 99), rng.randint(10, 99)
+        b = rng.randint(10, 99), rng.randint(10, 99)
+        if rng.random() < 0.5:
+            i, j = rng.randint(1, 100), rng.randint(1, 100)
+            prize = a[0] * i + b[0] * j, a[1] * i + b[1] * j
+        else:
+            prize = rng.randint(1_000, 20_000), rng.randint(1_000, 20_000)
+        machines.append(
+            f"Button A: X+{a[0]}, Y+{a[1]}\n"
+            f"Button B: X+{b[0]}, Y+{b[1]}\n"
+            f"Prize: X={prize[0]}, Y={prize[1]}\n"
+        )
+    return "\n".join(machines)
+
+
+@generator("2024/day_14", SMALL_SCALES)
+def restroom_robots(rng: random.Random, scale: int) -> str:
+    return _lines(
+        f"p={rng.randrange(101)},{rng.randrange(103)} "
+        f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        for _ in range(500 * scale)
+    )
+
+
+@generator("2024/day_15")
+def warehouse(rng: random.Random, scale: int) -> str:
+    n = 50
+    grid = [
+        ["#"] * n if i in (0, n - 1) else ["#", *rng.choices(".O#", weights=(10, 8, 1), k=n - 2), "#"]
+        for i in range(n)
+    ]
+    grid[n // 2][n // 2] = "@"
+    moves = "".join(rng.choices("<>^v", k=20_000 * scale))
+    return _lines("".join(row) for row in grid) + "\n" + _lines(
+        moves[i : i + 1_000] for i in range(0, len(moves), 1_000)
+    )
+
+
+@generator("2024/day_16", SMALL_SCALES)
+def reindeer_maze(rng: random.Random, scale: int) -> str:
+    # A depth first maze on the odd cells, with a few extra walls knocked out.
+    n = _side(70, scale) * 2 + 1
+    grid = [["#"] * n for _ in range(n)]
+    start = (n - 2, 1)
+    grid[start[0]][start[1]] = "."
+    stack = [start]
+    while stack:
+        i, j = stack[-1]
+        unvisited = [
+            (i + di, j + dj)
+            for di, dj in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < i + di < n - 1 and 0 < j + dj < n - 1 and grid[i + di][j + dj] == "#"
+        ]
+        if not unvisited:
+            stack.pop()
+            continue
+        ii, jj = rng.choice(unvisited)
+        grid[(i + ii) // 2][(j + jj) // 2] = "."
+        grid[ii][jj] = "."
+        stack.append((ii, jj))
+    for _ in range(n * n // 50):
+        i, j = rng.randrange(1, n - 1), rng.randrange(1, n - 1)
+        if (i + j) % 2 == 1:
+            grid[i][j] = "."
+    grid[n - 2][1] = "S"
+    grid[1][n - 2] = "E"
+    return _lines("".join(row) for row in grid)
+
+
+@generator("2024/day_19")
+def towel_designs(rng: random.Random, scale: int) -> str:
+    # No towel starts with "rr", so designs that do are rejected on their first
+    # letters rather than after exploring every way of splitting them.
+    towels = sorted(
+        {
+            towel
+            for towel in ("".join(rng.choices("wubrg", k=rng.randint(1, 8))) for _ in range(600))
+            if towel != "r" and not towel.startswith("rr")
+        }
+    )
+
+    def design() -> str:
+        length = rng.randint(20, 60)
+        pattern = ""
+        while len(pattern) < length:
+            pattern += rng.choice(towels)
+        return pattern
+
+    designs = (
+        ("rr" if rng.random() < 0.3 else "") + design() for _ in range(400 * scale)
+    )
+    return ", ".join(towels) + "\n\n" + _lines(designs)
+
+
+@generator("2024/day_20", SMALL_SCALES)
+def racetrack(rng: random.Random, scale: int) -> str:
+    # A single track that snakes down the odd rows, so that cheats through the
+    # walls between rows skip long stretches of it.
+    n = _side(71, scale) | 1
+    grid = [["#"] * n for _ in range(n)]
+    rows = range(1, n - 1, 2)
+    for k, i in enumerate(rows):
+        for j in range(1, n - 1):
+            grid[i][j] = "."
+        if i + 2 < n - 1:
+            grid[i + 1][n - 2 if k % 2 == 0 else 1] = "."
+    grid[1][1] = "S"
+    grid[rows[-1]][1 if len(rows) % 2 == 0 else n - 2] = "E"
+    return _lines("".join(row) for row in grid)
+
+
+@generator("2024/day_21")
+def door_codes(rng: random.Random, scale: int) -> str:
+    return _lines(
+        "".join(rng.choices(string.digits, k=3)) + "A" for _ in range(5 * scale)
+    )
+
+
+@generator("2024/day_22")
+def secret_numbers(rng: random.Random, scale: int) -> str:
+    return _lines(str(rng.randint(1, 16_777_215)) for _ in range(200 * scale))
+
+
+@generator("2024/day_23")
+def lan_party(rng: random.Random, scale: int) -> str:
+    n = 520 * scale
+    names = _names(rng, n, 2 if n <= 600 else 3, string.ascii_lowercase)
+    edges: set[frozenset[str]] = set()
+    for u in names:
+        for v in rng.sample(names, 6):
+            if u != v:
+                edges.add(frozenset((u, v)))
+    clique = rng.sample(names, 13)
+    edges.update(frozenset((u, v)) for i, u in enumerate(clique) for v in clique[i + 1 :])
+    lines = ["-".join(edge) for edge in edges]
+    rng.shuffle(lines)
+    return _lines(lines)
+
+
+@generator("2024/day_25")
+def locks_and_keys(rng: random.Random, scale: int) -> str:
+    def schematic(lock: bool) -> str:
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [
+            "".join("#" if (i <= h if lock else 6 - i <= h) else "." for h in heights)
+            for i in range(1, 6)
+        ]
+        full, empty = "#####", "....."
+        return _lines([full, *rows, empty] if lock else [empty, *rows, full])
+
+    return "\n".join(schematic(rng.random() < 0.5) for _ in range(500 * scale))
@@ -0,0 +1,89 @@
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+type UInt8Array = npt.NDArray[np.uint8]
+
+
+@dataclass(frozen=True, slots=True)
+class Grid:
+    """A rectangular grid of bytes, read whole into flat bytes with a border.
+
+    Every row is followed by `pad` bytes of fill, and there are `pad` rows of
+    fill above and below the grid. Up to `pad` steps from a cell in any
+    direction, diagonals included, land in the grid or in its border, so walks
+    that stop at the fill need no bounds checks. The default fill of one
+    newline keeps the rows as they are in the file. Cell `(i, j)` is at index
+    `(i + pad) * width + j`.
+    """
+
+    cells: bytes
+    width: int
+    pad: int = 1
+
+    @classmethod
+    def read(cls, path: str | os.PathLike[str], pad: int = 1, fill: bytes = b"\n") -> Self:
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read(), pad, fill)
+
+    @classmethod
+    def from_bytes(cls, s: bytes, pad: int = 1, fill: bytes = b"\n") -> Self:
+        if len(fill) != 1:
+            raise ValueError(f"fill must be a single byte, not {fill!r}")
+        rows = s.splitlines()
+        n = len(rows[0]) if rows else 0
+        for i, row in enumerate(rows):
+            if len(row) != n:
+                raise ValueError(f"row {i} has {len(row)} cells, not {n}: {row!r}")
+        width = n + pad
+        border = fill * (width * pad)
+        row_end = fill * pad
+        return cls(border + b"".join(row + row_end for row in rows) + border, width, pad)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.cells) // self.width - 2 * self.pad, self.width - self.pad
+
+    @property
+    def steps(self) -> tuple[int, int, int, int]:
+        """The offsets of a step up, right, down and left, each a quarter turn
+        clockwise from the one before."""
+        w = self.width
+        return -w, 1, w, -1
+
+    @property
+    def all_steps(self) -> tuple[int, ...]:
+        """The offsets of the steps to the eight cells around one: the `steps`,
+        then up and right, down and right, down and left, and up and left."""
+        w = self.width
+        return -w, 1, w, -1, -w + 1, w + 1, w - 1, -w - 1
+
+    def index(self, i: int, j: int) -> int:
+        return (i + self.pad) * self.width + j
+
+    def coords(self, p: int) -> tuple[int, int]:
+        i, j = divmod(p, self.width)
+        return i - self.pad, j
+
+    def find_all(self, value: bytes) -> list[int]:
+        """The indices of every occurrence of `value`, in order."""
+        res: list[int] = []
+        cells = self.cells
+        p = cells.find(value)
+        while p != -1:
+            res.append(p)
+            p = cells.find(value, p + 1)
+        return res
+
+    def array(self) -> UInt8Array:
+        """A read-only NumPy view of the grid, without its border, as an m by n
+        array of bytes."""
+        import numpy as np
+
+        full = np.frombuffer(self.cells, dtype=np.uint8).reshape(-1, self.width)
+        m, n = self.shape
+        return full[self.pad : self.pad + m, :n]
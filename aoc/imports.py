@@ -0,0 +1,129 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.solutions import ROOT, Solution
+from aoc.timing import format_seconds
+
+# Printed to stderr by the child right before it executes the solution, so that
+# the import times of the interpreter's own startup can be told apart.
+_MARKER = "-- aoc: loading the solution --"
+# Executes a solution's source without running its main(), like Solution.load.
+_LOADER = f"""\
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("solution", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules["solution"] = module
+print({_MARKER!r}, file=sys.stderr, flush=True)
+spec.loader.exec_module(module)
+"""
+_IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+@dataclass(slots=True, frozen=True)
+class ImportCost:
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass(slots=True)
+class ImportReport:
+    solution: Solution
+    # Median wall time of a fresh interpreter that loads the solution, and of one
+    # that loads an empty file the same way.
+    startup: float = 0.0
+    bare: float = 0.0
+    # The modules that the solution imports itself, slowest first. Their imports
+    # are included in their cumulative times.
+    imports: list[ImportCost] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def overhead(self) -> float:
+        return max(0.0, self.startup - self.bare)
+
+
+def _load(path: Path, importtime: bool = False) -> tuple[float, str]:
+    args = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", _LOADER, str(path)]
+    # Solutions import their shared code from the aoc package.
+    paths = [str(ROOT), *filter(None, [os.environ.get("PYTHONPATH")])]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(paths)}
+    start = time.perf_counter()
+    proc = subprocess.run(args, capture_output=True, text=True, cwd=path.parent, env=env)
+    seconds = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return seconds, proc.stderr
+
+
+def parse_importtime(stderr: str) -> list[ImportCost]:
+    """The top level imports in `-X importtime` output after the marker line."""
+    _, found, lines = stderr.partition(_MARKER)
+    costs: list[ImportCost] = []
+    for line in lines.splitlines() if found else ():
+        m = _IMPORT_TIME.match(line)
+        if m is not None and not m[3]:
+            costs.append(ImportCost(m[4], int(m[1]) / 1e6, int(m[2]) / 1e6))
+    return sorted(costs, key=lambda c: c.cumulative_seconds, reverse=True)
+
+
+def bare_startup(repeat: int = 5) -> float:
+    """Median wall time of an interpreter that loads an empty solution."""
+    with tempfile.TemporaryDirectory(prefix="aoc-imports-") as tmp:
+        empty = Path(tmp) / "solution.py"
+        empty.touch()
+        return statistics.median(_load(empty)[0] for _ in range(repeat))
+
+
+def measure_imports(solution: Solution, bare: float, repeat: int = 5) -> ImportReport:
+    """Times `repeat` fresh interpreters that load `solution`, and breaks the cost of
+    its imports down with one more run under `-X importtime`.
+
+    Modules that the interpreter imports at startup anyway (through `site`, say)
+    cost the solution nothing and do not show up.
+    """
+    report = ImportReport(solution, bare=bare)
+    report.startup = statistics.median(_load(solution.path)[0] for _ in range(repeat))
+    report.imports = parse_importtime(_load(solution.path, importtime=True)[1])
+    return report
+
+
+def format_import_reports(reports: list[ImportReport], top: int = 3) -> str:
+    header = ("solution", "startup", "over bare", "imports", "slowest imports")
+    rows: list[tuple[str, ...]] = []
+    for report in reports:
+        name = report.solution.name
+        if report.error is not None:
+            rows.append((name, "error", report.error))
+            continue
+        slowest = ", ".join(
+            f"{c.module} {format_seconds(c.cumulative_seconds)}" for c in report.imports[:top]
+        )
+        rows.append(
+            (
+                name,
+                format_seconds(report.startup),
+                format_seconds(report.overhead),
+                format_seconds(sum(c.cumulative_seconds for c in report.imports)),
+                slowest,
+            )
+        )
+
+    # Error messages span the measurement columns, so they do not widen them.
+    full_rows = [row for row in [header, *rows] if len(row) == len(header)]
+    widths = [max(len(row[i]) for row in full_rows) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(w) if i in (0, len(header) - 1) or len(row) < len(header) else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in [header, *rows]
+    ]
+    return "\n".join(lines)
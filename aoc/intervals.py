@@ -0,0 +1,158 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from heapq import merge
+from typing import Self
+
+# A half-open interval of integers, [start, stop).
+type Interval = tuple[int, int]
+
+
+class IntervalSet:
+    """A set of integers, stored as sorted, disjoint and non-adjacent intervals
+    in two parallel lists, so that lookups are binary searches.
+
+    Finding an integer, the intervals that a new one overlaps, or where to
+    split, takes O(log n). Adding an interval then replaces the ones that it
+    overlaps with a slice assignment, which shifts the rest of the lists in one
+    memmove. That is O(n), if a fast one, so sets of much more than 10^5
+    intervals are best built in bulk, with `from_intervals` or `|`. Two sets
+    combine in one merge of their sorted lists.
+    """
+
+    __slots__ = ["starts", "stops"]
+
+    def __init__(self) -> None:
+        self.starts: list[int] = []
+        self.stops: list[int] = []
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval]) -> Self:
+        """The union of the intervals, which are sorted and merged in one pass, for
+        O(n log n) overall."""
+        return cls._from_sorted(sorted(intervals))
+
+    @classmethod
+    def _from_sorted(cls, intervals: Iterable[Interval]) -> Self:
+        res = cls()
+        starts, stops = res.starts, res.stops
+        for start, stop in intervals:
+            if start >= stop:
+                continue
+            if stops and start <= stops[-1]:
+                stops[-1] = max(stops[-1], stop)
+            else:
+                starts.append(start)
+                stops.append(stop)
+        return res
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts, self.stops)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.from_intervals({list(self)})"
+
+    def __contains__(self, x: int) -> bool:
+        i = bisect_right(self.starts, x) - 1
+        return i >= 0 and x < self.stops[i]
+
+    def size(self) -> int:
+        """The number of integers in the set."""
+        return sum(self.stops) - sum(self.starts)
+
+    def min(self) -> int:
+        return self.starts[0]
+
+    def add(self, start: int, stop: int) -> None:
+        """Adds the interval [start, stop), merging it with the intervals that it
+        overlaps or touches."""
+        if start >= stop:
+            return
+        starts, stops = self.starts, self.stops
+        # The intervals from i to j - 1 overlap or touch the new one.
+        i = bisect_left(stops, start)
+        j = bisect_right(starts, stop)
+        if i < j:
+            start = min(start, starts[i])
+            stop = max(stop, stops[j - 1])
+        starts[i:j] = [start]
+        stops[i:j] = [stop]
+
+    def split(self, at: int) -> tuple[Self, Self]:
+        """The integers below `at`, and those from `at` up."""
+        starts, stops = self.starts, self.stops
+        # The intervals before k are all below `at`, and interval k may straddle it.
+        k = bisect_right(stops, at)
+        below, above = type(self)(), type(self)()
+        below.starts, below.stops = starts[:k], stops[:k]
+        above.starts, above.stops = starts[k:], stops[k:]
+        if k < len(starts) and starts[k] < at:
+            below.starts.append(starts[k])
+            below.stops.append(at)
+            above.starts[0] = at
+        return below, above
+
+    def __or__(self, other: Self) -> Self:
+        return self._from_sorted(merge(self, other))
+
+    def __and__(self, other: Self) -> Self:
+        res = type(self)()
+        a, b = list(self), list(other)
+        i = j = 0
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            stop = min(a[i][1], b[j][1])
+            if start < stop:
+                res.starts.append(start)
+                res.stops.append(stop)
+            # Whichever interval stops first overlaps nothing further along.
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return res
+
+
+class ShiftMap:
+    """A piecewise shift of the integers: each source interval moves by its offset,
+    and everything outside the source intervals stays where it is."""
+
+    __slots__ = ["starts", "stops", "offsets"]
+
+    def __init__(self, pieces: Iterable[tuple[Interval, int]]) -> None:
+        ordered = sorted(pieces)
+        self.starts = [start for (start, _), _ in ordered]
+        self.stops = [stop for (_, stop), _ in ordered]
+        self.offsets = [offset for _, offset in ordered]
+
+    def __call__(self, x: int) -> int:
+        i = bisect_right(self.starts, x) - 1
+        if i >= 0 and x < self.stops[i]:
+            return x + self.offsets[i]
+        return x
+
+    def map_intervals(self, intervals: IntervalSet) -> IntervalSet:
+        """Maps every interval in one sweep over both sorted lists, cutting the
+        intervals wherever a source interval starts or stops."""
+        res: list[Interval] = []
+        starts, stops, offsets = self.starts, self.stops, self.offsets
+        i = 0
+        for start, stop in intervals:
+            # Skip the source intervals that end before this interval starts.
+            while i < len(starts) and stops[i] <= start:
+                i += 1
+            j = i
+            while start < stop:
+                if j == len(starts) or stop <= starts[j]:
+                    res.append((start, stop))
+                    break
+                if start < starts[j]:
+                    res.append((start, starts[j]))
+                    start = starts[j]
+                cut = min(stop, stops[j])
+                res.append((start + offsets[j], cut + offsets[j]))
+                start = cut
+                j += 1
+        return IntervalSet.from_intervals(res)
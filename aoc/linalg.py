@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+type Vector = list[int]
+type IntArray = npt.NDArray[np.int64] | npt.NDArray[np.object_]
+
+INT64_MAX = 2**63 - 1
+
+
+def bareiss_solve(a: list[list[int]], b: Vector) -> tuple[Vector, int] | None:
+    """Solves the square system `a x = b` exactly, or returns None if `a` is singular.
+
+    Fraction-free (Bareiss) elimination keeps every entry an integer minor of
+    the augmented matrix, so the entries stay as small as they can and each
+    division is exact. The solution is returned as integer numerators over a
+    common denominator, the determinant of `a` up to sign, i.e. by Cramer's rule.
+    """
+    n = len(a)
+    m = [[*row, bi] for row, bi in zip(a, b, strict=True)]
+    prev = 1
+    for k in range(n):
+        pivot = next((i for i in range(k, n) if m[i][k] != 0), None)
+        if pivot is None:
+            return None
+        m[k], m[pivot] = m[pivot], m[k]
+        mk = m[k]
+        for i in range(k + 1, n):
+            mi = m[i]
+            for j in range(k + 1, n + 1):
+                mi[j] = (mi[j] * mk[k] - mi[k] * mk[j]) // prev
+            mi[k] = 0
+        prev = mk[k]
+
+    # Back substitution on det * x, which is an integer vector, so the
+    # divisions are exact as well.
+    det = prev
+    sol = [0] * n
+    for i in reversed(range(n)):
+        rest = det * m[i][n] - sum(m[i][j] * sol[j] for j in range(i + 1, n))
+        sol[i] = rest // m[i][i]
+    return sol, det
+
+
+def solve_2x2(
+    a11: IntArray, a12: IntArray, a21: IntArray, a22: IntArray, b1: IntArray, b2: IntArray
+) -> tuple[IntArray, IntArray, IntArray]:
+    """Cramer's rule over arrays of 2x2 systems, one system per index.
+
+    Returns `det`, `det1` and `det2`, so that a system with a nonzero `det` has the
+    solution `x1 = det1 / det`, `x2 = det2 / det`. The products are taken in int64
+    when they cannot overflow, and in Python ints (object arrays) otherwise.
+    """
+    import numpy as np
+
+    columns = (a11, a12, a21, a22, b1, b2)
+    a_max, b_max = (
+        max((int(np.abs(c).max()) for c in cs if c.size), default=0)
+        for cs in (columns[:4], columns[4:])
+    )
+    if 2 * a_max * max(a_max, b_max) > INT64_MAX:
+        a11, a12, a21, a22, b1, b2 = (c.astype(object) for c in columns)
+    det = a11 * a22 - a12 * a21
+    det1 = b1 * a22 - a12 * b2
+    det2 = a11 * b2 - b1 * a21
+    return det, det1, det2
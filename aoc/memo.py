@@ -0,0 +1,123 @@
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Literal, Protocol, cast
+
+# How long the entries of a memoized function hold: for the input being solved,
+# or for every input that the process solves.
+type Scope = Literal["input", "process"]
+
+
+class Memoized[**P, R](Protocol):
+    """A function memoized by `memoize`, called with the same arguments."""
+
+    cache_scope: Scope
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R: ...
+
+    def cache_info(self) -> functools._CacheInfo: ...
+
+    def cache_clear(self) -> None: ...
+
+
+def memoize[**P, R](
+    maxsize: int | None, scope: Scope = "input"
+) -> Callable[[Callable[P, R]], Memoized[P, R]]:
+    """Memoizes a function in a `functools.lru_cache` of at most `maxsize` entries,
+    tagged with the `scope` of its entries.
+
+    The cache evicts the least recently used entry when it is full, and keeps
+    the hits, misses and size that `cache_stats` reports. Batches empty caches
+    scoped to an input before each input, and leave those scoped to the process,
+    whose entries do not depend on the input, to carry over.
+    """
+
+    def decorate(fn: Callable[P, R]) -> Memoized[P, R]:
+        # The wrapper takes whatever hashes; its arguments are still those of `fn`.
+        wrapper = cast(Memoized[P, R], functools.lru_cache(maxsize)(fn))
+        wrapper.cache_scope = scope
+        return wrapper
+
+    return decorate
+
+
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    name: str
+    hits: int
+    misses: int
+    size: int
+    maxsize: int | None
+    # None for a plain `functools` cache, which has no scope.
+    scope: Scope | None = None
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+def module_caches(module: ModuleType) -> dict[str, Callable[..., Any]]:
+    """The memoized functions defined in `module`, i.e. its `memoize`,
+    `functools.cache` and `functools.lru_cache` wrappers, by name."""
+    return {
+        name: obj
+        for name, obj in vars(module).items()
+        if callable(obj)
+        and hasattr(obj, "cache_info")
+        and hasattr(obj, "cache_clear")
+        and getattr(obj, "__module__", None) == module.__name__
+    }
+
+
+def cache_stats(module: ModuleType) -> list[CacheStats]:
+    stats: list[CacheStats] = []
+    for name, fn in module_caches(module).items():
+        info = fn.cache_info()  # type: ignore[attr-defined]
+        scope = getattr(fn, "cache_scope", None)
+        stats.append(CacheStats(name, info.hits, info.misses, info.currsize, info.maxsize, scope))
+    return stats
+
+
+def clear_caches(module: ModuleType, scope: Scope | None = None) -> None:
+    """Empties the memoized functions of `module`, or only those of `scope`.
+
+    A module that is reused for another input should have its caches scoped to
+    an input cleared first, so that they hold at most one input's entries.
+    """
+    for fn in module_caches(module).values():
+        if scope is None or getattr(fn, "cache_scope", None) == scope:
+            fn.cache_clear()  # type: ignore[attr-defined]
+
+
+def format_cache_stats(solution_stats: list[tuple[str, list[CacheStats]]]) -> str:
+    header = ("solution", "cache", "scope", "hits", "misses", "hit rate", "size", "max size")
+    rows: list[tuple[str, ...]] = []
+    for name, stats in solution_stats:
+        for s in stats:
+            rows.append(
+                (
+                    name,
+                    s.name,
+                    s.scope or "-",
+                    str(s.hits),
+                    str(s.misses),
+                    f"{s.hit_rate:.1%}",
+                    str(s.size),
+                    "unbounded" if s.maxsize is None else str(s.maxsize),
+                )
+            )
+            name = ""
+    if not rows:
+        return "no memoized functions"
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(w) if i in (0, 1, 2) else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in [header, *rows]
+    ]
+    return "\n".join(lines)
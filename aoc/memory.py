@@ -0,0 +1,171 @@
+import contextlib
+import io
+import re
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from aoc.profiling import cpu_timer
+from aoc.solutions import ROOT, Solution, iter_parts
+from aoc.timing import READ_INPUT, format_bytes
+
+_SIZE_PATTERN = re.compile(r"(?P<number>\d+(?:\.\d+)?)\s*(?P<unit>[KMGT]?)(?:i?B)?", re.IGNORECASE)
+_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(text: str) -> int:
+    """Parses a size such as `800000`, `512M`, `512MiB` or `1.5G`, in powers of 1024."""
+    m = _SIZE_PATTERN.fullmatch(text.strip())
+    if m is None:
+        raise ValueError(f"invalid size: {text!r}")
+    return int(float(m["number"]) * _UNITS[m["unit"].upper()])
+
+
+class MemoryBudgetExceeded(Exception):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class LineAllocations:
+    file: str
+    line: int
+    size: int
+    count: int
+
+
+@dataclass(slots=True)
+class StepMemory:
+    peak: int = 0
+    # Live memory blocks when the top lines were recorded, near the peak.
+    blocks: int = 0
+    top: list[LineAllocations] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class MemoryReport:
+    solution: Solution
+    steps: dict[str, StepMemory] = field(default_factory=dict)
+    error: str | None = None
+
+
+class _PeakWatcher:
+    """Keeps a snapshot of the traced allocations from close to their peak.
+
+    Polls on a CPU timer. A new snapshot is only taken once memory has grown by
+    `growth` since the last one, since snapshots take time in proportion to the
+    number of live blocks.
+    """
+
+    def __init__(self, budget: int | None, interval: float, growth: float) -> None:
+        self.budget = budget
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+        self.polling = False
+
+    def poll(self, signum: int = 0, frame: FrameType | None = None) -> None:
+        # A snapshot can take longer than the interval, and the timer keeps firing.
+        if self.polling:
+            return
+        self.polling = True
+        try:
+            current, _ = tracemalloc.get_traced_memory()
+            if self.budget is not None and current > self.budget:
+                raise MemoryBudgetExceeded(
+                    f"{format_bytes(current)} allocated, "
+                    f"over the budget of {format_bytes(self.budget)}"
+                )
+            if current > self.snapshot_size * self.growth:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+        finally:
+            self.polling = False
+
+    def measure(self, fn: Callable[..., Any], *args: Any) -> tuple[Any, int]:
+        tracemalloc.reset_peak()
+        self.snapshot = None
+        self.snapshot_size = 0
+        with cpu_timer(self.interval, self.poll):
+            result = fn(*args)
+        # Steps too quick for the timer still get a snapshot, of what they return.
+        self.poll()
+        peak = tracemalloc.get_traced_memory()[1]
+        if self.budget is not None and peak > self.budget:
+            raise MemoryBudgetExceeded(
+                f"peak of {format_bytes(peak)}, over the budget of {format_bytes(self.budget)}"
+            )
+        return result, peak
+
+
+def _top_lines(snapshot: tracemalloc.Snapshot, limit: int) -> tuple[int, list[LineAllocations]]:
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+    )
+    stats = snapshot.statistics("lineno")
+    top: list[LineAllocations] = []
+    for stat in stats[:limit]:
+        frame = stat.traceback[0]
+        path = Path(frame.filename)
+        if path.is_relative_to(ROOT):
+            path = path.relative_to(ROOT)
+        top.append(LineAllocations(path.as_posix(), frame.lineno, stat.size, stat.count))
+    return sum(stat.count for stat in stats), top
+
+
+def measure_memory(
+    solution: Solution,
+    path: Path,
+    budget: int | None = None,
+    top: int = 5,
+    interval: float = 0.01,
+) -> MemoryReport:
+    """Traces the allocations of `read_input` and every part of `solution`.
+
+    Each step gets its peak traced memory and the lines that held the most memory
+    near that peak. With a `budget` in bytes, a step that allocates more than
+    that raises `MemoryBudgetExceeded`, as soon as the next timer tick sees it.
+    """
+    report = MemoryReport(solution)
+    module = solution.load()
+    watcher = _PeakWatcher(budget, interval, growth=1.1)
+
+    def step(name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        result, peak = watcher.measure(fn, *args)
+        blocks, lines = _top_lines(watcher.snapshot, top) if watcher.snapshot else (0, [])
+        report.steps[name] = StepMemory(peak, blocks, lines)
+        return result
+
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = step(READ_INPUT, module.read_input, str(path))
+            for name, part in iter_parts(module):
+                step(name, part, data)
+    finally:
+        tracemalloc.stop()
+    return report
+
+
+def format_memory_reports(reports: list[MemoryReport]) -> str:
+    lines: list[str] = []
+    for report in reports:
+        if report.error is not None:
+            lines.append(f"{report.solution.name}  error  {report.error}")
+            continue
+        lines.append(report.solution.name)
+        for name, step in report.steps.items():
+            lines.append(
+                f"  {name:<10}  peak {format_bytes(step.peak):>10}  {step.blocks:>9} blocks"
+            )
+            for line in step.top:
+                lines.append(
+                    f"    {format_bytes(line.size):>10}  {line.count:>9} blocks  {line.file}:{line.line}"
+                )
+    return "\n".join(lines)
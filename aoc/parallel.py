@@ -0,0 +1,52 @@
+import multiprocessing
+import os
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+# Workers for `parallel_map`: unset or 1 runs serially, 0 uses one per core.
+PARALLEL_ENV = "AOC_PARALLEL"
+
+
+def parallel_workers() -> int:
+    n = int(os.environ.get(PARALLEL_ENV, "1"))
+    return n if n > 0 else os.cpu_count() or 1
+
+
+def free_threaded() -> bool:
+    """Whether this is a free-threaded build running with the GIL disabled."""
+    is_gil_enabled: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+    return not is_gil_enabled()
+
+
+def _executor(workers: int) -> Executor:
+    if free_threaded():
+        return ThreadPoolExecutor(workers)
+    # Forked workers inherit the solution module, which the runner loads under
+    # a name that a freshly started interpreter could not import.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+    return ProcessPoolExecutor(workers)
+
+
+def parallel_map[R](fn: Callable[..., R], *iterables: Iterable[Any]) -> list[R]:
+    """Like `map`, but spread over `AOC_PARALLEL` workers when that is set.
+
+    Threads share the work on free-threaded builds and processes do otherwise,
+    in which case `fn` and the items must pickle, and `fn` must be a module
+    level function or a `functools.partial` of one. Without a pool, such as on
+    platforms whose multiprocessing lacks working semaphores, it is `map`.
+    """
+    columns = [list(it) for it in iterables]
+    n = min(map(len, columns), default=0)
+    workers = min(parallel_workers(), n)
+    if workers <= 1:
+        return list(map(fn, *columns))
+    try:
+        executor = _executor(workers)
+    except (ImportError, NotImplementedError, OSError):
+        return list(map(fn, *columns))
+    with executor as pool:
+        # Processes pay for pickling per task, so hand them a few big chunks.
+        return list(pool.map(fn, *columns, chunksize=max(1, n // (4 * workers))))
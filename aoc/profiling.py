@@ -0,0 +1,181 @@
+import cProfile
+import contextlib
+import io
+import json
+import pstats
+import signal
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from aoc.solutions import ROOT, Solution, iter_parts
+from aoc.timing import READ_INPUT
+
+FORMATS = ("collapsed", "speedscope")
+
+# Function name, file and first line of a code object.
+type Frame = tuple[str, str, int]
+type Stack = tuple[Frame, ...]
+
+
+def _frame_key(frame: FrameType) -> Frame:
+    code = frame.f_code
+    path = Path(code.co_filename)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    return code.co_qualname, path.as_posix(), code.co_firstlineno
+
+
+@dataclass(slots=True)
+class StackSamples:
+    """Call stacks seen by the sampler, root first, with how often each was seen."""
+
+    interval: float
+    counts: Counter[Stack] = field(default_factory=Counter)
+
+    def to_collapsed(self) -> str:
+        """The folded format of Brendan Gregg's flamegraph.pl and most flamegraph tools."""
+        lines = [
+            ";".join(f"{name} ({file}:{line})" for name, file, line in stack) + f" {count}"
+            for stack, count in sorted(self.counts.items())
+        ]
+        return "".join(line + "\n" for line in lines)
+
+    def to_speedscope(self, name: str) -> dict[str, Any]:
+        """A sampled profile in speedscope's file format, https://www.speedscope.app."""
+        index: dict[Frame, int] = {}
+        samples: list[list[int]] = []
+        weights: list[float] = []
+        for stack, count in self.counts.items():
+            samples.append([index.setdefault(frame, len(index)) for frame in stack])
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {
+                "frames": [
+                    {"name": function, "file": file, "line": line}
+                    for function, file, line in index
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+            "name": name,
+            "exporter": "python -m aoc profile",
+        }
+
+
+type TimerHandler = Callable[[int, FrameType | None], None]
+
+
+@contextlib.contextmanager
+def cpu_timer(interval: float, handler: TimerHandler) -> Iterator[None]:
+    """Calls `handler` with the interrupted frame every `interval` seconds of CPU time.
+
+    Uses a profiling interval timer, so it needs a Unix system and must run on
+    the main thread.
+    """
+    if not hasattr(signal, "setitimer"):
+        raise RuntimeError("CPU timers need signal.setitimer, which is Unix only")
+    previous = signal.signal(signal.SIGPROF, handler)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+
+
+@contextlib.contextmanager
+def sample_stacks(interval: float) -> Iterator[StackSamples]:
+    """Samples the main thread's call stack every `interval` seconds of CPU time.
+
+    Frames of the caller and above are left out of the stacks.
+    """
+    result = StackSamples(interval)
+    # The frame with the `with` statement; 0 is this generator, 1 is contextlib.
+    caller = sys._getframe(2)
+
+    def handler(signum: int, frame: FrameType | None) -> None:
+        stack: list[Frame] = []
+        while frame is not None and frame is not caller:
+            stack.append(_frame_key(frame))
+            frame = frame.f_back
+        if stack:
+            result.counts[tuple(reversed(stack))] += 1
+
+    with cpu_timer(interval, handler):
+        yield result
+
+
+@dataclass(slots=True)
+class StepProfile:
+    stats: pstats.Stats
+    samples: StackSamples
+
+
+def profile_solution(
+    solution: Solution, path: Path, interval: float = 0.001
+) -> dict[str, StepProfile]:
+    """Profiles `read_input` and every part once with cProfile and once with the
+    stack sampler. The two are separate runs, so that the sampler does not see
+    cProfile's overhead."""
+    module = solution.load()
+    profiles: dict[str, StepProfile] = {}
+
+    def profile_step(name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        profiler = cProfile.Profile()
+        result = profiler.runcall(fn, *args)
+        with sample_stacks(interval) as samples:
+            fn(*args)
+        profiles[name] = StepProfile(pstats.Stats(profiler), samples)
+        return result
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = profile_step(READ_INPUT, module.read_input, str(path))
+        for name, part in iter_parts(module):
+            profile_step(name, part, data)
+    return profiles
+
+
+def write_profiles(
+    solution: Solution, profiles: dict[str, StepProfile], directory: Path, fmt: str
+) -> list[Path]:
+    """Writes a pstats file and a sampled profile in format `fmt` for every step."""
+    directory.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for step, profile in profiles.items():
+        stem = f"{solution.year}_day_{solution.day:02d}.{step}"
+        stats_path = directory / f"{stem}.prof"
+        profile.stats.dump_stats(stats_path)
+        if fmt == "collapsed":
+            samples_path = directory / f"{stem}.collapsed"
+            samples_path.write_text(profile.samples.to_collapsed())
+        else:
+            samples_path = directory / f"{stem}.speedscope.json"
+            with open(samples_path, "w") as f:
+                json.dump(profile.samples.to_speedscope(f"{solution.name} {step}"), f)
+        written += [stats_path, samples_path]
+    return written
+
+
+def format_top(stats: pstats.Stats, sort: str, limit: int) -> str:
+    stream = io.StringIO()
+    stats.stream = stream  # type: ignore[attr-defined]
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    # Skip pstats' preamble, which repeats the totals and the sort order.
+    lines = stream.getvalue().splitlines()
+    start = next((i for i, line in enumerate(lines) if "ncalls" in line), 0)
+    return "\n".join(line for line in lines[start:] if line.strip())
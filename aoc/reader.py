@@ -0,0 +1,73 @@
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from mmap import ACCESS_READ, mmap
+
+# What `mapped` yields: a memory map, or empty bytes for an empty file. Both
+# support `find`, `len`, slicing, regular expressions and `memoryview`.
+type Buffer = bytes | mmap
+
+# The size that `iter_chunks` aims for, which bounds the memory that a chunk
+# keeps paged in at once.
+CHUNK_SIZE = 1 << 20
+
+
+@contextmanager
+def mapped(path: str | os.PathLike[str]) -> Iterator[Buffer]:
+    """Maps the file at `path` into memory, read-only, for the duration of the block.
+
+    An empty file cannot be mapped and gives `b""` instead. The map is closed
+    when the block exits, which fails with a BufferError if a view of it is
+    still alive, so views taken inside the block must not leave it.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap(f.fileno(), 0, access=ACCESS_READ) as data:
+            yield data
+
+
+def iter_chunks(data: Buffer, sep: bytes = b"\n", size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+    """Zero-copy views of consecutive chunks of `data` of about `size` bytes.
+
+    Every chunk but the last ends right after a `sep`, so nothing that does not
+    span a `sep` is split between two chunks. A chunk grows past `size` when it
+    has to, to the next `sep`. Each view is released when the next one is
+    taken, so it must not be used, nor a regular expression match in it be
+    kept, after that.
+    """
+    with memoryview(data) as view:
+        n = len(view)
+        start = 0
+        while start < n:
+            end = start + size
+            if end < n:
+                cut = data.rfind(sep, start, end)
+                if cut == -1:
+                    cut = data.find(sep, end)
+                end = n if cut == -1 else cut + len(sep)
+            else:
+                end = n
+            with view[start:end] as chunk:
+                yield chunk
+            start = end
+
+
+def iter_lines(data: Buffer) -> Iterator[memoryview]:
+    """Zero-copy views of the lines of `data`, without their line breaks.
+
+    A last line without a line break is included, and a line break at the end
+    of `data` does not start another line. Each view is released when the next
+    one is taken, like those of `iter_chunks`.
+    """
+    with memoryview(data) as view:
+        n = len(view)
+        start = 0
+        while start < n:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = n
+            with view[start:end] as line:
+                yield line
+            start = end + 1
@@ -0,0 +1,158 @@
+import contextlib
+import io
+import json
+import math
+import statistics
+import tempfile
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.generators import InputGenerator
+from aoc.solutions import Solution, iter_parts
+from aoc.timing import READ_INPUT, format_bytes, format_seconds, run_once
+
+
+@dataclass(slots=True)
+class Point:
+    scale: int
+    input_bytes: int
+    seconds: dict[str, float] = field(default_factory=dict)
+    peak_bytes: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Curve:
+    solution: Solution
+    points: list[Point] = field(default_factory=list)
+    error: str | None = None
+
+    def steps(self) -> list[str]:
+        return list(self.points[0].seconds) if self.points else []
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "solution": self.solution.name,
+            "points": [asdict(point) for point in self.points],
+            "error": self.error,
+        }
+
+
+def exponent(x0: float, y0: float, x1: float, y1: float) -> float | None:
+    """Slope between two points of a log-log plot, i.e. `k` if `y` grows like `x**k`."""
+    if min(x0, y0, x1, y1) <= 0 or x0 == x1:
+        return None
+    return math.log(y1 / y0) / math.log(x1 / x0)
+
+
+def peak_memory(module: ModuleType, path: Path, parts: bool = True) -> dict[str, int]:
+    """Peak traced allocations of `read_input` and, unless `parts` is off, every
+    part, in bytes."""
+    peaks: dict[str, int] = {}
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracemalloc.reset_peak()
+            data = module.read_input(str(path))
+            peaks[READ_INPUT] = tracemalloc.get_traced_memory()[1]
+            for name, part in iter_parts(module) if parts else ():
+                tracemalloc.reset_peak()
+                part(data)
+                peaks[name] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def measure_scaling(
+    solution: Solution,
+    generate: InputGenerator,
+    scales: tuple[int, ...],
+    seed: int = 0,
+    repeat: int = 3,
+    memory: bool = True,
+    parse_only: bool = False,
+) -> Curve:
+    """Runs `solution` on generated inputs of increasing scale, or with
+    `parse_only`, just its `read_input`.
+
+    Every run uses a fresh module, so that caches do not carry over from one
+    input to the next. Peak memory is measured in a separate run, since tracing
+    allocations slows the solutions down several times over.
+    """
+    curve = Curve(solution)
+    with tempfile.TemporaryDirectory(prefix="aoc-scaling-") as tmp:
+        for scale in scales:
+            path = Path(tmp) / f"input_{scale}.txt"
+            path.write_text(generate(scale, seed))
+            point = Point(scale, path.stat().st_size)
+
+            runs = [run_once(solution.load(), path, not parse_only)[0] for _ in range(repeat)]
+            for step in runs[0]:
+                point.seconds[step] = statistics.median(run[step] for run in runs)
+            if memory:
+                point.peak_bytes = peak_memory(solution.load(), path, not parse_only)
+            curve.points.append(point)
+    return curve
+
+
+def write_json(curves: list[Curve], path: Path) -> None:
+    with open(path, "w") as f:
+        json.dump([curve.to_json() for curve in curves], f, indent=2)
+        f.write("\n")
+
+
+def format_exponent(k: float | None) -> str:
+    return "" if k is None else f"{k:.2f}"
+
+
+def format_curves(curves: list[Curve]) -> str:
+    """One row per step and scale, with the growth exponents against the previous scale."""
+    header = ("solution", "step", "scale", "input", "time", "time exp", "peak", "peak exp")
+    rows: list[tuple[str, ...]] = []
+    for curve in curves:
+        name = curve.solution.name
+        if curve.error is not None:
+            rows.append((name, "error", curve.error))
+            continue
+        for step in curve.steps():
+            label = step
+            previous: Point | None = None
+            for point in curve.points:
+                seconds = point.seconds[step]
+                peak = point.peak_bytes.get(step)
+                time_exp = peak_exp = None
+                if previous is not None:
+                    time_exp = exponent(previous.scale, previous.seconds[step], point.scale, seconds)
+                    if peak is not None:
+                        peak_exp = exponent(
+                            previous.scale, previous.peak_bytes[step], point.scale, peak
+                        )
+                rows.append(
+                    (
+                        name,
+                        label,
+                        f"{point.scale}x",
+                        format_bytes(point.input_bytes),
+                        format_seconds(seconds),
+                        format_exponent(time_exp),
+                        "" if peak is None else format_bytes(peak),
+                        format_exponent(peak_exp),
+                    )
+                )
+                name = label = ""
+                previous = point
+
+    # Error messages span the measurement columns, so they do not widen them.
+    full_rows = [row for row in [header, *rows] if len(row) == len(header)]
+    widths = [max(len(row[i]) for row in full_rows) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(w) if i in (0, 1) or len(row) < len(header) else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in [header, *rows]
+    ]
+    return "\n".join(lines)
@@ -0,0 +1,78 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+
+# Above any distance, and still a C int.
+UNREACHED = 2**31 - 1
+
+
+def bfs_levels(
+    sources: Iterable[int], expand: Callable[[list[int]], list[int]], seen: bytearray
+) -> Iterator[list[int]]:
+    """Breadth-first search over the states `0 <= state < len(seen)`.
+
+    Yields the states at each distance from `sources` in turn, starting with
+    the sources themselves, so that the distance is the number of lists
+    yielded before. The caller can stop at any distance by no longer iterating.
+
+    `expand` gives the states next to any of a whole level of states that are
+    not marked in `seen` yet, each once, and marks them. The loop over the
+    neighbours stays inline in the caller, where it can test and mark each
+    state in one pass, so the search costs a call per level and no more.
+    """
+    frontier: list[int] = []
+    for source in sources:
+        if not seen[source]:
+            seen[source] = 1
+            frontier.append(source)
+    while frontier:
+        yield frontier
+        frontier = expand(frontier)
+
+
+class BucketQueue:
+    """The queue of Dijkstra's algorithm over the states `0 <= state < n_states`,
+    for edges that weigh from 0 to `max_weight`.
+
+    States wait in buckets, one per distance, of which only `max_weight + 1`
+    can hold states at a time, so they are reused in turn. Iterating settles
+    the states in order of distance, and yields each with its distance, while
+    the caller relaxes the edges of each state inline and `push`es the states
+    whose distances it improves. With a `max_weight` of 1, that makes it a 0-1
+    breadth-first search.
+
+    `dist` holds the distance of every state from the nearest source, or
+    UNREACHED. The distances of the states that are not settled yet may be too
+    high.
+    """
+
+    __slots__ = ["dist", "buckets"]
+
+    def __init__(self, n_states: int, max_weight: int) -> None:
+        self.dist = array("i", [UNREACHED]) * n_states
+        self.buckets: list[list[int]] = [[] for _ in range(max_weight + 1)]
+
+    def push(self, state: int, dist: int) -> None:
+        """Queues `state` at `dist`, which must be below its distance so far, and
+        within `max_weight` of the distance last settled."""
+        self.dist[state] = dist
+        self.buckets[dist % len(self.buckets)].append(state)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        dist, buckets = self.dist, self.buckets
+        n_buckets = len(buckets)
+        cost = 0
+        # Every state waits at most `max_weight` past the distance last settled,
+        # so once that many buckets and one more are empty in a row, all are.
+        n_empty = 0
+        while n_empty < n_buckets:
+            bucket = buckets[cost % n_buckets]
+            if bucket:
+                n_empty = 0
+                # Edges that weigh 0 add to the bucket while it is being emptied.
+                while bucket:
+                    state = bucket.pop()
+                    if dist[state] == cost:
+                        yield cost, state
+            else:
+                n_empty += 1
+            cost += 1
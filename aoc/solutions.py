@@ -0,0 +1,93 @@
+import importlib.util
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+PART_NAMES = ("part_1", "part_2")
+
+type Part = Callable[[Any], Any]
+
+_SOLUTION_PATTERN = re.compile(r"(?P<year>\d{4})/day_(?P<day>\d{2})/solution\.py")
+
+
+@dataclass(slots=True, frozen=True, order=True)
+class Solution:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day_{self.day:02d}"
+
+    @property
+    def directory(self) -> Path:
+        return self.path.parent
+
+    def load(self) -> ModuleType:
+        """Executes the solution's source into a fresh module object.
+
+        Each call returns a new module, so module level caches and tables start
+        empty again.
+        """
+        module_name = f"aoc_{self.year}_day_{self.day:02d}"
+        spec = importlib.util.spec_from_file_location(module_name, self.path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load {self.path}")
+        module = importlib.util.module_from_spec(spec)
+        # dataclasses resolve string annotations through sys.modules.
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        return module
+
+
+def _normalize_selector(selector: str) -> str:
+    selector = selector.strip().rstrip("/")
+    selector = selector.removesuffix("/solution.py")
+    return selector.removeprefix("./")
+
+
+def matches(solution: Solution, selector: str) -> bool:
+    selector = _normalize_selector(selector)
+    return (
+        solution.name == selector
+        or solution.name.startswith(selector + "/")
+        or fnmatch(solution.name, selector)
+    )
+
+
+def discover(selectors: Iterable[str] = (), root: Path = ROOT) -> list[Solution]:
+    selectors = list(selectors)
+    solutions: list[Solution] = []
+    for path in root.glob("*/day_*/solution.py"):
+        m = _SOLUTION_PATTERN.fullmatch(path.relative_to(root).as_posix())
+        if m is None:
+            continue
+        solution = Solution(int(m["year"]), int(m["day"]), path)
+        if not selectors or any(matches(solution, s) for s in selectors):
+            solutions.append(solution)
+    return sorted(solutions)
+
+
+def iter_parts(module: ModuleType) -> Iterator[tuple[str, Part]]:
+    for name in PART_NAMES:
+        part = getattr(module, name, None)
+        if part is not None:
+            yield name, part
+
+
+def input_path(solution: Solution, template: str) -> Path:
+    """Resolves an input path template such as `input.txt` or `~/aoc/{year}/{day:02d}.txt`.
+
+    Relative paths are taken relative to the solution's directory.
+    """
+    path = Path(template.format(year=solution.year, day=solution.day)).expanduser()
+    if path.is_absolute():
+        return path
+    return solution.directory / path
@@ -0,0 +1,195 @@
+import contextlib
+import io
+import math
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.memo import CacheStats, cache_stats
+from aoc.solutions import Solution, iter_parts
+
+READ_INPUT = "read_input"
+
+
+def timed[T](fn: Callable[..., T], *args: Any) -> tuple[T, float]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile, with `q` in [0, 100]."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass(slots=True)
+class Samples:
+    cold: list[float] = field(default_factory=list)
+    warm: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "cold_median": statistics.median(self.cold),
+            "cold_p95": percentile(self.cold, 95),
+            "warm_median": statistics.median(self.warm),
+            "warm_p95": percentile(self.warm, 95),
+        }
+
+
+@dataclass(slots=True)
+class Report:
+    solution: Solution
+    steps: dict[str, Samples] = field(default_factory=lambda: defaultdict(Samples))
+    answers: dict[str, Any] = field(default_factory=dict)
+    # Memoized functions after the first cold run.
+    caches: list[CacheStats] = field(default_factory=list)
+    error: str | None = None
+
+
+def run_once(
+    module: ModuleType, path: Path, parts: bool = True
+) -> tuple[dict[str, float], dict[str, Any]]:
+    """Times `read_input` and, unless `parts` is off, every part of `module` once
+    on the input at `path`."""
+    times: dict[str, float] = {}
+    answers: dict[str, Any] = {}
+    # Solutions print their own progress at times; keep it out of the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        data, times[READ_INPUT] = timed(module.read_input, str(path))
+        for name, part in iter_parts(module) if parts else ():
+            answers[name], times[name] = timed(part, data)
+    return times, answers
+
+
+def time_solution(
+    solution: Solution, path: Path, repeat: int, warmup: int = 1
+) -> Report:
+    """Collects `repeat` cold and `repeat` warm timings of each step.
+
+    A cold run re-executes the solution module first, so that module level
+    caches start empty. Warm runs share one module, after `warmup` untimed runs.
+    The statistics of the module's memoized functions are taken after the first
+    cold run, which is what a single run of the script would see.
+    """
+    report = Report(solution)
+
+    def record(times: dict[str, float], answers: dict[str, Any], kind: str) -> None:
+        if not report.answers:
+            report.answers = answers
+        elif answers != report.answers:
+            raise RuntimeError(f"answers changed between runs: {answers}")
+        for name, t in times.items():
+            getattr(report.steps[name], kind).append(t)
+
+    for i in range(repeat):
+        module = solution.load()
+        record(*run_once(module, path), "cold")
+        if i == 0:
+            report.caches = cache_stats(module)
+
+    module = solution.load()
+    for _ in range(warmup):
+        run_once(module, path)
+    for _ in range(repeat):
+        record(*run_once(module, path), "warm")
+
+    return report
+
+
+def try_time_solution(
+    solution: Solution, path: Path, repeat: int, warmup: int = 1
+) -> Report:
+    """Like `time_solution`, but reports an exception instead of raising it."""
+    try:
+        return time_solution(solution, path, repeat, warmup)
+    except Exception as e:
+        return Report(solution, error=f"{type(e).__name__}: {e}")
+
+
+def time_solutions(
+    jobs: Iterable[tuple[Solution, Path]],
+    repeat: int,
+    warmup: int = 1,
+    workers: int | None = 1,
+) -> Iterator[Report]:
+    """Times each solution on its input, yielding the reports as they complete.
+
+    With more than one worker, solutions run in parallel in a process pool, one
+    process per core if `workers` is None. The timings are then only comparable
+    with each other if the machine has cores to spare.
+    """
+    if workers == 1:
+        for solution, path in jobs:
+            yield try_time_solution(solution, path, repeat, warmup)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(try_time_solution, solution, path, repeat, warmup)
+            for solution, path in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GiB"
+
+
+def format_answer(answer: Any, width: int = 40) -> str:
+    s = str(answer).replace("\n", "⏎")
+    return s if len(s) <= width else s[: width - 1] + "…"
+
+
+def format_reports(reports: list[Report]) -> str:
+    header = ("solution", "step", "cold median", "cold p95", "warm median", "warm p95", "answer")
+    rows: list[tuple[str, ...]] = []
+    for report in reports:
+        name = report.solution.name
+        if report.error is not None:
+            rows.append((name, "error", "", "", "", "", report.error))
+            continue
+        for step, samples in report.steps.items():
+            summary = samples.summary()
+            rows.append(
+                (
+                    name,
+                    step,
+                    format_seconds(summary["cold_median"]),
+                    format_seconds(summary["cold_p95"]),
+                    format_seconds(summary["warm_median"]),
+                    format_seconds(summary["warm_p95"]),
+                    format_answer(report.answers.get(step, "")),
+                )
+            )
+            name = ""
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(w) if i in (0, 1, len(row) - 1) else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in [header, *rows]
+    ]
+    return "\n".join(lines)
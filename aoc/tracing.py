@@ -0,0 +1,237 @@
+import contextlib
+import io
+import re
+import sys
+import time
+import tokenize
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from aoc.solutions import Solution, iter_parts
+from aoc.timing import READ_INPUT
+
+# A free tool id; debuggers, coverage and cProfile hold 0, 1 and 2.
+TOOL_ID = 3
+# `# trace: nodes` counts how often its line runs, and `# trace: nodes, max len(stack)`
+# also keeps the largest length of the local `stack` seen there. A bare `# trace`
+# on the first line of a function only times it, like every function that holds
+# a counter.
+_MARKER = re.compile(r"#\s*trace(?::\s*(\w+)(?:\s*,\s*max len\((\w+)\))?)?\s*$")
+
+_EVENTS = sys.monitoring.events
+
+
+@dataclass(slots=True, frozen=True)
+class Marker:
+    counter: str | None
+    local: str | None
+
+
+@dataclass(slots=True)
+class FunctionTrace:
+    calls: int = 0
+    # The deepest recursion, counting the activations of the function that are
+    # on the stack at once.
+    max_depth: int = 0
+    # Time spent in the outermost activations, including whatever they call.
+    seconds: float = 0.0
+
+    def to_json(self) -> dict[str, Any]:
+        return {"calls": self.calls, "max_depth": self.max_depth, "seconds": self.seconds}
+
+
+@dataclass(slots=True)
+class StepTrace:
+    seconds: float = 0.0
+    counters: dict[str, int] = field(default_factory=dict)
+    maxima: dict[str, int] = field(default_factory=dict)
+    functions: dict[str, FunctionTrace] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "seconds": self.seconds,
+            "counters": self.counters,
+            # Nodes per second and the like, slowed down by the tracer's own overhead.
+            "rates": {
+                name: count / self.seconds if self.seconds else None
+                for name, count in self.counters.items()
+            },
+            "maxima": self.maxima,
+            "functions": {name: f.to_json() for name, f in self.functions.items()},
+        }
+
+
+@dataclass(slots=True)
+class TraceReport:
+    solution: Solution
+    input: str
+    steps: dict[str, StepTrace] = field(default_factory=dict)
+    error: str | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "solution": self.solution.name,
+            "input": self.input,
+            "steps": {name: step.to_json() for name, step in self.steps.items()},
+            "error": self.error,
+        }
+
+
+def find_markers(path: Path) -> dict[int, Marker]:
+    """The trace markers in the comments of a source file, by line."""
+    markers: dict[int, Marker] = {}
+    with open(path, "rb") as f:
+        for token in tokenize.tokenize(f.readline):
+            if token.type == tokenize.COMMENT and (m := _MARKER.match(token.string)):
+                markers[token.start[0]] = Marker(m[1], m[2])
+    return markers
+
+
+class Tracer:
+    """Counts the marked lines of one source file and times the functions that
+    hold them, with `sys.monitoring`.
+
+    Events are on for every function while the tracer runs, and each callback
+    turns its event off for good at any location that it has no use for, so
+    that the rest of the program runs at almost full speed. Nothing is
+    monitored outside of `tracing`, and markers are comments, so solutions pay
+    nothing for them unless they are traced.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.filename = str(path)
+        self.markers = find_markers(path)
+        # The marked lines of every traced code object, or None for code that
+        # is not traced.
+        self._roles: dict[CodeType, dict[int, Marker] | None] = {}
+        self._depths: dict[CodeType, int] = {}
+        self._starts: dict[CodeType, float] = {}
+        self.step = StepTrace()
+
+    def _role(self, code: CodeType) -> dict[int, Marker] | None:
+        try:
+            return self._roles[code]
+        except KeyError:
+            pass
+        role = None
+        # Generator expressions share the lines of the function around them.
+        if code.co_filename == self.filename and not code.co_name.startswith("<"):
+            lines = {line for *_, line in code.co_lines() if line is not None}
+            counted = {
+                line: marker
+                for line, marker in self.markers.items()
+                if line in lines and line != code.co_firstlineno and marker.counter
+            }
+            first = self.markers.get(code.co_firstlineno)
+            if counted or (first is not None and first.counter is None):
+                role = counted
+        self._roles[code] = role
+        return role
+
+    def _enter(self, code: CodeType, offset: int, *_: Any) -> Any:
+        if self._role(code) is None:
+            return sys.monitoring.DISABLE
+        depth = self._depths.get(code, 0) + 1
+        self._depths[code] = depth
+        if depth == 1:
+            self._starts[code] = time.perf_counter()
+        trace = self._function(code)
+        trace.max_depth = max(trace.max_depth, depth)
+
+    def _start(self, code: CodeType, offset: int) -> Any:
+        if self._role(code) is not None:
+            self._function(code).calls += 1
+        return self._enter(code, offset)
+
+    def _throw(self, code: CodeType, offset: int, exception: BaseException) -> None:
+        # Unlike the other events, throws and unwinds cannot be disabled.
+        if self._role(code) is not None:
+            self._enter(code, offset)
+
+    def _leave(self, code: CodeType, offset: int, *_: Any) -> Any:
+        if self._role(code) is None:
+            return sys.monitoring.DISABLE
+        self._unwind(code)
+
+    def _unwind(self, code: CodeType, *_: Any) -> None:
+        depth = self._depths.get(code, 0)
+        if depth == 0 or self._role(code) is None:
+            return
+        self._depths[code] = depth - 1
+        if depth == 1:
+            self._function(code).seconds += time.perf_counter() - self._starts[code]
+
+    def _line(self, code: CodeType, line: int) -> Any:
+        role = self._role(code)
+        if role is None or line not in role:
+            return sys.monitoring.DISABLE
+        marker = role[line]
+        assert marker.counter is not None
+        step = self.step
+        step.counters[marker.counter] = step.counters.get(marker.counter, 0) + 1
+        if marker.local is not None:
+            # The frame that runs the line is the caller of this callback.
+            size = len(sys._getframe(1).f_locals[marker.local])
+            key = f"len({marker.local})"
+            step.maxima[key] = max(step.maxima.get(key, 0), size)
+
+    def _function(self, code: CodeType) -> FunctionTrace:
+        functions = self.step.functions
+        trace = functions.get(code.co_qualname)
+        if trace is None:
+            trace = functions[code.co_qualname] = FunctionTrace()
+        return trace
+
+    @contextlib.contextmanager
+    def tracing(self) -> Iterator[None]:
+        mon = sys.monitoring
+        mon.use_tool_id(TOOL_ID, "aoc trace")
+        try:
+            callbacks: list[tuple[int, Callable[..., Any]]] = [
+                (_EVENTS.PY_START, self._start),
+                (_EVENTS.PY_RESUME, self._enter),
+                (_EVENTS.PY_THROW, self._throw),
+                (_EVENTS.PY_RETURN, self._leave),
+                (_EVENTS.PY_YIELD, self._leave),
+                (_EVENTS.PY_UNWIND, self._unwind),
+                (_EVENTS.LINE, self._line),
+            ]
+            events = 0
+            for event, callback in callbacks:
+                mon.register_callback(TOOL_ID, event, callback)
+                events |= event
+            mon.set_events(TOOL_ID, events)
+            yield
+        finally:
+            mon.set_events(TOOL_ID, _EVENTS.NO_EVENTS)
+            for event, _ in callbacks:
+                mon.register_callback(TOOL_ID, event, None)
+            mon.free_tool_id(TOOL_ID)
+            # Give back the locations that callbacks disabled, to other tools too.
+            mon.restart_events()
+
+
+def trace_solution(solution: Solution, path: Path) -> TraceReport:
+    """Runs `read_input` and every part once under a `Tracer`, with the counters
+    and timings of each step kept apart. Step times include the tracer's own
+    overhead, so they are only good for comparing the steps of one trace."""
+    module = solution.load()
+    tracer = Tracer(solution.path)
+    report = TraceReport(solution, str(path))
+
+    def trace_step(name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        tracer.step = report.steps[name] = StepTrace()
+        start = time.perf_counter()
+        with tracer.tracing():
+            result = fn(*args)
+        tracer.step.seconds = time.perf_counter() - start
+        return result
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = trace_step(READ_INPUT, module.read_input, str(path))
+        for name, part in iter_parts(module):
+            trace_step(name, part, data)
+    return report